@@ -18,3 +18,4 @@ Module with horizon application, pages and custom ui.
 # limitations under the License.
 
 from .horizon import Horizon  # noqa
+from .pool import HorizonPool  # noqa
@@ -0,0 +1,59 @@
+"""
+Utils for horizon application.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def get_process_tree_rss(pid):
+    """Get resident memory of process and its descendants.
+
+    It reads linux procfs and returns 0 if it's unavailable.
+
+    Arguments:
+        - pid: int, id of root process.
+
+    Returns:
+        - int, bytes of resident memory.
+    """
+    if not os.path.isdir('/proc'):
+        return 0
+
+    children = {}
+    rss = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open('/proc/{}/stat'.format(name)) as f:
+                # command name in parentheses can contain spaces
+                fields = f.read().rsplit(')', 1)[1].split()
+        except (IOError, OSError, IndexError):
+            continue  # process is finished already
+        children.setdefault(int(fields[1]), []).append(int(name))
+        rss[int(name)] = int(fields[21]) * PAGE_SIZE
+
+    total = 0
+    pids = [pid]
+    while pids:
+        current = pids.pop()
+        total += rss.get(current, 0)
+        pids.extend(children.get(current, []))
+    return total
@@ -17,29 +17,79 @@ Horizon application implementation.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import shutil
+import time
 from tempfile import mkdtemp
 
 import pom
 from pom import ui
-from selenium.webdriver import FirefoxProfile
+from selenium.webdriver import ChromeOptions, FirefoxOptions, FirefoxProfile
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.remote.remote_connection import RemoteConnection
 
 from horizon_autotests import ACTION_TIMEOUT, UI_TIMEOUT
+from horizon_autotests.profiling import record_command
 
+from ._utils import get_process_tree_rss
 from .pages import PageBase, pages
+from .router import Router
+from .ui import HandleCache
 
 ui.UI.timeout = UI_TIMEOUT
 RemoteConnection.set_timeout(ACTION_TIMEOUT)
-sorted_pages = sorted(pages, key=lambda page: len(page.url))
+router = Router(pages)
+
+# webdriver commands which can't change url of browser. Scripts aren't here,
+# because they can click or submit.
+READONLY_COMMANDS = set(
+    getattr(Command, name) for name in (
+        'FIND_CHILD_ELEMENT',
+        'FIND_CHILD_ELEMENTS',
+        'FIND_ELEMENT',
+        'FIND_ELEMENTS',
+        'GET_ALL_COOKIES',
+        'GET_CURRENT_URL',
+        'GET_ELEMENT_ATTRIBUTE',
+        'GET_ELEMENT_PROPERTY',
+        'GET_ELEMENT_RECT',
+        'GET_ELEMENT_TAG_NAME',
+        'GET_ELEMENT_TEXT',
+        'GET_ELEMENT_VALUE_OF_CSS_PROPERTY',
+        'GET_TITLE',
+        'IS_ELEMENT_DISPLAYED',
+        'IS_ELEMENT_ENABLED',
+        'IS_ELEMENT_SELECTED',
+        'SCREENSHOT',
+        'SET_SCRIPT_TIMEOUT',
+        'SET_TIMEOUTS')
+    if hasattr(Command, name))
+
+# seconds while url read from browser is trusted, since page could be
+# redirected by AJAX response after the last command
+URL_TTL = 1
+
+# webdriver commands which load new document in browser
+NAVIGATION_COMMANDS = set(
+    getattr(Command, name) for name in (
+        'GET',
+        'GO_BACK',
+        'GO_FORWARD',
+        'REFRESH')
+    if hasattr(Command, name))
+
+# browser backends which don't need display
+HEADLESS_BROWSERS = ('firefox-headless', 'chromium-headless')
+BROWSERS = ('firefox',) + HEADLESS_BROWSERS
 
 
 class Profile(FirefoxProfile):
     """Horizon browser profile."""
 
-    def __init__(self, *args, **kwgs):
+    def __init__(self, download_dir=None, *args, **kwgs):
         """Constructor."""
         super(Profile, self).__init__(*args, **kwgs)
-        self.download_dir = mkdtemp()
+        self.download_dir = download_dir or mkdtemp()
         self.set_preference("browser.download.folderList", 2)
         self.set_preference("browser.download.manager.showWhenStarting",
                             False)
@@ -55,23 +105,66 @@ class Profile(FirefoxProfile):
 class Horizon(pom.App):
     """Application to launch horizon in browser."""
 
-    def __init__(self, url, *args, **kwgs):
-        """Constructor."""
-        self.profile = Profile()
-        super(Horizon, self).__init__(
-            url, 'firefox', firefox_profile=self.profile, *args, **kwgs)
+    def __init__(self, url, navigation='url', browser='firefox',
+                 handle_cache=True, *args, **kwgs):
+        """Constructor.
+
+        Arguments:
+            - url: string, horizon dashboard url.
+            - navigation: string, the way steps open pages: "url" opens page
+              url directly, "verify" opens page url and checks that navigate
+              menu leads to it, "menu" clicks navigate menu items.
+            - browser: string, browser backend: "firefox" at display,
+              "firefox-headless" or "chromium-headless" without display.
+            - handle_cache: bool, whether to cache found webelements until
+              browser navigation.
+        """
+        if browser not in BROWSERS:
+            raise ValueError('Unknown browser {!r}'.format(browser))
 
-        self.webdriver.maximize_window()
+        self.navigation = navigation
+        self.browser = browser
+        self.sidebar_models = {}
+        self.download_dir = mkdtemp()
+        self.handle_cache = HandleCache() if handle_cache else None
+
+        if browser == 'chromium-headless':
+            super(Horizon, self).__init__(
+                url, 'chrome', options=self._chromium_options(), *args,
+                **kwgs)
+            self._allow_downloads()
+        else:
+            options = FirefoxOptions()
+            if browser == 'firefox-headless':
+                options.add_argument('-headless')
+            self.profile = Profile(self.download_dir)
+            super(Horizon, self).__init__(
+                url, 'firefox', firefox_profile=self.profile,
+                options=options, *args, **kwgs)
+
+        if browser not in HEADLESS_BROWSERS:
+            self.webdriver.maximize_window()
         self.webdriver.set_window_size(1920, 1080)
         self.webdriver.set_page_load_timeout(ACTION_TIMEOUT)
 
         self.current_username = None
         self.current_project = None
+        self.cached_session = None
+
+        self._pages = {}
+        self._current_url = None
+        self._url_time = 0
+        self._execute = self.webdriver.execute
+        self.webdriver.execute = self._execute_tracked
 
     @property
-    def download_dir(self):
-        """Directory with downloaded files."""
-        return self.profile.download_dir
+    def memory_usage(self):
+        """Resident memory of browser and its driver processes in bytes."""
+        service = getattr(self.webdriver, 'service', None)
+        process = getattr(service, 'process', None)
+        if process is None:
+            return 0
+        return get_process_tree_rss(process.pid)
 
     def open(self, page):
         """Open page or url.
@@ -85,19 +178,38 @@ class Horizon(pom.App):
             url = page.url
         super(Horizon, self).open(url)
 
+    @property
+    def current_url(self):
+        """Current url of browser.
+
+        It's requested from browser only if it could be changed since last
+        navigation or request, or if it's read more than ``URL_TTL`` seconds
+        ago.
+        """
+        if (self._current_url is None or
+                time.time() - self._url_time > URL_TTL):
+            self._current_url = self.webdriver.current_url
+        return self._current_url
+
     @property
     def current_page(self):
         """Current page dynamic definition."""
-        current_url = self.webdriver.current_url
-        for page in sorted_pages:
-            url = self.app_url + page.url
+        current_url = self.current_url
+        page_cls = None
+
+        if current_url.startswith(self.app_url):
+            page_cls = router.resolve(current_url[len(self.app_url):])
 
-            if current_url.startswith(url):
-                url_end = current_url.split(url)[-1]
+        page_cls = page_cls or PageBase
+        if page_cls not in self._pages:
+            self._pages[page_cls] = page_cls(self)
+        return self._pages[page_cls]
 
-                if not (url_end and url_end[0].isalnum()):
-                    return page(self)
-        return PageBase(self)
+    def forget_location(self):
+        """Forget url and webelements if browser is navigated by script."""
+        self._current_url = None
+        if self.handle_cache:
+            self.handle_cache.next_epoch()
 
     def flush_session(self):
         """Delete all cookies.
@@ -105,3 +217,65 @@ class Horizon(pom.App):
         It forces flushes user session by cookies deleting.
         """
         self.webdriver.delete_all_cookies()
+
+    def reset(self):
+        """Reset application state to reuse browser by next test.
+
+        It flushes user session, dismisses opened modals by page reloading,
+        cleans download directory and checks that login form is available.
+        """
+        self.flush_session()
+        self.open(self.page_login)
+        self.page_login.form_login.wait_for_presence()
+
+        for name in os.listdir(self.download_dir):
+            path = os.path.join(self.download_dir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+        self.current_username = None
+        self.current_project = None
+        self.cached_session = None
+
+    def _chromium_options(self):
+        options = ChromeOptions()
+        options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--window-size=1920,1080')
+        options.add_experimental_option('prefs', {
+            'download.default_directory': self.download_dir,
+            'download.prompt_for_download': False})
+        return options
+
+    def _allow_downloads(self):
+        # headless chromium rejects downloads unless they are allowed
+        if hasattr(self.webdriver, 'execute_cdp_cmd'):
+            self.webdriver.execute_cdp_cmd(
+                'Page.setDownloadBehavior',
+                {'behavior': 'allow', 'downloadPath': self.download_dir})
+
+    def _execute_tracked(self, command, params=None):
+        """Execute webdriver command and track url of browser.
+
+        Command latency is recorded to profile of running steps. Cached
+        webelements are forgotten on navigation.
+        """
+        if command not in READONLY_COMMANDS:
+            self._current_url = None
+        if command in NAVIGATION_COMMANDS and self.handle_cache:
+            self.handle_cache.next_epoch()
+
+        start = time.time()
+        try:
+            response = self._execute(command, params)
+        finally:
+            record_command(command, params, time.time() - start)
+
+        # url isn't taken from GET params, since server could redirect
+        if command == Command.GET_CURRENT_URL:
+            self._current_url = response['value']
+            self._url_time = time.time()
+
+        return response
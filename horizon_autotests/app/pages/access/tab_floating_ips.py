@@ -44,6 +44,7 @@ class TableFloatingIPs(_ui.Table):
     """Table with floating IPs."""
 
     columns = {'ip_address': 2, 'mapped_fixed_ip_address': 3}
+    indexed_columns = ('ip_address',)
     row_cls = RowFloatingIP
 
 
@@ -33,8 +33,10 @@ class Notification(ui.Block):
               'success': 'alert-success'}
 
 
-@ui.register_ui(navigate_menu=_ui.NavigateMenu(By.ID, 'sidebar-accordion'))
-class PageBase(pom.Page, _ui.InitiatedUI):
+@ui.register_ui(
+    navigate_menu=_ui.NavigateMenu(By.ID, 'sidebar-accordion'),
+    notifications=_ui.Notifications(By.TAG_NAME, 'body'))
+class PageBase(_ui.CachedContainer, pom.Page, _ui.InitiatedUI):
     """Base page of user account."""
 
     url = '/'
@@ -52,5 +54,14 @@ class PageBase(pom.Page, _ui.InitiatedUI):
         return _notification
 
     def navigate(self, navigate_items):
-        """Open page via navigation menu."""
-        self.navigate_menu.go_to(navigate_items)
+        """Open page via navigation menu.
+
+        Sidebar model is read once per user and project, because navigate
+        menu depends on user role.
+        """
+        key = self.app.current_username, self.app.current_project
+        model = self.app.sidebar_models.get(key) or self.navigate_menu.model()
+
+        self.app.sidebar_models[key] = self.navigate_menu.go_to(
+            navigate_items, model)
+        self.app.forget_location()
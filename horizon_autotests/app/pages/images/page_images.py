@@ -74,9 +74,11 @@ class RowMetadata(_ui.Row):
     """Row of added metadata."""
 
 
-class ListMetadata(ui.List):
+class ListMetadata(_ui.List):
     """List of added metadata."""
 
+    columns = {'name': '[ng-bind$="item.leaf.name"]',
+               'value': '[ng-model$="item.leaf.value"]'}
     row_cls = RowMetadata
     row_xpath = './li[contains(@ng-repeat, "item in existingList")]'
 
@@ -0,0 +1,125 @@
+"""
+Pool of warm horizon applications.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import logging
+import time
+
+from .horizon import Horizon
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HorizonPool(object):
+    """Pool of launched browsers which are leased to tests.
+
+    Browser is reset on release and is discarded if reset is failed.
+    Memory of browser processes is sampled periodically, because it's
+    measured by scan of all processes.
+    """
+
+    def __init__(self, url, size=1, memory_interval=10, *args, **kwgs):
+        """Constructor.
+
+        Arguments:
+            - url: string, horizon dashboard url.
+            - size: int, max count of idle browsers to keep in pool.
+            - memory_interval: int, memory is measured on each N-th
+              release of browser, ``0`` disables measuring.
+        """
+        self.url = url
+        self.size = size
+        self.memory_interval = memory_interval
+        self._args = args
+        self._kwgs = kwgs
+        self._idle = deque()
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.released = 0
+        self.startup_time = 0
+        self.peak_memory = 0
+
+    def acquire(self):
+        """Lease horizon application from pool."""
+        if self._idle:
+            self.reused += 1
+            return self._idle.popleft()
+
+        start = time.time()
+        app = Horizon(self.url, *self._args, **self._kwgs)
+        self.startup_time += time.time() - start
+        self.created += 1
+        return app
+
+    def release(self, app):
+        """Return horizon application to pool."""
+        if (self.memory_interval and
+                self.released % self.memory_interval == 0):
+            self._measure_memory(app)
+        self.released += 1
+
+        if len(self._idle) >= self.size:
+            self._discard(app)
+            return
+
+        try:
+            app.reset()
+        except Exception:
+            LOGGER.exception("Can't reset browser, it will be discarded")
+            self._discard(app)
+        else:
+            self._idle.append(app)
+
+    def close(self):
+        """Quit all idle browsers."""
+        while self._idle:
+            self._quit(self._idle.popleft())
+
+    @property
+    def stats(self):
+        """Pool statistics."""
+        mean_startup_time = self.startup_time / (self.created or 1)
+        return {'size': self.size,
+                'browser': self._kwgs.get('browser', 'firefox'),
+                'created': self.created,
+                'reused': self.reused,
+                'discarded': self.discarded,
+                'startup_time': round(self.startup_time, 2),
+                'saved_time': round(self.reused * mean_startup_time, 2),
+                'peak_memory': round(self.peak_memory / 2.0 ** 20, 2)}
+
+    def _measure_memory(self, app):
+        try:
+            memory = app.memory_usage
+        except Exception:
+            LOGGER.debug("Can't measure browser memory", exc_info=True)
+        else:
+            self.peak_memory = max(self.peak_memory, memory)
+
+    def _discard(self, app):
+        self.discarded += 1
+        self._quit(app)
+
+    def _quit(self, app):
+        try:
+            app.quit()
+        except Exception:
+            LOGGER.exception("Can't quit browser")
@@ -0,0 +1,53 @@
+"""
+Router of urls to horizon pages.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+
+class Router(object):
+    """Router compiled to single regular expression.
+
+    Page matches if url starts with page url and isn't continued with
+    alphanumeric symbol. Pages with shorter urls are checked first.
+    """
+
+    def __init__(self, pages):
+        """Constructor.
+
+        Arguments:
+            - pages: list of page classes.
+        """
+        self.pages = sorted(pages, key=lambda page: len(page.url))
+        alternatives = '|'.join(
+            '({})'.format(re.escape(page.url)) for page in self.pages)
+        self._regex = re.compile(
+            r'(?:{})(?![^\W_])'.format(alternatives), re.UNICODE)
+
+    def resolve(self, path):
+        """Get page class by url path.
+
+        Arguments:
+            - path: string, url path relative to dashboard url.
+
+        Returns:
+            - page class or None.
+        """
+        match = self._regex.match(path)
+        if match:
+            return self.pages[match.lastindex - 1]
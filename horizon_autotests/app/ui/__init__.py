@@ -17,10 +17,15 @@ Module with custom ui components.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .activity import Activity  # noqa
 from .checkbox import CheckBox  # noqa
 from .dropdown_menu import DropdownMenu  # noqa
 from .form import Form  # noqa
+from .handle_cache import CachedContainer, HandleCache  # noqa
 from .initiated_ui import InitiatedUI  # noqa
+from .list import List  # noqa
 from .navigate_menu import NavigateMenu  # noqa
+from .notifications import Notifications  # noqa
+from .snapshot import RowSnapshot, TableSnapshot  # noqa
 from .tab import Tab  # noqa
 from .table import Cell, Row, Table  # noqa
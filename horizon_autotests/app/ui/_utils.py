@@ -0,0 +1,71 @@
+"""
+Utils for custom ui components.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from .handle_cache import drop_handle
+
+
+def execute_script(ui, script, *args):
+    """Execute javascript with webelement of ui as first argument.
+
+    Arguments:
+        - ui: ui component which webelement is passed to script.
+        - script: string, javascript code.
+        - args: other script arguments.
+
+    Returns:
+        - script result.
+    """
+    try:
+        return _execute_script(ui, script, *args)
+    except StaleElementReferenceException:
+        # element could be rerendered between search and script call
+        drop_handle(ui)
+        return _execute_script(ui, script, *args)
+
+
+def _execute_script(ui, script, *args):
+    webelement = ui.container.find_element(ui.locator)
+    return webelement.parent.execute_script(script, webelement, *args)
+
+
+def execute_async_script(ui, script, timeout, *args):
+    """Execute asynchronous javascript with webelement of ui as first argument.
+
+    Arguments:
+        - ui: ui component which webelement is passed to script.
+        - script: string, javascript code.
+        - timeout: int, seconds to wait script callback.
+        - args: other script arguments.
+
+    Returns:
+        - script result.
+    """
+    try:
+        return _execute_async_script(ui, script, timeout, *args)
+    except StaleElementReferenceException:
+        drop_handle(ui)
+        return _execute_async_script(ui, script, timeout, *args)
+
+
+def _execute_async_script(ui, script, timeout, *args):
+    webelement = ui.container.find_element(ui.locator)
+    webelement.parent.set_script_timeout(timeout)
+    return webelement.parent.execute_async_script(script, webelement, *args)
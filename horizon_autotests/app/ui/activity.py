@@ -0,0 +1,187 @@
+"""
+Activity of page scripts.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+
+from pom import ui
+from selenium.common.exceptions import WebDriverException
+
+from horizon_autotests import UI_TIMEOUT
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import wait
+
+from ._utils import execute_async_script, execute_script
+
+LOGGER = logging.getLogger(__name__)
+
+# Script blocks in browser until page is loaded and there are no requests of
+# jQuery, of horizon ajax queue (it updates table rows) and of angular
+# during quiet period, or timeout is expired. Quiet period bridges requests
+# which are sent one after another. Then angular digest is waited to be
+# finished and its outstanding requests and timeouts to be done, so
+# templates like ng-repeat are rendered.
+IDLE_SCRIPT = """
+var timeout = arguments[1], quiet = arguments[2],
+    callback = arguments[arguments.length - 1];
+
+var root = document.querySelector('[ng-app]') || document.body,
+    started = Date.now(), idleSince = null, finished = false;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    callback(result);
+}
+
+function getBusy() {
+    if (document.readyState != 'complete') return 'document';
+    if (window.jQuery && jQuery.active) return 'jquery';
+
+    var ajax = window.horizon && horizon.ajax;
+    if (ajax && ((ajax._active || []).length || (ajax._queue || []).length)) {
+        return 'horizon';
+    }
+
+    var injector = window.angular && angular.element(root).injector();
+    if (injector) {
+        if (injector.get('$http').pendingRequests.length) return 'angular';
+        if (injector.get('$rootScope').$$phase) return 'digest';
+    }
+    return null;
+}
+
+function whenStable(done) {
+    var testability = null;
+    try {
+        testability = window.angular && angular.getTestability &&
+                      angular.getTestability(root);
+    } catch (e) {}  // page isn't bootstrapped by angular
+    if (testability) {
+        testability.whenStable(done);
+    } else {
+        done();
+    }
+}
+
+function check() {
+    if (finished) return;
+    var busy = getBusy(), now = Date.now();
+
+    if (busy) {
+        idleSince = null;
+    } else if (idleSince === null) {
+        idleSince = now;
+    }
+
+    if (idleSince !== null && now - idleSince >= quiet) {
+        return whenStable(function() {
+            if (getBusy()) {
+                idleSince = null;
+                return setTimeout(check, 50);
+            }
+            finish({idle: true, time: Date.now() - started});
+        });
+    }
+    if (now - started >= timeout * 1000) {
+        return finish({idle: false, busy: busy});
+    }
+    setTimeout(check, 50);
+}
+
+// angular may never be stable, if it polls by $timeout
+setTimeout(function() {
+    finish({idle: false, busy: getBusy() || 'angular-testability'});
+}, timeout * 1000);
+check();
+"""
+
+# Script returns token of loaded document, new document gets new token.
+TOKEN_SCRIPT = """
+var root = document.documentElement;
+if (!root.__pageToken) root.__pageToken = Math.random().toString(36).slice(2);
+return root.__pageToken;
+"""
+
+
+class Activity(ui.UI):
+    """Activity of page scripts: loading, AJAX requests, table updates."""
+
+    @timeit
+    def wait_for_idle(self, timeout=UI_TIMEOUT, quiet=0.1):
+        """Wait until page scripts have no requests in progress.
+
+        It's waited instead of fixed sleeps after actions which load data
+        to page. If page is left during wait, new page is waited.
+
+        Arguments:
+            - timeout: int, seconds to wait.
+            - quiet: float, seconds without requests to consider page idle.
+
+        Returns:
+            - bool, whether page is idle.
+        """
+        limit = time.time() + timeout
+        while True:
+            remaining = max(limit - time.time(), 0)
+            try:
+                result = execute_async_script(
+                    self, IDLE_SCRIPT, remaining + 10, remaining,
+                    int(quiet * 1000))
+            except WebDriverException:
+                # script is interrupted if page is unloaded
+                if time.time() >= limit:
+                    raise
+                LOGGER.debug('Idle wait is interrupted, page is waited '
+                             'again', exc_info=True)
+                continue
+
+            if not result['idle']:
+                LOGGER.debug('Page is busy by {} after {} sec'.format(
+                    result['busy'], timeout))
+            return result['idle']
+
+    def get_page_token(self):
+        """Get token of loaded document to detect its reload later."""
+        return execute_script(self, TOKEN_SCRIPT)
+
+    @timeit
+    def wait_for_reload(self, token, timeout=UI_TIMEOUT):
+        """Wait until document is replaced by new one and it's idle.
+
+        Old document is idle already, so it's waited to be left first.
+
+        Arguments:
+            - token: string, token of old document.
+            - timeout: int, seconds to wait.
+
+        Returns:
+            - bool, whether new page is idle.
+        """
+        limit = time.time() + timeout
+
+        def is_reloaded():
+            try:
+                return self.get_page_token() != token
+            except WebDriverException:
+                # document is being unloaded
+                return False
+
+        wait(is_reloaded, timeout, name='Activity.wait_for_reload')
+        return self.wait_for_idle(max(limit - time.time(), 0))
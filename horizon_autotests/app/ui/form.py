@@ -20,11 +20,71 @@ Custom form.
 import pom
 from pom import ui
 from selenium.webdriver.common.by import By
+import six
 
 from horizon_autotests import ACTION_TIMEOUT
+from horizon_autotests.profiling import timeit
 
+from ._utils import execute_script
+from .handle_cache import CachedContainer
 
-class Form(ui.Form):
+# Script sets values of fields in order and fires events which Django
+# (jQuery) and Angular handlers listen. Names of fields which can't be set
+# by script are returned.
+FILL_SCRIPT = """
+var form = arguments[0], fields = arguments[1], unset = [];
+
+function find(by, locator) {
+    if (by == 'id') return form.querySelector('[id="' + locator + '"]');
+    if (by == 'name') return form.querySelector('[name="' + locator + '"]');
+    if (by == 'css selector') return form.querySelector(locator);
+    if (by == 'class name') return form.getElementsByClassName(locator)[0];
+    if (by == 'tag name') return form.getElementsByTagName(locator)[0];
+    if (by == 'xpath') return document.evaluate(
+        locator, form, null, XPathResult.FIRST_ORDERED_NODE_TYPE,
+        null).singleNodeValue;
+    return null;
+}
+
+for (var i = 0; i < fields.length; i++) {
+    var name = fields[i][0], value = fields[i][3],
+        element = find(fields[i][1], fields[i][2]);
+
+    if (!element || element.type == 'file') {
+        unset.push(name);
+        continue;
+    }
+
+    if (element.tagName == 'SELECT') {
+        var option = null;
+        for (var j = 0; j < element.options.length; j++) {
+            if (element.options[j].text.trim() == value) {
+                option = element.options[j];
+                break;
+            }
+        }
+        if (!option) {
+            unset.push(name);
+            continue;
+        }
+        element.value = option.value;
+
+    } else if (element.type == 'checkbox' || element.type == 'radio') {
+        element.checked = value;
+
+    } else {
+        element.value = value;
+    }
+
+    ['input', 'change', 'blur'].forEach(function(type) {
+        element.dispatchEvent(new Event(type, {bubbles: type != 'blur'}));
+    });
+}
+return unset;
+"""
+
+
+class Form(CachedContainer, ui.Form):
     """Custom form."""
 
     timeout = ACTION_TIMEOUT
@@ -32,7 +92,7 @@ class Form(ui.Form):
     submit_locator = By.CSS_SELECTOR, '.btn.btn-primary'
     cancel_locator = By.CSS_SELECTOR, '.btn.cancel'
 
-    @pom.timeit
+    @timeit
     @ui.wait_for_presence
     def submit(self, modal_absent=True):
         """Submit form."""
@@ -43,7 +103,46 @@ class Form(ui.Form):
         if modal_absent:
             self._modal.wait_for_absence()
 
-    @pom.timeit
+    @timeit
+    @ui.wait_for_presence
+    def fill(self, values, typed=()):
+        """Fill form fields with one script.
+
+        Fields are set in order without typing and input and change events
+        are fired. Fields which script can't set (file inputs, absent
+        options or elements) and fields to type are set one by one via ui.
+
+        Arguments:
+            - values: list of (field name, value) pairs or dict.
+            - typed: names of fields to type, if typing is what's tested.
+        """
+        if hasattr(values, 'items'):
+            values = list(values.items())
+
+        fields = []
+        for name, value in values:
+            if name in typed:
+                continue
+            if not isinstance(value, bool):
+                value = six.text_type(value)
+            by, locator = getattr(self, name).locator
+            fields.append((name, by, locator, value))
+
+        unset = execute_script(self, FILL_SCRIPT, fields)
+
+        for name, value in values:
+            if name in typed or name in unset:
+                self._set_value(getattr(self, name), value)
+
+    def _set_value(self, field, value):
+        if value is True:
+            field.select()
+        elif value is False:
+            field.unselect()
+        else:
+            field.value = value
+
+    @timeit
     @ui.wait_for_presence
     def cancel(self, modal_absent=True):
         """Cancel form."""
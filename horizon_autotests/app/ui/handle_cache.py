@@ -0,0 +1,163 @@
+"""
+Cache of resolved webelements.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+from selenium.common.exceptions import (NoSuchElementException,
+                                        StaleElementReferenceException)
+from selenium.webdriver.remote.webelement import WebElement
+
+from horizon_autotests.profiling import record_cache_lookup
+
+# Locators which can match other element while found one is still attached:
+# by text, by position.
+VOLATILE_LOCATOR = re.compile(
+    r'text\(\)|normalize-space|string\(|contains\(\s*\.|\.\s*=|'
+    r'\[\s*\d+\s*\]|position\(\)|last\(\)|:nth-|:contains')
+
+
+class HandleCache(object):
+    """Webelements resolved since last navigation of browser."""
+
+    def __init__(self):
+        """Constructor."""
+        self.epoch = 0
+        self._handles = {}
+
+    def next_epoch(self):
+        """Forget all webelements, because browser is navigated."""
+        self.epoch += 1
+        self._handles.clear()
+
+    def get(self, key):
+        """Get cached webelement or None."""
+        return self._handles.get(key)
+
+    def put(self, key, element):
+        """Cache webelement."""
+        self._handles[key] = element
+
+    def drop(self, key):
+        """Forget webelement."""
+        self._handles.pop(key, None)
+
+
+class CachedElement(WebElement):
+    """Webelement which is re-resolved if it's stale.
+
+    Its container is re-resolved in turn only if it's stale too, so search
+    starts from the nearest valid container.
+    """
+
+    def __init__(self, element, resolve):
+        """Constructor.
+
+        Arguments:
+            - element: resolved webelement.
+            - resolve: callable to find webelement again.
+        """
+        self.__dict__.update(element.__dict__)
+        self._resolve = resolve
+
+    def _execute(self, command, params=None):
+        try:
+            return super(CachedElement, self)._execute(command, params)
+        except StaleElementReferenceException:
+            self._id = self._resolve().id
+            return super(CachedElement, self)._execute(command, params)
+
+
+class CachedContainer(object):
+    """Mixin of container to cache webelements of its ui.
+
+    Cache is kept in application as ``handle_cache`` attribute and is reset
+    on each navigation. If application hasn't it, webelements are searched
+    as usually.
+    """
+
+    def find_element(self, locator):
+        """Find webelement of ui by locator via cache."""
+        cache = _get_cache(self)
+        if cache is None or not is_cacheable(locator):
+            return super(CachedContainer, self).find_element(locator)
+
+        key = get_handle_key(self) + (tuple(locator),)
+        element = cache.get(key)
+        record_cache_lookup(element is not None)
+
+        if element is None:
+            resolve = self._get_resolver(cache, key, locator)
+            element = CachedElement(resolve(), resolve)
+            cache.put(key, element)
+
+        return element
+
+    def remember_element(self, locator, element):
+        """Cache webelement of ui, which is found by script.
+
+        So the first search of ui by locator doesn't request browser.
+        """
+        cache = _get_cache(self)
+        if cache is None or not is_cacheable(locator):
+            return
+
+        key = get_handle_key(self) + (tuple(locator),)
+        cache.put(key, CachedElement(
+            element, self._get_resolver(cache, key, locator)))
+
+    def _get_resolver(self, cache, key, locator):
+
+        def resolve():
+            try:
+                return super(CachedContainer, self).find_element(locator)
+            except NoSuchElementException:
+                cache.drop(key)
+                raise
+
+        return resolve
+
+
+def is_cacheable(locator):
+    """Define whether webelement can be cached by locator."""
+    return not VOLATILE_LOCATOR.search(locator[1])
+
+
+def get_handle_key(ui):
+    """Get key of ui webelement: path of locators from page."""
+    locators = []
+    while (getattr(ui, 'locator', None) is not None and
+           getattr(ui, 'container', None) is not None):
+        locators.append(tuple(ui.locator))
+        ui = ui.container
+    return (type(ui).__name__,) + tuple(reversed(locators))
+
+
+def drop_handle(ui):
+    """Forget cached webelement of ui."""
+    cache = _get_cache(ui)
+    if cache is not None:
+        cache.drop(get_handle_key(ui))
+
+
+def _get_cache(ui):
+    while ui is not None:
+        cache = getattr(getattr(ui, 'app', None), 'handle_cache', None)
+        if cache is not None:
+            return cache
+        ui = getattr(ui, 'container', None)
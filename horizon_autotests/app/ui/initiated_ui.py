@@ -22,6 +22,7 @@ from selenium.webdriver.common.by import By
 
 from horizon_autotests import ACTION_TIMEOUT
 
+from .activity import Activity
 from .form import Form
 
 
@@ -60,6 +61,7 @@ class Modal(ui.Block):
 
 
 @ui.register_ui(
+    activity=Activity(By.XPATH, '/html/body'),
     dropdown_menu_account=DropdownMenuAccount(
         By.CSS_SELECTOR, 'ul.navbar-nav.navbar-right > li.dropdown'),
     dropdown_menu_project=DropdownMenuProject(
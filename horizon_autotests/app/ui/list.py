@@ -0,0 +1,78 @@
+"""
+Custom list component.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pom import ui
+
+from horizon_autotests.profiling import timeit
+
+from ._utils import execute_script
+from .handle_cache import CachedContainer
+from .snapshot import TableSnapshot
+
+SNAPSHOT_SCRIPT = """
+var list = arguments[0], rowXPath = arguments[1], columns = arguments[2];
+var found = document.evaluate(
+    rowXPath, list, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var rows = [];
+
+function getValue(element) {
+    if (!element) return null;
+    if (['INPUT', 'SELECT', 'TEXTAREA'].indexOf(element.tagName) >= 0) {
+        return element.value;
+    }
+    return element.textContent.trim();
+}
+
+for (var i = 0; i < found.snapshotLength; i++) {
+    var row = found.snapshotItem(i);
+    var values = {};
+
+    if (columns) {
+        for (var name in columns) {
+            values[name] = getValue(row.querySelector(columns[name]));
+        }
+    } else {
+        values.text = getValue(row);
+    }
+
+    rows.push({key: row.id || null, status: null, values: values});
+}
+return rows;
+"""
+
+
+class List(CachedContainer, ui.List):
+    """Custom list.
+
+    Columns are declared as mapping of column name to css selector of element
+    inside row. Value of column is text of element or value of form field.
+    """
+
+    columns = None
+
+    @timeit
+    def snapshot(self):
+        """Read all rows with declared columns via one script call.
+
+        Returns:
+            - TableSnapshot, immutable tuple of rows snapshots.
+        """
+        raw_rows = execute_script(
+            self, SNAPSHOT_SCRIPT, self.row_xpath, self.columns)
+        return TableSnapshot.from_script(raw_rows)
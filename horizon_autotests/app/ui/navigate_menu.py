@@ -17,22 +17,136 @@ Navigate menu component.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
 from pom import ui
 from selenium.webdriver.common.by import By
-from waiting import wait
 
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import wait
 
-class NavigateMenu(ui.Block):
+from ._utils import execute_script
+from .handle_cache import CachedContainer
+
+# Signature of sidebar is hash of its items labels and hrefs, it's
+# changed if sidebar is changed.
+SIGNATURE_JS = """
+function getSignature(menu) {
+    var links = menu.getElementsByTagName('a'), text = '', hash = 0;
+    for (var i = 0; i < links.length; i++) {
+        text += links[i].textContent.trim() + ' ' +
+                links[i].getAttribute('href') + '\\n';
+    }
+    for (var j = 0; j < text.length; j++) {
+        hash = (hash * 31 + text.charCodeAt(j)) | 0;
+    }
+    return text.length + ':' + hash;
+}
+"""
+
+TREE_SCRIPT = SIGNATURE_JS + """
+function getItems(list) {
+    var items = [];
+    for (var i = 0; i < list.children.length; i++) {
+        var li = list.children[i];
+        if (li.tagName != 'LI') continue;
+
+        var link = null, subMenu = null;
+        for (var j = 0; j < li.children.length; j++) {
+            var child = li.children[j];
+            if (child.tagName == 'A' && !link) link = child;
+            if (child.tagName == 'UL' && !subMenu) subMenu = child;
+        }
+        if (!link) continue;
+
+        items.push({label: link.textContent.trim(),
+                    href: subMenu ? null : link.getAttribute('href'),
+                    expanded: subMenu ?
+                        subMenu.classList.contains('in') : null,
+                    items: subMenu ? getItems(subMenu) : []});
+    }
+    return items;
+}
+return {signature: getSignature(arguments[0]),
+        items: getItems(arguments[0])};
+"""
+
+# Script finds link only if sidebar isn't changed since model reading.
+LINK_SCRIPT = SIGNATURE_JS + """
+var menu = arguments[0], signature = arguments[1], href = arguments[2];
+if (getSignature(menu) != signature) return null;
+
+var links = menu.getElementsByTagName('a');
+for (var i = 0; i < links.length; i++) {
+    if (links[i].getAttribute('href') == href) return links[i];
+}
+return null;
+"""
+
+
+class SidebarModel(object):
+    """In-memory model of navigate menu items."""
+
+    def __init__(self, signature, items):
+        """Constructor.
+
+        Arguments:
+            - signature: string, signature of sidebar when it's read.
+            - items: list of items, each item is dict with label, href,
+              expanded state and items.
+        """
+        self.signature = signature
+        self.items = items
+
+    def resolve(self, item_names):
+        """Get href of navigate menu item.
+
+        Arguments:
+            - item_names: list of items names of navigate menu.
+
+        Returns:
+            - string, href of item or None if item isn't found.
+        """
+        items = self.items
+        item = None
+
+        for item_name in item_names:
+            item = next((i for i in items if item_name in i['label']), None)
+            if not item:
+                return None
+            items = item['items']
+
+        return item['href']
+
+
+class NavigateMenu(CachedContainer, ui.Block):
     """Navigate menu."""
 
-    @pom.timeit
-    def go_to(self, item_names):
+    @timeit
+    def go_to(self, item_names, model=None):
         """Go to page via navigate menu.
 
+        If sidebar model is passed and the final item is visible, it's
+        clicked at once without expanding of menus. Model is re-read if
+        sidebar is changed. Link is clicked via webdriver, so click returns
+        after new page is loaded.
+
         Arguments:
             - item_names: list of items of navigate menu.
+            - model: sidebar model or None to click all items.
+
+        Returns:
+            - sidebar model actual after navigation.
         """
+        if model is not None:
+            link = self._find_link(model, item_names)
+            if link is None:
+                model = self.model()
+                link = self._find_link(model, item_names)
+
+            # link of collapsed menu isn't clickable, menus are expanded
+            if link is not None and link.is_displayed():
+                link.click()
+                return model
+
         container = self
         last_name = item_names[-1]
 
@@ -53,11 +167,25 @@ class NavigateMenu(ui.Block):
 
             if not _is_expanded(sub_menu):
                 item.click()
-                wait(lambda: _is_expanded(sub_menu),
-                     timeout_seconds=10, sleep_seconds=0.1)
+                wait(lambda: _is_expanded(sub_menu), 10,
+                     name='NavigateMenu.go_to')
 
             container = sub_menu
 
+        return model
+
+    @timeit
+    def model(self):
+        """Read model of navigate menu via one script call."""
+        tree = execute_script(self, TREE_SCRIPT)
+        return SidebarModel(tree['signature'], tree['items'])
+
+    def _find_link(self, model, item_names):
+        href = model.resolve(item_names)
+        if not href:
+            return None
+        return execute_script(self, LINK_SCRIPT, model.signature, href)
+
 
 def _is_expanded(menu):
     return menu.is_present and 'in' in menu.get_attribute('class').split()
@@ -0,0 +1,206 @@
+"""
+Collector of notifications popups.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pom import ui
+
+from horizon_autotests import UI_TIMEOUT
+from horizon_autotests.profiling import timeit
+
+from ._utils import execute_async_script, execute_script
+
+# Collector is installed once per page load. It records notifications
+# present at installation and all added later, except alerts of modal
+# forms. Notifications recorded before step start aren't waited.
+COLLECTOR_JS = """
+function getCollector() {
+    if (window.__notifications) return window.__notifications;
+
+    var levels = {'alert-success': 'success', 'alert-info': 'info',
+                  'alert-warning': 'warning', 'alert-danger': 'error'};
+    var collector = {records: [], nodes: [], since: 0};
+
+    function collect(node) {
+        if (!node.classList || !node.classList.contains('alert')) return;
+        if (collector.nodes.indexOf(node) >= 0) return;
+
+        for (var parent = node; parent; parent = parent.parentElement) {
+            if (parent.classList.contains('modal')) return;
+        }
+
+        var level = null;
+        for (var cls in levels) {
+            if (node.classList.contains(cls)) level = levels[cls];
+        }
+        if (!level) return;
+
+        var text = node.textContent, close = node.querySelector('.close');
+        if (close) text = text.replace(close.textContent, '');
+
+        collector.nodes.push(node);
+        collector.records.push({level: level, text: text.trim(),
+                                time: Date.now(), consumed: false});
+    }
+
+    function collectAll(root) {
+        collect(root);
+        if (!root.querySelectorAll) return;
+        var alerts = root.querySelectorAll('.alert');
+        for (var i = 0; i < alerts.length; i++) collect(alerts[i]);
+    }
+
+    collectAll(document.body);
+    new MutationObserver(function(mutations) {
+        for (var i = 0; i < mutations.length; i++) {
+            var added = mutations[i].addedNodes;
+            for (var j = 0; j < added.length; j++) collectAll(added[j]);
+        }
+    }).observe(document.body, {childList: true, subtree: true});
+
+    window.__notifications = collector;
+    return collector;
+}
+
+function dismissAll(collector) {
+    for (var i = 0; i < collector.nodes.length; i++) {
+        var node = collector.nodes[i];
+        if (node.parentNode) node.parentNode.removeChild(node);
+        collector.records[i].consumed = true;
+    }
+}
+"""
+
+# Script blocks in browser until not consumed notification of level
+# arrives and modal is closed, or timeout is expired. Error notification
+# stops waiting of other level.
+WAIT_SCRIPT = COLLECTOR_JS + """
+var level = arguments[1], timeout = arguments[2], dismiss = arguments[3],
+    callback = arguments[arguments.length - 1];
+
+var collector = getCollector(), observer, timer;
+
+function check() {
+    if (document.querySelector('.modal-backdrop')) return null;
+
+    var records = collector.records;
+    for (var i = 0; i < records.length; i++) {
+        if (records[i].consumed || records[i].time < collector.since) {
+            continue;
+        }
+        if (records[i].level == level || records[i].level == 'error') {
+            for (var j = 0; j <= i; j++) records[j].consumed = true;
+            if (dismiss) dismissAll(collector);
+            return {record: records[i]};
+        }
+    }
+    return null;
+}
+
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(timer);
+    callback(result);
+}
+
+var result = check();
+if (result) return callback(result);
+
+observer = new MutationObserver(function() {
+    var result = check();
+    if (result) finish(result);
+});
+observer.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(function() { finish(null); }, timeout * 1000);
+"""
+
+# Script marks start of step: notifications which arrived before it are
+# consumed.
+START_SCRIPT = COLLECTOR_JS + """
+var collector = getCollector();
+for (var i = 0; i < collector.records.length; i++) {
+    collector.records[i].consumed = true;
+}
+collector.since = Date.now();
+"""
+
+COLLECTED_SCRIPT = COLLECTOR_JS + """
+var collector = getCollector();
+if (arguments[1]) dismissAll(collector);
+return collector.records;
+"""
+
+
+class Notifications(ui.UI):
+    """Notifications popups collected in browser since page load.
+
+    Notification is a dict with level, text and time (milliseconds of
+    browser clock) of popup.
+    """
+
+    @timeit
+    def start(self):
+        """Install collector and mark start of step.
+
+        It's called when step opens page, so popups which fade before the
+        first wait are collected, and notifications of previous steps
+        aren't waited.
+        """
+        execute_script(self, START_SCRIPT)
+
+    @timeit
+    def wait_for(self, level, timeout=UI_TIMEOUT, dismiss=True):
+        """Wait notification of level which arrived since step start.
+
+        Found notification and all earlier ones are marked as consumed.
+        Popups are removed at once, without waiting of fade animation.
+
+        Arguments:
+            - level: string, level of notification: "success", "info",
+              "error".
+            - timeout: int, seconds to wait.
+            - dismiss: bool, whether to remove all popups.
+
+        Returns:
+            - dict, found notification.
+
+        Raises:
+            - AssertionError: if notification isn't arrived or error
+              notification is arrived instead.
+        """
+        result = execute_async_script(self, WAIT_SCRIPT, timeout + 10,
+                                      level, timeout, dismiss)
+        assert result, \
+            "Notification {!r} isn't arrived in {} sec".format(level, timeout)
+
+        record = result['record']
+        assert record['level'] == level, \
+            "Notification {!r} is arrived instead of {!r}: {}".format(
+                record['level'], level, record['text'])
+        return record
+
+    @timeit
+    def collected(self, dismiss=False):
+        """Get all notifications since page load.
+
+        Arguments:
+            - dismiss: bool, whether to remove all popups.
+
+        Returns:
+            - list of notifications.
+        """
+        return execute_script(self, COLLECTED_SCRIPT, dismiss)
@@ -0,0 +1,152 @@
+"""
+Index of table rows by cells values.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import six
+
+from ._utils import execute_script
+
+# Script installs mutations counter on table once and returns rows with
+# their elements only if table is changed since version known by caller.
+# Otherwise it returns element of row with key expected by caller, so lookup
+# and version check are one call.
+INDEX_SCRIPT = """
+var table = arguments[0], rowXPath = arguments[1], columns = arguments[2],
+    knownVersion = arguments[3], expectedKey = arguments[4];
+
+if (!table.__rowIndex) {
+    var state = {token: Math.random().toString(36).slice(2), mutations: 0};
+    new MutationObserver(function() { state.mutations++; }).observe(
+        table, {childList: true, subtree: true, characterData: true});
+    table.__rowIndex = state;
+}
+
+function getKey(row) {
+    return row.getAttribute('data-object-id') || row.id || null;
+}
+
+var version = table.__rowIndex.token + ':' + table.__rowIndex.mutations;
+var found = document.evaluate(
+    rowXPath, table, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+
+if (version == knownVersion) {
+    var element = null;
+    for (var n = 0; expectedKey && n < found.snapshotLength; n++) {
+        if (getKey(found.snapshotItem(n)) == expectedKey) {
+            element = found.snapshotItem(n);
+            break;
+        }
+    }
+    return {version: version, rows: null, element: element};
+}
+
+var rows = [];
+
+for (var i = 0; i < found.snapshotLength; i++) {
+    var row = found.snapshotItem(i);
+    var cells = [];
+    for (var j = 0; j < row.children.length; j++) {
+        if (row.children[j].tagName == 'TD') cells.push(row.children[j]);
+    }
+
+    var values = {};
+    for (var k = 0; k < columns.length; k++) {
+        var cell = cells[columns[k][1] - 1];
+        values[columns[k][0]] = cell ? cell.textContent.trim() : null;
+    }
+
+    rows.push({key: getKey(row), values: values, element: row});
+}
+return {version: version, rows: rows};
+"""
+
+
+class RowIndex(object):
+    """Map of cells values to keys of rows.
+
+    It's rebuilt from one DOM scrape only if table is changed since last
+    lookup, so repeated lookups are dictionary hits. Each lookup is one
+    script call, which checks version of table and returns webelement of
+    found row, so row isn't searched again.
+    """
+
+    def __init__(self, table, column_names):
+        """Constructor.
+
+        Arguments:
+            - table: table to index.
+            - column_names: names of indexed columns.
+        """
+        self.table = table
+        self.column_names = column_names
+        self._version = None
+        self._keys = []
+        self._elements = []
+        self._positions = {}
+
+    def find(self, **kwgs):
+        """Find first row with specified cells values.
+
+        Returns:
+            - tuple of row key and webelement or None if row isn't found.
+        """
+        position = self._find_position(**kwgs)
+        key = None if position is None else self._keys[position]
+        columns = [(name, self.table.columns[name])
+                   for name in self.column_names]
+        result = execute_script(self.table, INDEX_SCRIPT,
+                                self.table.row_xpath, columns, self._version,
+                                key)
+
+        if result['rows'] is None:
+            element = result['element']
+        else:
+            self._rebuild(result['version'], result['rows'])
+            position = self._find_position(**kwgs)
+            if position is None:
+                return None
+            key = self._keys[position]
+            element = self._elements[position]
+
+        if key and element is not None:
+            return key, element
+
+    def _find_position(self, **kwgs):
+        if self._version is None:
+            return None
+
+        positions = None
+        for name, value in kwgs.items():
+            found = set(self._positions[name].get(six.text_type(value), ()))
+            positions = found if positions is None else positions & found
+
+        if positions:
+            return min(positions)
+
+    def _rebuild(self, version, rows):
+        self._version = version
+        self._keys = []
+        self._elements = []
+        self._positions = {name: {} for name in self.column_names}
+
+        for position, row in enumerate(rows):
+            self._keys.append(row['key'])
+            self._elements.append(row['element'])
+
+            for name, value in row['values'].items():
+                self._positions[name].setdefault(value, []).append(position)
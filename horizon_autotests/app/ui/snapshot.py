@@ -0,0 +1,72 @@
+"""
+Immutable snapshots of tables and lists content.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import namedtuple
+
+import six
+
+
+class RowSnapshot(namedtuple('RowSnapshot', ['key', 'status', 'values'])):
+    """Snapshot of row.
+
+    Attributes:
+        - key: string, id of object in row or None.
+        - status: string, status of row or None.
+        - values: tuple of (column name, text value) pairs.
+    """
+
+    __slots__ = ()
+
+    def cell(self, name):
+        """Get text value of cell by column name."""
+        return dict(self.values)[name]
+
+    def match(self, **kwgs):
+        """Define whether row cells have specified values."""
+        values = dict(self.values)
+        return all(values.get(name) == six.text_type(value)
+                   for name, value in kwgs.items())
+
+
+class TableSnapshot(tuple):
+    """Snapshot of table rows."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_script(cls, raw_rows):
+        """Make snapshot from data returned by javascript."""
+        return cls(
+            RowSnapshot(raw_row['key'],
+                        raw_row['status'],
+                        tuple(sorted(raw_row['values'].items())))
+            for raw_row in raw_rows)
+
+    @property
+    def keys(self):
+        """Keys of rows."""
+        return tuple(row.key for row in self)
+
+    def column(self, name):
+        """Text values of column."""
+        return tuple(row.cell(name) for row in self)
+
+    def rows(self, **kwgs):
+        """Rows which cells have specified values."""
+        return tuple(row for row in self if row.match(**kwgs))
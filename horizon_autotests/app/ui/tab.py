@@ -20,10 +20,11 @@ Tab component.
 from pom import ui
 from selenium.webdriver.common.by import By
 
+from .handle_cache import CachedContainer
 from .initiated_ui import InitiatedUI
 
 
-class Tab(ui.Block, InitiatedUI):
+class Tab(CachedContainer, ui.Block, InitiatedUI):
     """Tab component."""
 
     def __init__(self, *args, **kwgs):
@@ -17,17 +17,243 @@ Custom table component.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import re
+import time
 
 import pom
 from pom import ui
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
-from waiting import wait
 
-from horizon_autotests import EVENT_TIMEOUT
+from horizon_autotests import ACTION_TIMEOUT, EVENT_TIMEOUT
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import get_remaining, LONG_OPERATION, wait
 
+from ._utils import execute_async_script, execute_script
+from .handle_cache import CachedContainer
+from .row_index import RowIndex
+from .snapshot import TableSnapshot
 
-class Cell(ui.Block):
+LOGGER = logging.getLogger(__name__)
+
+# browser waits are split to chunks to not exceed webdriver http timeout
+WAIT_CHUNK = ACTION_TIMEOUT // 2
+
+# Script blocks in browser until row state is reached or timeout is expired.
+# Row is searched again on each DOM mutation, because horizon replaces rows
+# during their update.
+WAIT_ROW_SCRIPT = """
+var table = arguments[0], by = arguments[1], locator = arguments[2],
+    mode = arguments[3], column = arguments[4], transitStatuses = arguments[5],
+    timeout = arguments[6], callback = arguments[arguments.length - 1];
+
+function findRow() {
+    if (by == 'xpath') {
+        return document.evaluate(
+            locator, table, null, XPathResult.FIRST_ORDERED_NODE_TYPE,
+            null).singleNodeValue;
+    }
+    return table.querySelector(locator);
+}
+
+function getState() {
+    var row = findRow();
+    if (mode == 'presence') return row ? {present: true} : null;
+    if (mode == 'absence') return row ? null : {present: false};
+
+    if (!row) return null;
+    var cells = [];
+    for (var i = 0; i < row.children.length; i++) {
+        if (row.children[i].tagName == 'TD') cells.push(row.children[i]);
+    }
+    var cell = cells[column - 1];
+    if (!cell) return null;
+
+    var status = cell.textContent.trim();
+    if (transitStatuses.indexOf(status) >= 0) return null;
+    return {status: status};
+}
+
+var observer, timer;
+
+function finish(state) {
+    observer.disconnect();
+    clearTimeout(timer);
+    callback(state);
+}
+
+var state = getState();
+if (state) return callback(state);
+
+observer = new MutationObserver(function() {
+    var state = getState();
+    if (state) finish(state);
+});
+observer.observe(document.body,
+                 {childList: true, subtree: true, characterData: true});
+timer = setTimeout(function() { finish(null); }, timeout * 1000);
+"""
+
+# Script blocks in browser until all rows with specified names leave transit
+# statuses or timeout is expired. It returns status of each settled row and
+# milliseconds it took to settle.
+WAIT_ROWS_SCRIPT = """
+var table = arguments[0], rowXPath = arguments[1], nameColumn = arguments[2],
+    statusColumn = arguments[3], names = arguments[4],
+    transitStatuses = arguments[5], timeout = arguments[6],
+    callback = arguments[arguments.length - 1];
+
+var started = Date.now(), settled = {}, count = 0, observer, timer;
+
+function check() {
+    var found = document.evaluate(
+        rowXPath, table, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+
+    for (var i = 0; i < found.snapshotLength; i++) {
+        var row = found.snapshotItem(i), cells = [];
+        for (var j = 0; j < row.children.length; j++) {
+            if (row.children[j].tagName == 'TD') cells.push(row.children[j]);
+        }
+        var nameCell = cells[nameColumn - 1],
+            statusCell = cells[statusColumn - 1];
+        if (!nameCell || !statusCell) continue;
+
+        var name = nameCell.textContent.trim(),
+            status = statusCell.textContent.trim();
+        if (names.indexOf(name) < 0 || name in settled) continue;
+        if (transitStatuses.indexOf(status) >= 0) continue;
+
+        settled[name] = {status: status, time: Date.now() - started};
+        count++;
+    }
+    return count == names.length;
+}
+
+function finish() {
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    callback(settled);
+}
+
+if (check()) return finish();
+
+observer = new MutationObserver(function() { if (check()) finish(); });
+observer.observe(document.body,
+                 {childList: true, subtree: true, characterData: true});
+timer = setTimeout(finish, timeout * 1000);
+"""
+
+# Function reads rows of table with declared columns. It's shared by scripts
+# which read rows of current page and of pages fetched in background.
+READ_ROWS_JS = """
+function readRows(doc, table, rowXPath, columns) {
+    var found = doc.evaluate(
+        rowXPath, table, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var rows = [];
+
+    for (var i = 0; i < found.snapshotLength; i++) {
+        var row = found.snapshotItem(i);
+        if (row.classList.contains('empty')) continue;
+
+        var cells = [];
+        for (var j = 0; j < row.children.length; j++) {
+            if (row.children[j].tagName == 'TD') cells.push(row.children[j]);
+        }
+
+        var values = {};
+        for (var name in columns) {
+            var cell = cells[columns[name] - 1];
+            values[name] = cell ? cell.textContent.trim() : null;
+        }
+
+        var status = null;
+        if ('status' in values) {
+            status = values.status;
+        } else {
+            var match = / status_(\\w+)/.exec(' ' + row.className);
+            if (match) status = match[1];
+        }
+
+        rows.push({key: row.getAttribute('data-object-id') || row.id || null,
+                   status: status,
+                   values: values});
+    }
+    return rows;
+}
+"""
+
+SNAPSHOT_SCRIPT = READ_ROWS_JS + """
+return readRows(document, arguments[0], arguments[1], arguments[2]);
+"""
+
+# Function requests page by url in background, once per url. Fetched pages
+# are kept in window until they are read, so page is requested while caller
+# handles rows of previous one.
+FETCH_PAGE_JS = """
+function fetchPage(url, tableId, rowXPath, columns, nextSelector) {
+    var pages = window.__tablePages = window.__tablePages || {};
+    if (url in pages) return pages[url];
+
+    pages[url] = fetch(url, {credentials: 'same-origin'}).then(
+        function(response) {
+            if (!response.ok) throw new Error('HTTP ' + response.status);
+            return response.text();
+        }
+    ).then(function(html) {
+        var doc = new DOMParser().parseFromString(html, 'text/html'),
+            table = doc.getElementById(tableId);
+        if (!table) throw new Error('No table #' + tableId);
+        return readPage(doc, table, url, rowXPath, columns, nextSelector);
+    });
+    return pages[url];
+}
+
+function readPage(doc, table, url, rowXPath, columns, nextSelector) {
+    var link = table.querySelector(nextSelector);
+    return {rows: readRows(doc, table, rowXPath, columns),
+            next: link ? new URL(link.getAttribute('href'), url).href : null};
+}
+"""
+
+# Script reads rows of current page and url of next one. Next page is
+# prefetched if it's requested.
+FIRST_PAGE_SCRIPT = READ_ROWS_JS + FETCH_PAGE_JS + """
+var table = arguments[0], rowXPath = arguments[1], columns = arguments[2],
+    nextSelector = arguments[3], prefetch = arguments[4];
+
+window.__tablePages = {};
+var page = readPage(document, table, location.href, rowXPath, columns,
+                    nextSelector);
+if (prefetch && page.next) {
+    fetchPage(page.next, table.id, rowXPath, columns, nextSelector);
+}
+return page;
+"""
+
+# Script blocks in browser until page by url is fetched. Page after it is
+# prefetched if it's requested.
+NEXT_PAGE_SCRIPT = READ_ROWS_JS + FETCH_PAGE_JS + """
+var table = arguments[0], url = arguments[1], rowXPath = arguments[2],
+    columns = arguments[3], nextSelector = arguments[4],
+    prefetch = arguments[5], callback = arguments[arguments.length - 1];
+
+fetchPage(url, table.id, rowXPath, columns, nextSelector).then(
+    function(page) {
+        delete window.__tablePages[url];
+        if (prefetch && page.next) {
+            fetchPage(page.next, table.id, rowXPath, columns, nextSelector);
+        }
+        callback(page);
+    },
+    function(error) {
+        delete window.__tablePages[url];
+        callback({error: String(error)});
+    });
+"""
+
+
+class Cell(CachedContainer, ui.Block):
     """Cell."""
 
     @property
@@ -39,30 +265,108 @@ class Cell(ui.Block):
         return _clean_html(super(Cell, self).value).strip()
 
 
-class Row(ui.Row):
-    """Row."""
+class Row(CachedContainer, ui.Row):
+    """Row.
+
+    Its waits block in browser via mutation observer, instead of polling
+    DOM by webdriver requests. If browser wait fails, polling is used.
+    """
 
     cell_cls = Cell
     transit_statuses = ()
+    wait_in_browser = True
 
-    @pom.timeit
+    @timeit
     def wait_for_status(self, status, timeout=EVENT_TIMEOUT):
         """Wait status value after transit statuses."""
         self.wait_for_presence()
+        timeout = self._wait_in_browser('status', get_remaining(timeout))
+
         with self.cell('status') as cell:
-            wait(lambda: cell.value not in self.transit_statuses,
-                 timeout_seconds=EVENT_TIMEOUT, sleep_seconds=0.1)
+            wait(lambda: cell.value not in self.transit_statuses, timeout,
+                 LONG_OPERATION, name='Row.wait_for_status')
             assert cell.value == status
 
+    def wait_for_presence(self, timeout=None):
+        """Wait for row presence."""
+        timeout = timeout or self.timeout
+        if not self.is_present:
+            timeout = self._wait_in_browser('presence', timeout)
+        return super(Row, self).wait_for_presence(timeout)
+
+    def wait_for_absence(self, timeout=None):
+        """Wait for row absence."""
+        timeout = timeout or self.timeout
+        if self.is_present:
+            timeout = self._wait_in_browser('absence', timeout)
+        return super(Row, self).wait_for_absence(timeout)
+
+    def _wait_in_browser(self, mode, timeout):
+        """Wait row state in browser.
+
+        Returns:
+            - seconds which remain from timeout for final check by polling.
+        """
+        limit = time.time() + timeout
+        if not self.wait_in_browser:
+            return timeout
+
+        by, locator = self.locator
+        if by not in (By.XPATH, By.CSS_SELECTOR):
+            return timeout
+
+        column = None
+        if mode == 'status':
+            column = (self.container.columns or {}).get('status')
+            if not column:
+                return timeout
+
+        try:
+            while time.time() < limit:
+                chunk = min(WAIT_CHUNK, limit - time.time())
+                state = execute_async_script(
+                    self.container, WAIT_ROW_SCRIPT, chunk + 10, by, locator,
+                    mode, column, list(self.transit_statuses), chunk)
+                if state:
+                    break
+        except WebDriverException:
+            LOGGER.debug('Browser wait of row {!r} is failed, polling is '
+                         'used'.format(self), exc_info=True)
+
+        return max(limit - time.time(), 1)
+
 
 @ui.register_ui(
     link_next=ui.UI(By.CSS_SELECTOR, 'a[href^="?marker="]'),
     link_prev=ui.UI(By.CSS_SELECTOR, 'a[href^="?prev_marker="]'),
     row_empty=ui.UI(By.CSS_SELECTOR, 'tr.empty'))
-class Table(ui.Table):
+class Table(CachedContainer, ui.Table):
     """Custom table."""
 
     row_cls = Row
+    indexed_columns = ('name',)
+
+    def row(self, *args, **kwgs):
+        """Get table row.
+
+        Row searched by values of indexed columns is located by key of
+        object found via row index, and its webelement returned by index is
+        cached. If it isn't found, row is located by cells values as
+        usually.
+        """
+        if not args and kwgs and set(kwgs) <= set(self.indexed_columns):
+            found = self._find_indexed_row(**kwgs)
+
+            if found and '"' not in found[0]:
+                key, element = found
+                _row = self.row_cls(
+                    By.XPATH, '{0}[@data-object-id="{1}" or @id="{1}"]'.format(
+                        self.row_xpath, key))
+                _row.container = self
+                self.remember_element(_row.locator, element)
+                return _row
+
+        return super(Table, self).row(*args, **kwgs)
 
     @property
     def rows(self):
@@ -72,3 +376,156 @@ class Table(ui.Table):
             return []
         else:
             return rows
+
+    @timeit
+    def snapshot(self):
+        """Read all rows with declared columns via one script call.
+
+        Returns:
+            - TableSnapshot, immutable tuple of rows snapshots.
+        """
+        raw_rows = execute_script(
+            self, SNAPSHOT_SCRIPT, self.row_xpath, self.columns or {})
+        return TableSnapshot.from_script(raw_rows)
+
+    def iter_rows(self, prefetch=True):
+        """Iterate rows of all table pages, starting from current one.
+
+        Pages are followed by urls of next links and are fetched in
+        background by browser, so current page isn't left. Pages are read
+        lazily, so iteration stopped by caller doesn't fetch rest of them.
+
+        Arguments:
+            - prefetch: bool, whether to fetch next page while rows of
+              previous one are handled.
+
+        Yields:
+            - RowSnapshot, snapshot of row.
+        """
+        columns = self.columns or {}
+        next_selector = self._next_selector()
+
+        page = execute_script(self, FIRST_PAGE_SCRIPT, self.row_xpath,
+                              columns, next_selector, prefetch)
+        while True:
+            for row in TableSnapshot.from_script(page['rows']):
+                yield row
+
+            if not page['next']:
+                return
+
+            url = page['next']
+            page = execute_async_script(
+                self, NEXT_PAGE_SCRIPT, ACTION_TIMEOUT, url, self.row_xpath,
+                columns, next_selector, prefetch)
+            assert 'error' not in page, \
+                "Can't fetch table page {}: {}".format(url, page['error'])
+
+    @timeit
+    def find_row(self, predicate=None, prefetch=True, **kwgs):
+        """Find row across table pages.
+
+        Pages are fetched until row is found.
+
+        Arguments:
+            - predicate: callable, which takes RowSnapshot and defines
+              whether it's searched row.
+            - prefetch: bool, whether to fetch next page while rows of
+              previous one are checked.
+            - kwgs: cells values of searched row.
+
+        Returns:
+            - RowSnapshot of found row or None.
+        """
+        for row in self.iter_rows(prefetch=prefetch):
+            if row.match(**kwgs) and (predicate is None or predicate(row)):
+                return row
+
+    def _next_selector(self):
+        by, selector = self.link_next.locator
+        assert by == By.CSS_SELECTOR, \
+            "Next link of {!r} must be located by css selector".format(self)
+        return selector
+
+    @timeit
+    def wait_for_rows_status(self, names, status, timeout=EVENT_TIMEOUT):
+        """Wait status of several rows at once.
+
+        All rows are watched by one wait, so it lasts as long as the
+        slowest row takes.
+
+        Arguments:
+            - names: list of values of rows name cells.
+            - status: string, expected status of all rows.
+            - timeout: int, seconds to wait.
+
+        Returns:
+            - dict, seconds which each row took to leave transit statuses.
+        """
+        start = time.time()
+        limit = start + get_remaining(timeout)
+        settled = {}
+
+        try:
+            self._wait_rows_in_browser(names, start, limit, settled)
+        except WebDriverException:
+            LOGGER.debug('Browser wait of rows is failed, polling is used',
+                         exc_info=True)
+
+        def _rows_settled():
+            for row in self.snapshot():
+                name = row.cell('name')
+                if name in names and name not in settled and \
+                        row.status not in self.row_cls.transit_statuses:
+                    settled[name] = (row.status, time.time() - start)
+            return len(settled) == len(names)
+
+        wait(_rows_settled, max(limit - time.time(), 1), LONG_OPERATION,
+             name='Table.wait_for_rows_status')
+
+        wrong = {name: row_status for name, (row_status, _) in settled.items()
+                 if row_status != status}
+        assert not wrong, "Rows have unexpected statuses: {}".format(wrong)
+        return {name: round(seconds, 2)
+                for name, (_, seconds) in settled.items()}
+
+    def _wait_rows_in_browser(self, names, start, limit, settled):
+        if not self.row_cls.wait_in_browser:
+            return
+
+        columns = self.columns or {}
+        if 'name' not in columns or 'status' not in columns:
+            return
+
+        while time.time() < limit:
+            remaining = [name for name in names if name not in settled]
+            if not remaining:
+                return
+
+            chunk_start = time.time()
+            chunk = min(WAIT_CHUNK, limit - chunk_start)
+            result = execute_async_script(
+                self, WAIT_ROWS_SCRIPT, chunk + 10, self.row_xpath,
+                columns['name'], columns['status'], remaining,
+                list(self.row_cls.transit_statuses), chunk)
+
+            for name, state in result.items():
+                settled[name] = (
+                    state['status'],
+                    chunk_start - start + state['time'] / 1000.0)
+
+    @property
+    @pom.cache
+    def _row_index(self):
+        column_names = [name for name in self.indexed_columns
+                        if name in (self.columns or {})]
+        return RowIndex(self, column_names)
+
+    def _find_indexed_row(self, **kwgs):
+        if not set(kwgs) <= set(self._row_index.column_names):
+            return None
+        try:
+            return self._row_index.find(**kwgs)
+        except WebDriverException:
+            # table isn't rendered yet, so row will be searched usually
+            return None
@@ -0,0 +1,242 @@
+"""
+Runner of offline benchmarks with baseline comparison.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import os
+import sys
+
+from horizon_autotests import profiling
+from horizon_autotests.app import Horizon
+from horizon_autotests.profiling import timeit
+from horizon_autotests.steps import UsersSteps, VolumesSteps
+
+from .standin import StandinServer
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+SCENARIOS = ('create_volume', 'delete_volumes', 'select_volumes',
+             'filter_users', 'pagination', 'find_row')
+
+
+class Benchmark(object):
+    """Representative scenarios which are run against stand-in.
+
+    Each scenario has preparation which isn't measured.
+    """
+
+    def __init__(self, app, standin):
+        """Constructor.
+
+        Arguments:
+            - app: horizon application.
+            - standin: horizon stand-in server.
+        """
+        self.app = app
+        self.standin = standin
+        self.counter = 0
+
+    def run(self, scenario):
+        """Prepare state and run scenario."""
+        self.standin.reset()
+        self.standin.items_per_page = 20
+        self.app.open('/')
+        self.counter += 1
+
+        prepare = getattr(self, '_prepare_' + scenario, None)
+        args = prepare() if prepare else ()
+        getattr(self, scenario)(*args)
+
+    @timeit('Step')
+    def create_volume(self):
+        """Create volume and wait it's available."""
+        VolumesSteps(self.app).create_volume(
+            'volume-{}'.format(self.counter))
+
+    def _prepare_delete_volumes(self):
+        names = ['volume-{}-{}'.format(self.counter, i) for i in range(3)]
+        for name in names:
+            self.standin.add_volume(name)
+        return names,
+
+    @timeit('Step')
+    def delete_volumes(self, names):
+        """Delete several volumes at once."""
+        VolumesSteps(self.app).delete_volumes(names)
+
+    def _prepare_select_volumes(self):
+        names = ['volume-{}-{}'.format(self.counter, i) for i in range(10)]
+        for name in names:
+            self.standin.add_volume(name)
+        return names,
+
+    @timeit('Step')
+    def select_volumes(self, names):
+        """Select and unselect volumes, each row is looked up twice."""
+        table = VolumesSteps(self.app).tab_volumes().table_volumes
+        for name in names:
+            table.row(name=name).checkbox.select()
+        for name in names:
+            table.row(name=name).checkbox.unselect()
+
+    def _prepare_filter_users(self):
+        for i in range(20):
+            self.standin.add_user('user-{}'.format(i))
+        return 'user-1',
+
+    @timeit('Step')
+    def filter_users(self, query):
+        """Filter users table."""
+        UsersSteps(self.app).filter_users(query)
+
+    def _prepare_pagination(self):
+        names = ['volume-{}-{}'.format(self.counter, i) for i in range(3)]
+        for name in names:
+            self.standin.add_volume(name)
+        self.standin.items_per_page = 1
+        return names,
+
+    @timeit('Step')
+    def pagination(self, names):
+        """Walk volumes table pages forward and back."""
+        table = VolumesSteps(self.app).tab_volumes().table_volumes
+        pages = [(names[2], table.link_next),
+                 (names[1], table.link_next),
+                 (names[0], table.link_prev),
+                 (names[1], table.link_prev),
+                 (names[2], None)]
+
+        for name, link in pages:
+            table.row(name=name).wait_for_presence(30)
+            if link:
+                link.click()
+
+    def _prepare_find_row(self):
+        names = ['volume-{}-{}'.format(self.counter, i) for i in range(50)]
+        for name in names:
+            self.standin.add_volume(name)
+        self.standin.items_per_page = 5
+        return names[0],
+
+    @timeit('Step')
+    def find_row(self, name):
+        """Find volume on the last page of volumes table."""
+        table = VolumesSteps(self.app).tab_volumes().table_volumes
+        assert table.find_row(name=name)
+
+
+class _Recorder(object):
+
+    def __init__(self):
+        self.events = []
+
+    def write(self, event):
+        self.events.append(event)
+
+
+def measure(browser, repeat):
+    """Run scenarios and get median time and commands of steps.
+
+    Returns:
+        - dict, step name to dict with duration and commands.
+    """
+    standin = StandinServer()
+    standin.start()
+    recorder = _Recorder()
+    profiling.add_sink(recorder)
+
+    app = Horizon(standin.url, browser=browser)
+    try:
+        benchmark = Benchmark(app, standin)
+        for scenario in SCENARIOS:
+            for _ in range(repeat):
+                benchmark.run(scenario)
+    finally:
+        app.quit()
+        profiling.remove_sink(recorder)
+        standin.stop()
+
+    steps = [event for event in recorder.events if event['kind'] == 'Step']
+    durations = profiling.summarize(steps)
+    commands = profiling.summarize(steps, 'commands')
+    return {name: {'duration': round(stats['p50'], 3),
+                   'commands': commands[(kind, name)]['p50']}
+            for (kind, name), stats in durations.items()}
+
+
+def compare(results, baseline, tolerance):
+    """Compare results with baseline.
+
+    Step regresses if its time exceeds baseline more than by tolerance or
+    it sends more webdriver commands than baseline.
+
+    Returns:
+        - list of rows (name, result, baseline, is regressed).
+    """
+    rows = []
+    for name, result in sorted(results.items()):
+        base = baseline.get(name)
+        regressed = bool(base) and (
+            result['duration'] > base['duration'] * (1 + tolerance) or
+            result['commands'] > base['commands'])
+        rows.append((name, result, base, regressed))
+    return rows
+
+
+def main():
+    """Run benchmarks and compare with baseline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--browser', default='chromium-headless')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown of step')
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    elif not args.save_baseline:
+        sys.stderr.write(
+            'Baseline {} is absent, create it with --save-baseline\n'.format(
+                args.baseline))
+        return 2
+
+    results = measure(args.browser, args.repeat)
+
+    print('{:<45} {:>9} {:>9} {:>9} {:>9}'.format(
+        'step', 'time', 'baseline', 'commands', 'baseline'))
+    rows = compare(results, baseline, args.tolerance)
+    for name, result, base, regressed in rows:
+        base = base or {'duration': float('nan'), 'commands': '-'}
+        print('{:<45} {:>9.3f} {:>9.3f} {:>9} {:>9} {}'.format(
+            name, result['duration'], base['duration'], result['commands'],
+            base['commands'], 'REGRESSED' if regressed else ''))
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        return 0
+
+    return 1 if any(row[3] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,443 @@
+"""
+Local stand-in of horizon pages used by benchmarks.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import uuid
+from xml.sax.saxutils import quoteattr, escape
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qs, urlparse
+
+# It reproduces horizon DOM which is expected by locators of pages:
+# tables with checkbox and .btn-group cells, modal forms with backdrop,
+# notifications, sidebar accordion and marker pagination.
+PAGE_TEMPLATE = u"""<!DOCTYPE html>
+<html>
+<head><title>{title}</title></head>
+<body>
+<ul class="nav navbar-nav"><li class="dropdown">
+  <span class="context-project">admin</span></li></ul>
+<ul class="nav navbar-nav navbar-right"><li class="dropdown">
+  <a href="/dashboard/auth/logout/">Sign Out</a></li></ul>
+<div id="sidebar-accordion">
+  <a>Project</a>
+  <ul>
+    <li><a>Compute</a>
+      <ul><li><a href="/dashboard/project/volumes/">Volumes</a></li></ul>
+    </li>
+  </ul>
+  <a>Identity</a>
+  <ul><li><a href="/dashboard/identity/users/">Users</a></li></ul>
+</div>
+<div id="content">{content}</div>
+<div id="modal_wrapper"></div>
+<div class="messages"></div>
+<script>{script}</script>
+</body>
+</html>
+"""
+
+SCRIPT = u"""
+function notify(level, text) {
+    var alert = document.createElement('div');
+    alert.className = 'alert alert-' + level;
+    alert.innerHTML = '<a class="close" href="#">&times;</a>' + text;
+    alert.querySelector('a.close').onclick = function(event) {
+        event.preventDefault();
+        alert.parentNode.removeChild(alert);
+    };
+    document.querySelector('.messages').appendChild(alert);
+}
+
+function showModal(html) {
+    document.getElementById('modal_wrapper').innerHTML =
+        '<div class="modal-backdrop"></div>' +
+        '<div class="modal"><div class="modal-content">' + html +
+        '</div></div>';
+    var cancel = document.querySelector('#modal_wrapper .cancel');
+    if (cancel) cancel.onclick = function(event) {
+        event.preventDefault();
+        hideModal();
+    };
+}
+
+function hideModal() {
+    document.getElementById('modal_wrapper').innerHTML = '';
+}
+
+function post(url, data, onDone) {
+    var request = new XMLHttpRequest();
+    request.open('POST', url);
+    request.setRequestHeader('Content-Type',
+                             'application/x-www-form-urlencoded');
+    request.onload = function() { onDone(request.responseText); };
+    request.send(data);
+}
+
+function refreshTable(tableId) {
+    var request = new XMLHttpRequest();
+    request.open('GET', location.pathname + location.search +
+                 (location.search ? '&' : '?') + 'tbody=' + tableId);
+    request.onload = function() {
+        var table = document.getElementById(tableId);
+        table.querySelector('tbody').innerHTML = request.responseText;
+        scheduleRefresh(tableId);
+    };
+    request.send();
+}
+
+function scheduleRefresh(tableId) {
+    var table = document.getElementById(tableId);
+    if (table && table.querySelector('tr.status_unknown')) {
+        setTimeout(function() { refreshTable(tableId); }, 500);
+    }
+}
+
+function selectedIds(tableId) {
+    var ids = [];
+    var boxes = document.querySelectorAll(
+        '#' + tableId + ' tbody input[type="checkbox"]');
+    for (var i = 0; i < boxes.length; i++) {
+        if (boxes[i].checked) ids.push(boxes[i].value);
+    }
+    return ids;
+}
+
+var createButton = document.getElementById('volumes__action_create');
+if (createButton) createButton.onclick = function(event) {
+    event.preventDefault();
+    setTimeout(function() {
+        showModal(document.getElementById('create_volume_template')
+                  .innerHTML);
+        var form = document.querySelector('#modal_wrapper form');
+        form.onsubmit = function(event) {
+            event.preventDefault();
+            post(form.getAttribute('action'),
+                 'name=' + encodeURIComponent(form.elements.name.value),
+                 function(text) {
+                     hideModal();
+                     notify('info', text);
+                     refreshTable('volumes');
+                 });
+        };
+    }, 100);
+};
+
+var deleteButton = document.getElementById('volumes__action_delete');
+if (deleteButton) deleteButton.onclick = function(event) {
+    event.preventDefault();
+    var ids = selectedIds('volumes');
+    showModal(
+        '<div class="modal-body">Confirm Delete Volumes</div>' +
+        '<div class="modal-footer"><a class="btn cancel" href="#">Cancel</a>' +
+        '<a class="btn btn-primary" href="#">Delete Volumes</a></div>');
+    document.querySelector('#modal_wrapper .btn-primary').onclick =
+        function(event) {
+            event.preventDefault();
+            post('/dashboard/project/volumes/delete',
+                 'ids=' + ids.join(','),
+                 function(text) {
+                     hideModal();
+                     notify('success', text);
+                     refreshTable('volumes');
+                 });
+        };
+};
+
+var labels = document.querySelectorAll('[data-target]');
+for (var i = 0; i < labels.length; i++) {
+    labels[i].onclick = function(event) { event.preventDefault(); };
+}
+
+scheduleRefresh('volumes');
+"""
+
+CREATE_VOLUME_FORM = u"""
+<form action="/dashboard/project/volumes/create" method="post">
+  <div class="modal-body">
+    <input type="text" name="name">
+    <select name="volume_source_type">
+      <option value="">No source, empty volume</option>
+      <option value="image_source">Image</option>
+    </select>
+    <select name="image_source">
+      <option value="cirros">cirros (12.7 MB)</option>
+      <option value="TestVM">TestVM (12.7 MB)</option>
+    </select>
+    <select name="type">
+      <option value="">No volume type</option>
+      <option value="lvmdriver-1">lvmdriver-1</option>
+    </select>
+  </div>
+  <div class="modal-footer">
+    <a class="btn cancel" href="#">Cancel</a>
+    <button class="btn btn-primary" type="submit">Create Volume</button>
+  </div>
+</form>
+"""
+
+ROUTES = {
+    ('GET', '/dashboard/project/volumes/'): '_volumes_page',
+    ('GET', '/dashboard/identity/users/'): '_users_page',
+    ('POST', '/dashboard/project/volumes/create'): '_create_volume',
+    ('POST', '/dashboard/project/volumes/delete'): '_delete_volumes',
+}
+
+ROW_TEMPLATE = u"""<tr data-object-id={id} id={row_id} class={cls}>
+<td><input type="checkbox" id={checkbox_id} value={id}>
+  <label for={checkbox_id}></label></td>
+{cells}
+<td><div class="btn-group">
+  <a class="btn" id={edit_id} href="#">Edit</a>
+  <a class="btn dropdown-toggle" href="#">More</a>
+  <ul class="dropdown-menu"><li>
+    <a id={delete_id} href="#">Delete</a></li></ul>
+</div></td>
+</tr>"""
+
+
+class StandinServer(object):
+    """HTTP server which renders horizon pages from in-memory state.
+
+    Only volumes and users pages are reproduced. Created volume stays in
+    "Creating" status for ``creation_delay`` seconds.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, creation_delay=1.0,
+                 items_per_page=20):
+        """Constructor.
+
+        Arguments:
+            - host: string, host to listen.
+            - port: int, port to listen, 0 picks free port.
+            - creation_delay: float, seconds before volume is available.
+            - items_per_page: int, count of table rows per page.
+        """
+        self.creation_delay = creation_delay
+        self.items_per_page = items_per_page
+        self.lock = threading.Lock()
+        self.volumes = []
+        self.users = []
+
+        self._server = _ThreadingHTTPServer((host, port), _Handler)
+        self._server.standin = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """Dashboard url of stand-in."""
+        host, port = self._server.server_address
+        return 'http://{}:{}/dashboard'.format(host, port)
+
+    def start(self):
+        """Serve requests in background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving requests."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def add_volume(self, name, available=True):
+        """Add volume to state."""
+        created = time.time() - (self.creation_delay if available else 0)
+        with self.lock:
+            self.volumes.insert(0, {'id': uuid.uuid4().hex,
+                                    'name': name,
+                                    'created': created})
+
+    def add_user(self, name):
+        """Add user to state."""
+        with self.lock:
+            self.users.append({'id': uuid.uuid4().hex, 'name': name})
+
+    def reset(self):
+        """Delete all volumes and users."""
+        with self.lock:
+            del self.volumes[:]
+            del self.users[:]
+
+    def dispatch(self, method, path, query, form):
+        """Handle request and return status code and html."""
+        handler = ROUTES.get((method, path))
+        if handler is None and method == 'GET' and \
+                path.startswith('/dashboard'):
+            handler = '_empty_page'
+        if handler is None:
+            return 404, u'Not found'
+
+        with self.lock:
+            return 200, getattr(self, handler)(query, form)
+
+    def _empty_page(self, query, form):
+        return self._page('Horizon', u'')
+
+    def _page(self, title, content, script=u''):
+        return PAGE_TEMPLATE.format(title=escape(title), content=content,
+                                    script=script)
+
+    def _table(self, table_id, headers, tbody, links=u''):
+        header = u''.join(u'<th>{}</th>'.format(escape(name))
+                          for name in headers)
+        return (u'<table id={} class="table">'
+                u'<thead><tr>{}</tr></thead><tbody>{}</tbody>'
+                u'<tfoot><tr><td>{}</td></tr></tfoot></table>').format(
+                    quoteattr(table_id), header, tbody, links)
+
+    def _rows(self, table_id, items, cells):
+        if not items:
+            return u'<tr class="empty"><td>No items to display.</td></tr>'
+
+        rows = []
+        for item in items:
+            values, status = cells(item)
+            row_id = '{}__row__{}'.format(table_id, item['id'])
+            rows.append(ROW_TEMPLATE.format(
+                id=quoteattr(item['id']),
+                row_id=quoteattr(row_id),
+                cls=quoteattr('status_' + status),
+                checkbox_id=quoteattr(row_id + '__checkbox'),
+                edit_id=quoteattr(row_id + '__action_edit'),
+                delete_id=quoteattr(row_id + '__action_delete'),
+                cells=u''.join(u'<td>{}</td>'.format(escape(value))
+                               for value in values)))
+        return u''.join(rows)
+
+    def _paginate(self, items, query):
+        ids = [item['id'] for item in items]
+        size = self.items_per_page
+        start = 0
+
+        if 'marker' in query and query['marker'][0] in ids:
+            start = ids.index(query['marker'][0]) + 1
+        elif 'prev_marker' in query and query['prev_marker'][0] in ids:
+            start = max(ids.index(query['prev_marker'][0]) - size, 0)
+
+        page = items[start:start + size]
+        links = []
+        if start > 0 and page:
+            links.append(u'<a href="?prev_marker={}">Prev</a>'.format(
+                page[0]['id']))
+        if start + size < len(items):
+            links.append(u'<a href="?marker={}">Next</a>'.format(
+                page[-1]['id']))
+        return page, u' '.join(links)
+
+    def _volume_cells(self, volume):
+        ready = time.time() - volume['created'] >= self.creation_delay
+        status = 'Available' if ready else 'Creating'
+        values = [volume['name'], u'', u'1GiB', status, u'lvmdriver-1', u'']
+        return values, 'active' if ready else 'unknown'
+
+    def _volumes_page(self, query, form):
+        volumes, links = self._paginate(self.volumes, query)
+        tbody = self._rows('volumes', volumes, self._volume_cells)
+        if 'tbody' in query:
+            return tbody
+
+        content = (
+            u'<ul class="nav nav-tabs">'
+            u'<li><a data-target="#volumes_tab">Volumes</a></li>'
+            u'<li><a data-target="#snapshots_tab">Snapshots</a></li>'
+            u'<li><a data-target="#backups_tab">Backups</a></li></ul>'
+            u'<a class="btn" id="volumes__action_create" href="#">'
+            u'Create Volume</a>'
+            u'<a class="btn" id="volumes__action_delete" href="#">'
+            u'Delete Volumes</a>' +
+            self._table('volumes', ['', 'Name', 'Description', 'Size',
+                                    'Status', 'Type', 'Attached To',
+                                    'Actions'], tbody, links) +
+            u'<script type="text/template" id="create_volume_template">' +
+            CREATE_VOLUME_FORM + u'</script>')
+        return self._page('Volumes', content, SCRIPT)
+
+    def _users_page(self, query, form):
+        search = query.get('users__filter__q', [u''])[0]
+        users = [user for user in self.users if search in user['name']]
+        users, links = self._paginate(users, query)
+        tbody = self._rows(
+            'users', users,
+            lambda user: ([user['name'], u'', user['name'] + u'@test.com',
+                           u'', u'', u'Yes'], 'active'))
+
+        content = (
+            u'<form method="get" action="">'
+            u'<input type="text" name="users__filter__q" value={}>'
+            u'<button type="submit" class="btn fa fa-search"></button>'
+            u'</form>'
+            u'<a class="btn" id="users__action_create" href="#">'
+            u'Create User</a>'
+            u'<a class="btn" id="users__action_delete" href="#">'
+            u'Delete Users</a>').format(quoteattr(search)) + self._table(
+                'users', ['', 'User Name', 'Description', 'Email',
+                          'User ID', 'Domain', 'Enabled', 'Actions'],
+                tbody, links)
+        return self._page('Users', content)
+
+    def _create_volume(self, query, form):
+        name = form.get('name', [u''])[0]
+        self.volumes.insert(0, {'id': uuid.uuid4().hex,
+                                'name': name,
+                                'created': time.time()})
+        return u'Info: Creating volume "{}"'.format(escape(name))
+
+    def _delete_volumes(self, query, form):
+        ids = form.get('ids', [u''])[0].split(',')
+        names = [volume['name'] for volume in self.volumes
+                 if volume['id'] in ids]
+        self.volumes[:] = [volume for volume in self.volumes
+                           if volume['id'] not in ids]
+        return u'Success: Scheduled deletion of Volumes: {}'.format(
+            escape(', '.join(names)))
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn,
+                           BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_GET(self):  # noqa
+        self._handle()
+
+    do_POST = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8')) \
+            if length else {}
+
+        status, content = self.server.standin.dispatch(
+            self.command, url.path, parse_qs(url.query), form)
+        data = content.encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
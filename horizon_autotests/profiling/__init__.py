@@ -0,0 +1,30 @@
+"""
+Profiling of steps and UI actions.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .aggregate import load_events, summarize  # noqa
+from .context import (add_sink,  # noqa
+                      current_frames,
+                      record_cache_lookup,
+                      record_command,
+                      record_wait,
+                      remove_sink,
+                      set_budgets,
+                      set_test)
+from .sink import JsonlSink  # noqa
+from .timer import CommandBudgetExceeded, timeit  # noqa
@@ -0,0 +1,76 @@
+"""
+Aggregation of profiling events.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+
+
+def load_events(paths):
+    """Read events from JSONL files.
+
+    Arguments:
+        - paths: list of files paths.
+
+    Returns:
+        - generator of events.
+    """
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of sorted values."""
+    rank = int(math.ceil(percent / 100.0 * len(sorted_values)))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def summarize(events, key='duration'):
+    """Summarize values of events with the same kind and name.
+
+    Arguments:
+        - events: iterable of events.
+        - key: name of event field to summarize, events without it are
+          skipped.
+
+    Returns:
+        - dict, (kind, name) to dict with count, total, mean, p50, p95, p99
+          and max.
+    """
+    values = {}
+    for event in events:
+        if key not in event:
+            continue
+        values.setdefault((event['kind'], event['name']), []).append(
+            event[key])
+
+    summary = {}
+    for group, group_values in values.items():
+        group_values.sort()
+        total = sum(group_values)
+        summary[group] = {'count': len(group_values),
+                          'total': total,
+                          'mean': total / len(group_values),
+                          'p50': percentile(group_values, 50),
+                          'p95': percentile(group_values, 95),
+                          'p99': percentile(group_values, 99),
+                          'max': group_values[-1]}
+    return summary
@@ -0,0 +1,182 @@
+"""
+Context of running steps and UI actions.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import threading
+
+_local = threading.local()
+_sinks = []
+_test = {'name': None}
+_budgets = {}
+
+
+class Frame(object):
+    """Running step or UI action with webdriver commands sent during it."""
+
+    def __init__(self, kind, name):
+        """Constructor.
+
+        Arguments:
+            - kind: string, "Step" or "UI".
+            - name: string, name of class method.
+        """
+        self.kind = kind
+        self.name = name
+        self.commands = 0
+        self.wire_time = 0.0
+        self.command_counts = {}
+        self.ui_commands = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._signatures = {}
+
+    def record(self, command, params, duration, ui_name=None):
+        """Record webdriver command."""
+        self.commands += 1
+        self.wire_time += duration
+        self.command_counts[command] = self.command_counts.get(command, 0) + 1
+        if ui_name:
+            self.ui_commands[ui_name] = self.ui_commands.get(ui_name, 0) + 1
+
+        dump = json.dumps(params, sort_keys=True, default=str)
+        key = hashlib.md5((command + dump).encode('utf-8')).hexdigest()
+        if key not in self._signatures:
+            self._signatures[key] = ['{} {}'.format(command, dump[:100]), 0]
+        self._signatures[key][1] += 1
+
+    @property
+    def cache_hit_rate(self):
+        """Share of webelements taken from cache or None."""
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            return float(self.cache_hits) / lookups
+
+    @property
+    def repeated(self):
+        """Identical commands which were sent several times."""
+        return {signature: count
+                for signature, count in self._signatures.values()
+                if count > 1}
+
+
+def current_frames():
+    """Stack of running steps and UI actions of current thread."""
+    if not hasattr(_local, 'frames'):
+        _local.frames = []
+    return _local.frames
+
+
+def add_sink(sink):
+    """Register sink to receive profiling events."""
+    _sinks.append(sink)
+
+
+def remove_sink(sink):
+    """Unregister sink."""
+    _sinks.remove(sink)
+
+
+def set_test(name):
+    """Set name of running test which events are attributed to."""
+    _test['name'] = name
+
+
+def set_budgets(budgets):
+    """Set max counts of webdriver commands per step.
+
+    Arguments:
+        - budgets: dict, step name, like "VolumesSteps.create_volume", to
+          max count of commands.
+    """
+    _budgets.clear()
+    _budgets.update(budgets)
+
+
+def get_budget(name):
+    """Get max count of webdriver commands of step or None."""
+    return _budgets.get(name)
+
+
+def record_command(command, params, duration):
+    """Attribute webdriver command to all running steps.
+
+    Arguments:
+        - command: string, webdriver command name.
+        - params: dict, command parameters.
+        - duration: float, seconds of command execution.
+    """
+    frames = current_frames()
+    ui_name = None
+    for frame in reversed(frames):
+        if frame.kind != 'Step':
+            ui_name = frame.name
+            break
+
+    for frame in frames:
+        if frame.kind == 'Step':
+            frame.record(command, params, duration, ui_name)
+
+
+def record_cache_lookup(hit):
+    """Attribute lookup of webelement in cache to all running steps.
+
+    Arguments:
+        - hit: bool, whether webelement is found in cache.
+    """
+    for frame in current_frames():
+        if frame.kind == 'Step':
+            if hit:
+                frame.cache_hits += 1
+            else:
+                frame.cache_misses += 1
+
+
+def record_wait(name, start, duration, polls, poll_time, wasted, passed):
+    """Emit event of finished wait of condition.
+
+    Arguments:
+        - name: string, name of wait site.
+        - start: float, timestamp of wait start.
+        - duration: float, seconds of wait.
+        - polls: int, count of condition polls.
+        - poll_time: float, seconds spent in polls.
+        - wasted: float, seconds between polls which condition could be
+          true already.
+        - passed: bool, whether condition became true.
+    """
+    emit({'kind': 'Wait',
+          'name': name,
+          'start': start,
+          'duration': duration,
+          'polls': polls,
+          'poll_time': poll_time,
+          'wasted': wasted,
+          'passed': passed})
+
+
+def emit(event):
+    """Put event to all sinks.
+
+    Arguments:
+        - event: dict, event fields. Name of running test is added to it.
+    """
+    event['test'] = _test['name']
+    for sink in _sinks:
+        sink.write(event)
@@ -0,0 +1,51 @@
+"""
+Sinks of profiling events.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import threading
+
+
+class JsonlSink(object):
+    """Sink which appends events to file as JSON lines."""
+
+    def __init__(self, path):
+        """Constructor.
+
+        Arguments:
+            - path: string, path to file.
+        """
+        folder = os.path.dirname(path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        self.path = path
+        self._file = open(path, 'a')
+        self._lock = threading.Lock()
+
+    def write(self, event):
+        """Write event."""
+        line = json.dumps(event, sort_keys=True) + '\n'
+        with self._lock:
+            self._file.write(line)
+
+    def close(self):
+        """Flush and close file."""
+        with self._lock:
+            self._file.close()
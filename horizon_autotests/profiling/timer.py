@@ -0,0 +1,92 @@
+"""
+Decorator to measure time of steps and UI actions.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import time
+
+import pom
+
+from .context import current_frames, emit, Frame, get_budget
+
+
+class CommandBudgetExceeded(AssertionError):
+    """Step sent more webdriver commands than its budget allows."""
+
+
+def timeit(name_or_func=None):
+    """Measure time of method execution.
+
+    It logs via ``pom.timeit`` and emits structured event to profiling sinks.
+    It's used either as ``@timeit`` for UI actions or as ``@timeit('Step')``.
+    """
+    if callable(name_or_func):
+        return _decorate(name_or_func, None)
+
+    return lambda func: _decorate(func, name_or_func)
+
+
+def _decorate(func, kind):
+    logged = pom.timeit(kind)(func) if kind else pom.timeit(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwgs):
+        frame = Frame(kind or 'UI',
+                      '{}.{}'.format(type(self).__name__, func.__name__))
+        frames = current_frames()
+        frames.append(frame)
+        passed = False
+        start = time.time()
+        try:
+            result = logged(self, *args, **kwgs)
+            passed = True
+            return result
+        finally:
+            duration = time.time() - start
+            frames.pop()
+            _finish(frame, start, duration, passed)
+
+    return wrapper
+
+
+def _finish(frame, start, duration, passed):
+    event = {'kind': frame.kind,
+             'name': frame.name,
+             'start': start,
+             'duration': duration,
+             'passed': passed}
+
+    if frame.kind == 'Step':
+        repeated = frame.repeated
+        event.update(commands=frame.commands,
+                     wire_time=frame.wire_time,
+                     command_counts=frame.command_counts,
+                     ui_commands=frame.ui_commands,
+                     repeated=repeated,
+                     repeated_commands=sum(repeated.values()) - len(repeated),
+                     cache_hits=frame.cache_hits,
+                     cache_misses=frame.cache_misses)
+        if frame.cache_hit_rate is not None:
+            event['cache_hit_rate'] = frame.cache_hit_rate
+    emit(event)
+
+    budget = get_budget(frame.name)
+    if passed and budget is not None and frame.commands > budget:
+        raise CommandBudgetExceeded(
+            '{} sent {} webdriver commands, but budget is {}'.format(
+                frame.name, frame.commands, budget))
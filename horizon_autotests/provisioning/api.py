@@ -0,0 +1,175 @@
+"""
+Provisioning of test environment via keystone and neutron API.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from multiprocessing.pool import ThreadPool
+
+import requests
+
+from .base import BaseProvisioner
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DOMAIN = 'default'
+MEMBER_ROLES = ('_member_', 'member')  # horizon default role for new user
+REQUEST_TIMEOUT = 30
+
+
+class ApiProvisioner(BaseProvisioner):
+    """Provisioner which sends REST requests to keystone v3 and neutron.
+
+    Independent requests are sent concurrently in threads.
+    """
+
+    def __init__(self, auth_url, username, password, project, workers=8):
+        """Constructor.
+
+        Arguments:
+            - auth_url: string, keystone v3 url, like http://keystone:5000/v3.
+            - username: string, admin name.
+            - password: string, admin password.
+            - project: string, admin project.
+            - workers: int, count of concurrent requests.
+        """
+        self.auth_url = auth_url.rstrip('/')
+        self.credentials = (username, password, project)
+        self.workers = workers
+        self.network_url = None
+        self._session = None
+
+    def build(self, projects, users, shared_networks):
+        """Create projects and users and share networks."""
+        self._authenticate()
+        pool = ThreadPool(self.workers)
+        try:
+            shared = pool.map_async(self._share_network, shared_networks)
+
+            project_ids = dict(zip(
+                projects, pool.map(self._create_project, projects)))
+            roles = list(set(user.role for user in users))
+            role_ids = dict(zip(roles, pool.map(self._find_role, roles)))
+
+            pool.map(lambda user: self._create_user(
+                user, project_ids[user.project], role_ids[user.role]), users)
+            shared.get()
+        finally:
+            pool.close()
+            pool.join()
+
+    def destroy(self, projects, users):
+        """Delete users and projects."""
+        self._authenticate()
+        pool = ThreadPool(self.workers)
+        try:
+            pool.map(lambda user: self._delete('users', user.name), users)
+            pool.map(lambda name: self._delete('projects', name), projects)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _authenticate(self):
+        username, password, project = self.credentials
+        self._session = requests.Session()
+
+        response = self._session.post(
+            self.auth_url + '/auth/tokens',
+            json={'auth': {
+                'identity': {
+                    'methods': ['password'],
+                    'password': {'user': {'name': username,
+                                          'password': password,
+                                          'domain': {'id': DEFAULT_DOMAIN}}}},
+                'scope': {'project': {'name': project,
+                                      'domain': {'id': DEFAULT_DOMAIN}}}}},
+            timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+        self._session.headers['X-Auth-Token'] = \
+            response.headers['X-Subject-Token']
+        self.network_url = self._endpoint(
+            response.json()['token']['catalog'], 'network')
+
+    def _endpoint(self, catalog, service_type):
+        for service in catalog:
+            if service['type'] != service_type:
+                continue
+
+            for endpoint in service['endpoints']:
+                if endpoint['interface'] == 'public':
+                    return endpoint['url'].rstrip('/')
+
+        raise LookupError(
+            "Service {!r} is absent in catalog".format(service_type))
+
+    def _request(self, method, url, **kwgs):
+        response = self._session.request(
+            method, url, timeout=REQUEST_TIMEOUT, **kwgs)
+        response.raise_for_status()
+        if response.content:
+            return response.json()
+
+    def _find(self, url, collection, name):
+        items = self._request('GET', url, params={'name': name})[collection]
+        if not items:
+            raise LookupError("{!r} is absent in {}".format(name, collection))
+        return items[0]['id']
+
+    def _create_project(self, project_name):
+        LOGGER.info('Create project {!r}'.format(project_name))
+        return self._request(
+            'POST', self.auth_url + '/projects',
+            json={'project': {'name': project_name,
+                              'domain_id': DEFAULT_DOMAIN}})['project']['id']
+
+    def _find_role(self, role_name):
+        if role_name:
+            return self._find(self.auth_url + '/roles', 'roles', role_name)
+
+        for name in MEMBER_ROLES:
+            try:
+                return self._find(self.auth_url + '/roles', 'roles', name)
+            except LookupError:
+                pass
+
+        raise LookupError("Member role is absent in roles")
+
+    def _create_user(self, user, project_id, role_id):
+        LOGGER.info('Create user {!r}'.format(user.name))
+        user_id = self._request(
+            'POST', self.auth_url + '/users',
+            json={'user': {'name': user.name,
+                           'password': user.password,
+                           'default_project_id': project_id,
+                           'domain_id': DEFAULT_DOMAIN}})['user']['id']
+        self._request(
+            'PUT', '{}/projects/{}/users/{}/roles/{}'.format(
+                self.auth_url, project_id, user_id, role_id))
+
+    def _share_network(self, network_name):
+        LOGGER.info('Share network {!r}'.format(network_name))
+        network_id = self._find(
+            self.network_url + '/v2.0/networks', 'networks', network_name)
+        self._request('PUT', self.network_url + '/v2.0/networks/' + network_id,
+                      json={'network': {'shared': True}})
+
+    def _delete(self, collection, name):
+        with self._try_delete(name):
+            url = self.auth_url + '/' + collection
+            item_id = self._find(url, collection, name)
+            self._request('DELETE', url + '/' + item_id)
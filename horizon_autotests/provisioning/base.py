@@ -0,0 +1,64 @@
+"""
+Base of provisioning backends.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+from collections import namedtuple
+import contextlib
+import logging
+
+import six
+
+LOGGER = logging.getLogger(__name__)
+
+User = namedtuple('User', ['name', 'password', 'project', 'role'])
+
+
+@six.add_metaclass(abc.ABCMeta)
+class BaseProvisioner(object):
+    """Base provisioner of test environment.
+
+    Resources are deleted in best-effort mode: failed deletion is logged and
+    doesn't prevent deletion of other resources.
+    """
+
+    @abc.abstractmethod
+    def build(self, projects, users, shared_networks):
+        """Create projects and users and share networks.
+
+        Arguments:
+            - projects: list of project names.
+            - users: list of users to create.
+            - shared_networks: list of names of networks to share.
+        """
+
+    @abc.abstractmethod
+    def destroy(self, projects, users):
+        """Delete users and projects.
+
+        Arguments:
+            - projects: list of project names.
+            - users: list of users to delete.
+        """
+
+    @contextlib.contextmanager
+    def _try_delete(self, resource_name):
+        try:
+            yield
+        except Exception:
+            LOGGER.error("Can't delete resource {!r}".format(resource_name))
@@ -0,0 +1,199 @@
+"""
+Local stand-in of keystone and neutron API for offline provisioning.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import re
+import threading
+import uuid
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qs, urlparse
+
+ROUTES = [
+    ('POST', r'/v3/auth/tokens$', '_issue_token'),
+    ('GET', r'/v3/(projects|users|roles)$', '_list'),
+    ('POST', r'/v3/(projects|users)$', '_create'),
+    ('DELETE', r'/v3/(projects|users)/([^/]+)$', '_delete'),
+    ('PUT', r'/v3/projects/([^/]+)/users/([^/]+)/roles/([^/]+)$',
+     '_grant_role'),
+    ('GET', r'/v2.0/(networks)$', '_list'),
+    ('PUT', r'/v2.0/(networks)/([^/]+)$', '_update'),
+]
+
+
+class StubServer(object):
+    """In-memory keystone v3 and neutron API with only requests used by
+    provisioning. It accepts any credentials.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0,
+                 roles=('admin', '_member_'),
+                 networks=('admin_floating_net', 'admin_internal_net')):
+        """Constructor.
+
+        Arguments:
+            - host: string, host to listen.
+            - port: int, port to listen, 0 picks free port.
+            - roles: names of predefined roles.
+            - networks: names of predefined networks.
+        """
+        self.lock = threading.Lock()
+        self.resources = {'projects': {}, 'users': {}, 'roles': {},
+                          'networks': {}}
+        self.assignments = set()
+
+        for name in roles:
+            self._add('roles', {'name': name})
+        for name in networks:
+            self._add('networks', {'name': name, 'shared': False})
+
+        self._server = _ThreadingHTTPServer((host, port), _Handler)
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """Keystone v3 url of stub."""
+        host, port = self._server.server_address
+        return 'http://{}:{}/v3'.format(host, port)
+
+    def start(self):
+        """Serve requests in background thread."""
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def serve_forever(self):
+        """Serve requests until stop."""
+        self._server.serve_forever()
+
+    def stop(self):
+        """Stop serving requests."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def dispatch(self, method, path, query, body):
+        """Handle request and return status code, headers and body."""
+        for route_method, pattern, handler in ROUTES:
+            match = re.match(pattern, path)
+            if route_method == method and match:
+                with self.lock:
+                    return getattr(self, handler)(
+                        *match.groups(), query=query, body=body)
+
+        return 404, {}, {'error': {'message': 'Not found'}}
+
+    def _add(self, collection, item):
+        item = dict(item, id=uuid.uuid4().hex)
+        self.resources[collection][item['id']] = item
+        return item
+
+    def _issue_token(self, query, body):
+        base_url = self.url[:-len('/v3')]
+        catalog = [{'type': 'identity',
+                    'endpoints': [{'interface': 'public', 'url': self.url}]},
+                   {'type': 'network',
+                    'endpoints': [{'interface': 'public', 'url': base_url}]}]
+        return (201, {'X-Subject-Token': uuid.uuid4().hex},
+                {'token': {'catalog': catalog}})
+
+    def _list(self, collection, query, body):
+        items = [item for item in self.resources[collection].values()
+                 if item['name'] in query.get('name', [item['name']])]
+        return 200, {}, {collection: items}
+
+    def _create(self, collection, query, body):
+        item = body[collection[:-1]]
+        item.pop('password', None)
+        return 201, {}, {collection[:-1]: self._add(collection, item)}
+
+    def _update(self, collection, item_id, query, body):
+        if item_id not in self.resources[collection]:
+            return 404, {}, {'error': {'message': 'Not found'}}
+
+        item = self.resources[collection][item_id]
+        item.update(body[collection[:-1]])
+        return 200, {}, {collection[:-1]: item}
+
+    def _delete(self, collection, item_id, query, body):
+        if self.resources[collection].pop(item_id, None) is None:
+            return 404, {}, {'error': {'message': 'Not found'}}
+        return 204, {}, None
+
+    def _grant_role(self, project_id, user_id, role_id, query, body):
+        for collection, item_id in [('projects', project_id),
+                                    ('users', user_id),
+                                    ('roles', role_id)]:
+            if item_id not in self.resources[collection]:
+                return 404, {}, {'error': {'message': 'Not found'}}
+
+        self.assignments.add((project_id, user_id, role_id))
+        return 204, {}, None
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn,
+                           BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_GET(self):  # noqa
+        self._handle()
+
+    do_POST = do_PUT = do_DELETE = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length).decode('utf-8')) \
+            if length else None
+
+        status, headers, content = self.server.stub.dispatch(
+            self.command, url.path, parse_qs(url.query), body)
+        data = json.dumps(content).encode('utf-8') if content else b''
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main():
+    """Run stub server in foreground."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
+
+    stub = StubServer(args.host, args.port)
+    print('Keystone stub is listening on {}'.format(stub.url))
+    stub.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Provisioning of test environment via horizon UI.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from horizon_autotests.steps import (AuthSteps,
+                                     ProjectsSteps,
+                                     NetworksSteps,
+                                     UsersSteps)
+
+from .base import BaseProvisioner
+
+
+class UiProvisioner(BaseProvisioner):
+    """Provisioner which operates with dashboard in leased browser."""
+
+    def __init__(self, horizon_pool, username, password, project):
+        """Constructor.
+
+        Arguments:
+            - horizon_pool: pool of horizon applications.
+            - username: string, admin name.
+            - password: string, admin password.
+            - project: string, admin project.
+        """
+        self.horizon_pool = horizon_pool
+        self.credentials = (username, password, project)
+
+    def build(self, projects, users, shared_networks):
+        """Create projects and users and share networks."""
+        app = self.horizon_pool.acquire()
+        try:
+            auth_steps = self._login(app)
+
+            projects_steps = ProjectsSteps(app)
+            for project_name in projects:
+                projects_steps.create_project(project_name)
+
+            users_steps = UsersSteps(app)
+            for user in users:
+                users_steps.create_user(user.name, user.password,
+                                        user.project, role=user.role)
+
+            networks_steps = NetworksSteps(app)
+            for network_name in shared_networks:
+                networks_steps.admin_update_network(network_name,
+                                                    shared=True, check=False)
+
+            auth_steps.logout()
+        finally:
+            self.horizon_pool.release(app)
+
+    def destroy(self, projects, users):
+        """Delete users and projects."""
+        app = self.horizon_pool.acquire()
+        try:
+            auth_steps = self._login(app)
+
+            users_steps = UsersSteps(app)
+            for user in users:
+                with self._try_delete(user.name):
+                    users_steps.filter_users(user.name)
+                    users_steps.delete_user(user.name)
+
+            projects_steps = ProjectsSteps(app)
+            for project_name in projects:
+                with self._try_delete(project_name):
+                    projects_steps.filter_projects(project_name)
+                    projects_steps.delete_project(project_name)
+
+            auth_steps.logout()
+        finally:
+            self.horizon_pool.release(app)
+
+    def _login(self, app):
+        username, password, project = self.credentials
+        auth_steps = AuthSteps(app)
+        auth_steps.login(username, password)
+        auth_steps.switch_project(project)
+        return auth_steps
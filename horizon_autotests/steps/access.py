@@ -17,7 +17,7 @@ Horizon steps for authentication.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -35,7 +35,7 @@ class AccessSteps(BaseSteps):
             page.label_security_groups.click()
             return page.tab_security_groups
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_security_group(self, group_name, description=None, check=True):
         """Step to create security group."""
         tab_security_groups = self.tab_security_groups()
@@ -54,7 +54,7 @@ class AccessSteps(BaseSteps):
             tab_security_groups.table_security_groups.row(
                 name=group_name).wait_for_presence(30)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_security_group(self, group_name, check=True):
         """Step to delete security group."""
         tab_security_groups = self.tab_security_groups()
@@ -19,8 +19,8 @@ Horizon steps for api access.
 
 import os
 
-import pom
-from waiting import wait
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import wait
 
 from .base import BaseSteps
 
@@ -34,7 +34,7 @@ class ApiAccessSteps(BaseSteps):
         access_page.label_api_access.click()
         return access_page.tab_api_access
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def download_rc_v2(self, check=True):
         """Step to download v2 file."""
         self._remove_rc_file()
@@ -44,8 +44,8 @@ class ApiAccessSteps(BaseSteps):
 
         if check:
             wait(lambda: os.path.basename(self._rc_path) in
-                 os.listdir(self.app.download_dir),
-                 timeout_seconds=30, sleep_seconds=0.1)
+                 os.listdir(self.app.download_dir), 30,
+                 name='ApiAccessSteps.download_rc_v2')
             content = open(self._rc_path).read()
 
             assert 'OS_AUTH_URL={}'.format(self._auth_url) in content
@@ -53,7 +53,7 @@ class ApiAccessSteps(BaseSteps):
             assert 'OS_TENANT_NAME="{}"'.format(self._project_name) in content
             assert 'OS_TENANT_ID={}'.format(self._project_id) in content
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def download_rc_v3(self, check=True):
         """Step to download v3 file."""
         self._remove_rc_file()
@@ -63,8 +63,8 @@ class ApiAccessSteps(BaseSteps):
 
         if check:
             wait(lambda: os.path.basename(self._rc_path) in
-                 os.listdir(self.app.download_dir),
-                 timeout_seconds=30, sleep_seconds=0.1)
+                 os.listdir(self.app.download_dir), 30,
+                 name='ApiAccessSteps.download_rc_v3')
             content = open(self._rc_path).read()
 
             assert 'OS_AUTH_URL={}'.format(self._auth_url) in content
@@ -72,7 +72,7 @@ class ApiAccessSteps(BaseSteps):
             assert 'OS_PROJECT_NAME="{}"'.format(self._project_name) in content
             assert 'OS_PROJECT_ID={}'.format(self._project_id) in content
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def view_credentials(self, check=True):
         """Step to view credentials."""
         tab_api_access = self.tab_api_access()
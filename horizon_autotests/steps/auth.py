@@ -17,26 +17,40 @@ Horizon steps for authentication.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+import logging
+
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
+LOGGER = logging.getLogger(__name__)
+
 
 class AuthSteps(BaseSteps):
     """Authentication steps."""
 
+    # cookies of authenticated sessions by (username, project), they are
+    # shared between all browsers of worker process
+    sessions = {}
+
     def page_login(self):
         """Open login page if it's not opened."""
         return self._open(self.app.page_login)
 
-    @pom.timeit('Step')
-    def login(self, username, password, check=True):
+    @timeit('Step')
+    def login(self, username, password, project=None, check=True):
         """Step to log in user account.
 
         Arguments:
             - username: string, user name.
             - password: string, user password.
+            - project: string, name of project to switch after login. If it's
+              defined, session cookies are cached and next login of the same
+              user to the same project injects them instead of form filling.
         """
+        if project and self._restore_session(username, project):
+            return
+
         with self.page_login().form_login as form:
             form.field_username.value = username
             form.field_password.value = password
@@ -47,7 +61,12 @@ class AuthSteps(BaseSteps):
 
         self.app.current_username = username
 
-    @pom.timeit('Step')
+        if project:
+            self.switch_project(project, check=check)
+            if check:
+                self._save_session(username, project)
+
+    @timeit('Step')
     def logout(self, check=True):
         """Step to log out user account."""
         with self.app.page_base.dropdown_menu_account as menu:
@@ -57,5 +76,45 @@ class AuthSteps(BaseSteps):
         if check:
             self.app.page_login.form_login.wait_for_presence(30)
 
+        # logout invalidates session on server side
+        self.sessions.pop(self.app.cached_session, None)
+
+        self.app.cached_session = None
         self.app.current_username = None
         self.app.current_project = None
+
+    def _save_session(self, username, project):
+        self.sessions[username, project] = self.app.webdriver.get_cookies()
+        self.app.cached_session = username, project
+
+    def _restore_session(self, username, project):
+        cookies = self.sessions.get((username, project))
+        if not cookies:
+            return False
+
+        # cookies can be set for opened domain only
+        self.app.flush_session()
+        self.app.open(self.app.page_login)
+        for cookie in cookies:
+            self.app.webdriver.add_cookie(cookie)
+        self.app.open(self.app.page_base)
+
+        if not self.app.page_base.dropdown_menu_account.is_present:
+            LOGGER.info('Cached session of {!r} is rejected'.format(username))
+            self.sessions.pop((username, project))
+            self.app.flush_session()
+            return False
+
+        self.app.current_username = username
+        self.app.cached_session = username, project
+
+        # project could be switched by previous test if session is stored on
+        # server side
+        with self.app.page_base.dropdown_menu_project as menu:
+            if menu.label_project.value == project:
+                self.app.current_project = project
+            else:
+                self.switch_project(project)
+                self._save_session(username, project)
+
+        return True
@@ -17,7 +17,7 @@ Horizon base steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 
 class BaseSteps(object):
@@ -34,16 +34,38 @@ class BaseSteps(object):
     def _open(self, page):
         current_page = self.app.current_page
         if page.__class__ != current_page.__class__:
+            navigate_items = getattr(page, 'navigate_items', None)
 
-            if getattr(page, 'navigate_items', None):
-                current_page.navigate(page.navigate_items)
+            if navigate_items and self.app.navigation == 'menu':
+                current_page.navigate(navigate_items)
 
             else:
                 page.open()
 
+                if navigate_items and self.app.navigation == 'verify':
+                    self._verify_navigation(page)
+
+        # step waits only notifications caused by its actions
+        self.app.page_base.notifications.start()
         return page
 
-    @pom.timeit('Step')
+    def _verify_navigation(self, page):
+        # navigate menu model is read once per user and project and is
+        # re-read only if it doesn't lead to page, since sidebar could be
+        # changed
+        key = self.app.current_username, self.app.current_project
+        model = self.app.sidebar_models.get(key)
+        href = model.resolve(page.navigate_items) if model else None
+
+        if not (href and href.endswith(page.url)):
+            model = self.app.sidebar_models[key] = page.navigate_menu.model()
+            href = model.resolve(page.navigate_items)
+
+        assert href and href.endswith(page.url), \
+            "Navigate menu {!r} leads to {!r} instead of {!r}".format(
+                page.navigate_items, href, page.url)
+
+    @timeit('Step')
     def switch_project(self, project_name, check=True):
         """Switch project in user account.
 
@@ -64,14 +86,14 @@ class BaseSteps(object):
 
         self.app.current_project = project_name
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def close_notification(self, level):
         """Close notification popup window.
 
+        Notification must arrive after step opened page and after previous
+        closed one. All popups are closed at once when modal form is closed.
+
         Arguments:
             - level: string, level of popup: "success", "info", "error".
         """
-        self.app.page_base.modal.wait_for_absence()
-        with self.app.page_base.notification(level) as popup:
-            popup.button_close.click()
-            popup.wait_for_absence()
+        self.app.page_base.notifications.wait_for(level)
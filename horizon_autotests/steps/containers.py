@@ -17,7 +17,7 @@ Containers steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -29,7 +29,7 @@ class ContainersSteps(BaseSteps):
         """Open containers page if it isn't opened."""
         return self._open(self.app.page_containers)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_container(self, container_name, public=False, check=True):
         """Step to create container."""
         page_containers = self.page_containers()
@@ -50,7 +50,7 @@ class ContainersSteps(BaseSteps):
             page_containers.list_containers.row(
                 container_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_container(self, container_name, check=True):
         """Step to delete container."""
         page_containers = self.page_containers()
@@ -74,7 +74,7 @@ class ContainersSteps(BaseSteps):
         """Exit from context manager."""
         self._callback()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def container(self, container_name):
         """Step to enter to container."""
         self.app.page_containers.list_containers.row(container_name).click()
@@ -86,7 +86,7 @@ class ContainersSteps(BaseSteps):
         self._callback = exit
         return self
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def folder(self, folder_name):
         """Step to enter to folder."""
         self.app.page_containers.table_objects.row(
@@ -98,7 +98,7 @@ class ContainersSteps(BaseSteps):
         self._callback = exit
         return self
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_folder(self, folder_name, check=True):
         """Step to create folder."""
         with self.app.page_containers as page:
@@ -113,7 +113,7 @@ class ContainersSteps(BaseSteps):
             self.app.page_containers.table_objects.row(
                 name=folder_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_folder(self, folder_name, check=True):
         """Step to delete folder."""
         with self.app.page_containers as page:
@@ -126,7 +126,7 @@ class ContainersSteps(BaseSteps):
             self.app.page_containers.table_objects.row(
                 name=folder_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def container_info(self, container_name):
         """Step to get container info."""
         with self.app.page_containers.list_containers.row(
@@ -137,7 +137,7 @@ class ContainersSteps(BaseSteps):
                 'created_date': row.label_created_date.value,
                 'public_url': row.link_public_url.href}
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def upload_file(self, file_path, file_name=None, check=True):
         """Step to upload file."""
         self.app.page_containers.button_upload_file.click()
@@ -158,7 +158,7 @@ class ContainersSteps(BaseSteps):
 
         return file_name
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_file(self, file_name, check=True):
         """Step to delete file."""
         with self.app.page_containers.table_objects.row(
@@ -17,7 +17,7 @@ Horizon steps for defaults.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -29,15 +29,15 @@ class DefaultsSteps(BaseSteps):
         """Open access & security page."""
         return self._open(self.app.page_defaults)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_defaults(self, defaults, check=True):
         """Step to update defaults."""
         page_defaults = self.page_defaults()
         page_defaults.button_update_defaults.click()
 
         with page_defaults.form_update_defaults as form:
-            for default_name, default_value in defaults.items():
-                getattr(form, 'field_' + default_name).value = default_value
+            form.fill([('field_' + default_name, default_value)
+                       for default_name, default_value in defaults.items()])
             form.submit()
 
         if check:
@@ -46,7 +46,7 @@ class DefaultsSteps(BaseSteps):
                 assert getattr(page_defaults, 'label_' + default_name).value \
                     == str(default_value)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def get_defaults(self, defaults):
         """Step to get defaults."""
         result = {}
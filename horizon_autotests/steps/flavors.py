@@ -17,7 +17,7 @@ Flavors steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -29,7 +29,7 @@ class FlavorsSteps(BaseSteps):
         """Open flavors page if it isn't opened."""
         return self._open(self.app.page_flavors)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_flavor(self, flavor_name, cpu_count=1, ram=1024, root_disk=1,
                       check=True):
         """Step to create flavor."""
@@ -37,10 +37,10 @@ class FlavorsSteps(BaseSteps):
         page_flavors.button_create_flavor.click()
 
         with page_flavors.form_create_flavor as form:
-            form.field_name.value = flavor_name
-            form.field_vcpus.value = cpu_count
-            form.field_ram.value = ram
-            form.field_root_disk.value = root_disk
+            form.fill([('field_name', flavor_name),
+                       ('field_vcpus', cpu_count),
+                       ('field_ram', ram),
+                       ('field_root_disk', root_disk)])
             form.submit()
 
         if check:
@@ -48,7 +48,7 @@ class FlavorsSteps(BaseSteps):
             page_flavors.table_flavors.row(
                 name=flavor_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_flavor(self, flavor_name, check=True):
         """Step to delete flavor."""
         page_flavors = self.page_flavors()
@@ -65,7 +65,7 @@ class FlavorsSteps(BaseSteps):
             page_flavors.table_flavors.row(
                 name=flavor_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_flavors(self, flavor_names, check=True):
         """Step to delete flavors as batch."""
         page_flavors = self.page_flavors()
@@ -83,7 +83,7 @@ class FlavorsSteps(BaseSteps):
                 page_flavors.table_flavors.row(
                     name=flavor_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_flavor(self, flavor_name, new_flavor_name=None, check=True):
         """Step to update flavor."""
         page_flavors = self.page_flavors()
@@ -101,7 +101,7 @@ class FlavorsSteps(BaseSteps):
             page_flavors.table_flavors.row(
                 name=new_flavor_name or flavor_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_metadata(self, flavor_name, metadata, check=True):
         """Step to update flavor metadata."""
         page_flavors = self.page_flavors()
@@ -124,7 +124,7 @@ class FlavorsSteps(BaseSteps):
             page_flavors.table_flavors.row(
                 name=flavor_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def get_metadata(self, flavor_name):
         """Step to get flavor metadata."""
         metadata = {}
@@ -136,15 +136,14 @@ class FlavorsSteps(BaseSteps):
             menu.button_toggle.click()
             menu.item_update_metadata.click()
 
-        for row in page_flavors.form_update_metadata.list_metadata.rows:
-            metadata[row.field_metadata_name.value] = \
-                row.field_metadata_value.value
+        for row in page_flavors.form_update_metadata.list_metadata.snapshot():
+            metadata[row.cell('name')] = row.cell('value')
 
         page_flavors.form_update_metadata.cancel()
 
         return metadata
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def modify_access(self, flavor_name, project, check=True):
         """Step to modify flavor access."""
         page_flavors = self.page_flavors()
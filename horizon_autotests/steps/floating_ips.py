@@ -17,7 +17,7 @@ Floating IPs steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -31,7 +31,7 @@ class FloatingIPsSteps(BaseSteps):
         page_access.label_floating_ips.click()
         return page_access.tab_floating_ips
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def allocate_floating_ip(self, check=True):
         """Step to allocate floating IP."""
         tab_floating_ips = self.tab_floating_ips()
@@ -50,7 +50,7 @@ class FloatingIPsSteps(BaseSteps):
             assert len(allocated_ip) == 1
             return allocated_ip.pop()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def release_floating_ip(self, ip, check=True):
         """Step to release floating IP."""
         tab_floating_ips = self.tab_floating_ips()
@@ -67,7 +67,7 @@ class FloatingIPsSteps(BaseSteps):
             tab_floating_ips.table_floating_ips.row(
                 ip_address=ip).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def associate_floating_ip(self, ip, instance_name, check=True):
         """Step to associate floating IP."""
         tab_floating_ips = self.tab_floating_ips()
@@ -86,9 +86,5 @@ class FloatingIPsSteps(BaseSteps):
 
     @property
     def _current_floating_ips(self):
-        ips = set()
-        rows = self.app.page_access.tab_floating_ips.table_floating_ips.rows
-        for row in rows:
-            ip = row.cell('ip_address').value
-            ips.add(ip)
-        return ips
+        table = self.app.page_access.tab_floating_ips.table_floating_ips
+        return set(table.snapshot().column('ip_address'))
@@ -17,7 +17,7 @@ Host aggregates steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -29,7 +29,7 @@ class HostAggregatesSteps(BaseSteps):
         """Open images page if it isn't opened."""
         return self._open(self.app.page_host_aggregates)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_host_aggregate(self, host_aggregate_name, check=True):
         """Step to create host aggregate."""
         page_host_aggregates = self.page_host_aggregates()
@@ -44,7 +44,7 @@ class HostAggregatesSteps(BaseSteps):
             page_host_aggregates.table_host_aggregates.row(
                 name=host_aggregate_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_host_aggregate(self, host_aggregate_name, check=True):
         """Step to delete host_aggregate."""
         page_host_aggregates = self.page_host_aggregates()
@@ -61,7 +61,7 @@ class HostAggregatesSteps(BaseSteps):
             page_host_aggregates.table_host_aggregates.row(
                 name=host_aggregate_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_host_aggregates(self, host_aggregate_names, check=True):
         """Step to delete host aggregates."""
         page_host_aggregates = self.page_host_aggregates()
@@ -17,12 +17,15 @@ Images steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+import logging
 
 from horizon_autotests import EVENT_TIMEOUT
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
+LOGGER = logging.getLogger(__name__)
+
 CIRROS_URL = ('http://download.cirros-cloud.net/0.3.1/'
               'cirros-0.3.1-x86_64-uec.tar.gz')
 
@@ -34,7 +37,7 @@ class ImagesSteps(BaseSteps):
         """Open images page if it isn't opened."""
         return self._open(self.app.page_images)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_image(self, image_name, image_url=CIRROS_URL, image_file=None,
                      disk_format='QCOW2', min_disk=None, min_ram=None,
                      protected=False, check=True):
@@ -43,28 +46,26 @@ class ImagesSteps(BaseSteps):
         page_images.button_create_image.click()
 
         with page_images.form_create_image as form:
-            form.field_name.value = image_name
+            values = [('field_name', image_name)]
 
             if image_file:
-                form.combobox_source_type.value = 'Image File'
-                form.field_image_file.value = image_file
+                values.extend([('combobox_source_type', 'Image File'),
+                               ('field_image_file', image_file)])
 
             else:
-                form.combobox_source_type.value = 'Image Location'
-                form.field_image_url.value = image_url
+                values.extend([('combobox_source_type', 'Image Location'),
+                               ('field_image_url', image_url)])
 
             if min_disk:
-                form.field_min_disk.value = min_disk
+                values.append(('field_min_disk', min_disk))
 
             if min_ram:
-                form.field_min_ram.value = min_ram
+                values.append(('field_min_ram', min_ram))
 
-            if protected:
-                form.checkbox_protected.select()
-            else:
-                form.checkbox_protected.unselect()
+            values.extend([('checkbox_protected', bool(protected)),
+                           ('combobox_disk_format', disk_format)])
 
-            form.combobox_disk_format.value = disk_format
+            form.fill(values)
             form.submit()
 
         if check:
@@ -72,7 +73,27 @@ class ImagesSteps(BaseSteps):
             page_images.table_images.row(
                 name=image_name).wait_for_status('Active')
 
-    @pom.timeit('Step')
+    @timeit('Step')
+    def create_images(self, image_names, check=True):
+        """Step to create images.
+
+        All images are submitted before waiting, then they are waited
+        together, so step lasts as long as the slowest image creation.
+
+        Returns:
+            - dict, seconds which each image took to become active.
+        """
+        for image_name in image_names:
+            self.create_image(image_name, check=False)
+            self.close_notification('success')
+
+        if check:
+            creation_times = self.page_images(
+            ).table_images.wait_for_rows_status(image_names, 'Active')
+            LOGGER.info('Images creation times: {}'.format(creation_times))
+            return creation_times
+
+    @timeit('Step')
     def delete_image(self, image_name, check=True):
         """Step to delete image."""
         page_images = self.page_images()
@@ -89,7 +110,7 @@ class ImagesSteps(BaseSteps):
             page_images.table_images.row(
                 name=image_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_images(self, image_names, check=True):
         """Step to delete images."""
         page_images = self.page_images()
@@ -107,7 +128,7 @@ class ImagesSteps(BaseSteps):
                 page_images.table_images.row(
                     name=image_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_metadata(self, image_name, metadata, check=True):
         """Step to update image metadata."""
         page_images = self.page_images()
@@ -129,7 +150,7 @@ class ImagesSteps(BaseSteps):
             page_images.table_images.row(
                 name=image_name, status='Active').wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def get_metadata(self, image_name):
         """Step to get image metadata."""
         metadata = {}
@@ -141,15 +162,14 @@ class ImagesSteps(BaseSteps):
             menu.button_toggle.click()
             menu.item_update_metadata.click()
 
-        for row in page_images.form_update_metadata.list_metadata.rows:
-            metadata[row.field_metadata_name.value] = \
-                row.field_metadata_value.value
+        for row in page_images.form_update_metadata.list_metadata.snapshot():
+            metadata[row.cell('name')] = row.cell('value')
 
         page_images.form_update_metadata.cancel()
 
         return metadata
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_image(self, image_name, new_image_name=None, protected=False,
                      check=True):
         """Step to update image."""
@@ -179,7 +199,7 @@ class ImagesSteps(BaseSteps):
                 name=new_image_name or image_name,
                 status='Active').wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def view_image(self, image_name, check=True):
         """Step to view image."""
         self.page_images().table_images.row(
@@ -189,7 +209,7 @@ class ImagesSteps(BaseSteps):
             assert self.app.page_image.info_image.label_name.value \
                 == image_name
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_volume(self, image_name, volume_name, check=True):
         """Step to create volume from image."""
         page_images = self.page_images()
@@ -206,7 +226,7 @@ class ImagesSteps(BaseSteps):
         if check:
             self.close_notification('info')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def launch_instance(self, image_name, instance_name, network_name,
                         check=True):
         """Step to launch instance from image."""
@@ -216,6 +236,8 @@ class ImagesSteps(BaseSteps):
                 name=image_name).dropdown_menu as menu:
             menu.item_default.click()
 
+        assert page_images.activity.wait_for_idle(), \
+            "Launch instance form isn't loaded"
         with page_images.form_launch_instance as form:
 
             with form.tab_details as tab:
@@ -17,10 +17,9 @@ Instances steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
-from waiting import wait
-
 from horizon_autotests import EVENT_TIMEOUT, UI_TIMEOUT
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import wait
 
 from .base import BaseSteps
 
@@ -32,13 +31,15 @@ class InstancesSteps(BaseSteps):
         """Open instances page if it isn't opened."""
         return self._open(self.app.page_instances)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_instance(self, instance_name, network_name='admin_internal_net',
                         count=1, check=True):
         """Step to create instance."""
         page_instances = self.page_instances()
 
         page_instances.button_launch_instance.click()
+        assert page_instances.activity.wait_for_idle(), \
+            "Launch instance form isn't loaded"
         with page_instances.form_launch_instance as form:
 
             with form.tab_details as tab:
@@ -78,7 +79,7 @@ class InstancesSteps(BaseSteps):
 
         return instance_names
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_instances(self, instance_names, check=True):
         """Step to delete instances."""
         page_instances = self.page_instances()
@@ -96,7 +97,7 @@ class InstancesSteps(BaseSteps):
                 page_instances.table_instances.row(
                     name=instance_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_instance(self, instance_name, check=True):
         """Step to delete instance."""
         page_instances = self.page_instances()
@@ -113,7 +114,7 @@ class InstancesSteps(BaseSteps):
             page_instances.table_instances.row(
                 name=instance_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def lock_instance(self, instance_name, check=True):
         """Step to lock instance."""
         with self.page_instances().table_instances.row(
@@ -124,7 +125,7 @@ class InstancesSteps(BaseSteps):
         if check:
             self.close_notification('success')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def unlock_instance(self, instance_name, check=True):
         """Step to unlock instance."""
         with self.page_instances().table_instances.row(
@@ -135,7 +136,7 @@ class InstancesSteps(BaseSteps):
         if check:
             self.close_notification('success')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def view_instance(self, instance_name, check=True):
         """Step to view instance."""
         self.page_instances().table_instances.row(
@@ -145,7 +146,7 @@ class InstancesSteps(BaseSteps):
             assert self.app.page_instance.info_instance.label_name.value \
                 == instance_name
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def filter_instances(self, query, check=True):
         """Step to filter instances."""
         page_instances = self.page_instances()
@@ -155,15 +156,14 @@ class InstancesSteps(BaseSteps):
 
         if check:
             def check_rows():
-                for row in page_instances.table_instances.rows:
-                    if not (row.is_present and
-                            query in row.link_instance.value):
-                        return False
-                return True
+                table = page_instances.table_instances
+                names = table.snapshot().column('name')
+                return all(query in (name or '') for name in names)
 
-            wait(check_rows, timeout_seconds=UI_TIMEOUT, sleep_seconds=0.1)
+            wait(check_rows, UI_TIMEOUT,
+                 name='InstancesSteps.filter_instances')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def reset_instances_filter(self):
         """Step to reset instances filter."""
         page_instances = self.page_instances()
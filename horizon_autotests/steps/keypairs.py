@@ -17,7 +17,7 @@ Keypairs steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -31,7 +31,7 @@ class KeypairsSteps(BaseSteps):
             page.label_keypairs.click()
             return page.tab_keypairs
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_keypair(self, keypair_name, check=True):
         """Step to create keypair."""
         tab_keypairs = self.tab_keypairs()
@@ -45,7 +45,7 @@ class KeypairsSteps(BaseSteps):
             self.tab_keypairs().table_keypairs.row(
                 name=keypair_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_keypair(self, keypair_name, check=True):
         """Step to delete keypair."""
         tab_keypairs = self.tab_keypairs()
@@ -59,15 +59,15 @@ class KeypairsSteps(BaseSteps):
             tab_keypairs.table_keypairs.row(
                 name=keypair_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def import_keypair(self, keypair_name, public_key, check=True):
         """Step to import keypair."""
         tab_keypairs = self.tab_keypairs()
         tab_keypairs.button_import_keypair.click()
 
         with tab_keypairs.form_import_keypair as form:
-            form.field_name.value = keypair_name
-            form.field_public_key.value = public_key
+            form.fill([('field_name', keypair_name),
+                       ('field_public_key', public_key)])
             form.submit()
 
         if check:
@@ -75,7 +75,7 @@ class KeypairsSteps(BaseSteps):
             tab_keypairs.table_keypairs.row(
                 name=keypair_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_keypairs(self, keypair_names, check=True):
         """Step to delete keypairs."""
         tab_keypairs = self.tab_keypairs()
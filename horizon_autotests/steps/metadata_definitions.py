@@ -17,7 +17,7 @@ Metadata definitions steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -51,7 +51,7 @@ class NamespacesSteps(BaseSteps):
         """Open namespaces page if it isn't opened."""
         return self._open(self.app.page_metadata_definitions)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_namespace(self, namespace_name, namespace_source='Direct Input',
                          check=True):
         """Step to create namespace."""
@@ -59,9 +59,9 @@ class NamespacesSteps(BaseSteps):
         page_metadata_definitions.button_import_namespace.click()
 
         with page_metadata_definitions.form_import_namespace as form:
-            form.combobox_namespace_source.value = namespace_source
-            form.field_namespace_json.value = \
-                NAMESPACE_TEMPLATE % {'name': namespace_name}
+            form.fill([('combobox_namespace_source', namespace_source),
+                       ('field_namespace_json',
+                        NAMESPACE_TEMPLATE % {'name': namespace_name})])
             form.submit()
 
         if check:
@@ -69,7 +69,7 @@ class NamespacesSteps(BaseSteps):
             page_metadata_definitions.table_namespaces.row(
                 name=namespace_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_namespace(self, namespace_name, check=True):
         """Step to delete namespace."""
         page_metadata_definitions = self.page_metadata_definitions()
@@ -17,8 +17,8 @@ Networks steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
-from waiting import wait
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import wait
 
 from .base import BaseSteps
 
@@ -34,7 +34,7 @@ class NetworksSteps(BaseSteps):
         """Open admin networks page if it isn't opened."""
         return self._open(self.app.page_admin_networks)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_network(self, network_name, shared=False, create_subnet=False,
                        subnet_name='subnet', network_adress='192.168.0.0/24',
                        gateway_ip='192.168.0.1', check=True):
@@ -69,7 +69,7 @@ class NetworksSteps(BaseSteps):
             page_networks.table_networks.row(
                 name=network_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_network(self, network_name, check=True):
         """Step to delete network."""
         page_networks = self.page_networks()
@@ -86,7 +86,7 @@ class NetworksSteps(BaseSteps):
             page_networks.table_networks.row(
                 name=network_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_networks(self, network_names, check=True):
         """Step to delete networks as batch."""
         page_networks = self.page_networks()
@@ -104,7 +104,7 @@ class NetworksSteps(BaseSteps):
                 page_networks.table_networks.row(
                     name=network_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def add_subnet(self, network_name, subnet_name,
                    network_address='10.109.3.0/24', check=True):
         """Step to add subnet for network."""
@@ -128,7 +128,7 @@ class NetworksSteps(BaseSteps):
                 name=subnet_name,
                 network_address=network_address).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def admin_update_network(self, network_name, new_network_name=False,
                              shared=False, check=True):
         """Step to update network as admin."""
@@ -152,7 +152,7 @@ class NetworksSteps(BaseSteps):
             page_networks.table_networks.row(
                 name=new_network_name or network_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def admin_delete_network(self, network_name, check=True):
         """Step to delete network as admin."""
         page_networks = self.page_admin_networks()
@@ -169,22 +169,22 @@ class NetworksSteps(BaseSteps):
             page_networks.table_networks.row(
                 name=network_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def admin_filter_networks(self, query, check=True):
         """Step to filter networks."""
         page_networks = self.page_admin_networks()
 
         page_networks.field_filter_networks.value = query
+        token = page_networks.activity.get_page_token()
         page_networks.button_filter_networks.click()
-        pom.sleep(1, 'Wait table will be refreshed')
+        # filter reloads page
+        assert page_networks.activity.wait_for_reload(token), \
+            "Networks table isn't refreshed"
 
         if check:
 
             def check_rows():
-                for row in page_networks.table_networks.rows:
-                    if not (row.is_present and
-                            query in row.link_network.value):
-                        return False
-                return True
+                names = page_networks.table_networks.snapshot().column('name')
+                return all(query in (name or '') for name in names)
 
-            wait(check_rows, timeout_seconds=10, sleep_seconds=0.1)
+            wait(check_rows, 10, name='NetworksSteps.admin_filter_networks')
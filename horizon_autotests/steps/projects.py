@@ -17,8 +17,8 @@ Projects steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
-from waiting import wait
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import wait
 
 from .base import BaseSteps
 
@@ -30,7 +30,7 @@ class ProjectsSteps(BaseSteps):
         """Open projects page if it isn't opened."""
         return self._open(self.app.page_projects)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_project(self, project_name, check=True):
         """Step to create project."""
         page_projects = self.page_projects()
@@ -45,7 +45,7 @@ class ProjectsSteps(BaseSteps):
             page_projects.table_projects.row(
                 name=project_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_project(self, project_name, check=True):
         """Step to delete project."""
         page_projects = self.page_projects()
@@ -62,22 +62,22 @@ class ProjectsSteps(BaseSteps):
             page_projects.table_projects.row(
                 name=project_name).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def filter_projects(self, query, check=True):
         """Step to filter projects."""
         page_projects = self.page_projects()
 
         page_projects.field_filter_projects.value = query
+        token = page_projects.activity.get_page_token()
         page_projects.button_filter_projects.click()
-        pom.sleep(1, 'Wait table will be refreshed')
+        # filter reloads page
+        assert page_projects.activity.wait_for_reload(token), \
+            "Projects table isn't refreshed"
 
         if check:
 
             def check_rows():
-                for row in page_projects.table_projects.rows:
-                    if not (row.is_present and
-                            query in row.link_project.value):
-                        return False
-                return True
+                names = page_projects.table_projects.snapshot().column('name')
+                return all(query in (name or '') for name in names)
 
-            wait(check_rows, timeout_seconds=10, sleep_seconds=0.1)
+            wait(check_rows, 10, name='ProjectsSteps.filter_projects')
@@ -17,7 +17,7 @@ Settings steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
+from horizon_autotests.profiling import timeit
 
 from .base import BaseSteps
 
@@ -29,7 +29,7 @@ class SettingsSteps(BaseSteps):
         """Open settings page if it isn't opened."""
         return self._open(self.app.page_settings)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_settings(self,
                         lang=None,
                         timezone=None,
@@ -52,7 +52,7 @@ class SettingsSteps(BaseSteps):
             self.close_notification('success')
 
     @property
-    @pom.timeit('Step')
+    @timeit('Step')
     def current_settings(self):
         """Current user settings."""
         with self.page_settings().form_settings as form:
@@ -66,7 +66,7 @@ class SettingsSteps(BaseSteps):
         """Open page to change user password if it isn't opened."""
         return self._open(self.app.page_password)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def change_user_password(self, current_password, new_password, check=True):
         """Step to change user password."""
         page_password = self.page_password()
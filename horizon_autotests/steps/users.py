@@ -17,8 +17,8 @@ Users steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
-from waiting import wait
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import wait
 
 from .base import BaseSteps
 
@@ -30,7 +30,7 @@ class UsersSteps(BaseSteps):
         """Open users page if it isn't opened."""
         return self._open(self.app.page_users)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_user(self, username, password, project=None, role=None,
                     check=True):
         """Step to create user."""
@@ -55,7 +55,7 @@ class UsersSteps(BaseSteps):
             self.close_notification('success')
             page_users.table_users.row(name=username).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_user(self, username, check=True):
         """Step to delete user."""
         page_users = self.page_users()
@@ -70,7 +70,7 @@ class UsersSteps(BaseSteps):
             self.close_notification('success')
             page_users.table_users.row(name=username).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_users(self, usernames, check=True):
         """Step to delete users."""
         page_users = self.page_users()
@@ -87,7 +87,7 @@ class UsersSteps(BaseSteps):
             for username in usernames:
                 page_users.table_users.row(name=username).wait_for_absence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def change_user_password(self, username, new_password, check=True):
         """Step to change user password."""
         page_users = self.page_users()
@@ -104,40 +104,44 @@ class UsersSteps(BaseSteps):
         if check:
             self.close_notification('success')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def filter_users(self, query, check=True):
         """Step to filter users."""
         page_users = self.page_users()
 
         page_users.field_filter_users.value = query
+        token = page_users.activity.get_page_token()
         page_users.button_filter_users.click()
-        pom.sleep(1, 'Wait table will be refreshed')
+        # filter reloads page
+        assert page_users.activity.wait_for_reload(token), \
+            "Users table isn't refreshed"
 
         if check:
 
             def check_rows():
-                for row in page_users.table_users.rows:
-                    if not (row.is_present and
-                            query in row.link_username.value):
-                        return False
-                return True
+                usernames = page_users.table_users.snapshot().column('name')
+                return all(query in (username or '')
+                           for username in usernames)
 
-            wait(check_rows, timeout_seconds=10, sleep_seconds=0.1)
+            wait(check_rows, 10, name='UsersSteps.filter_users')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def sort_users(self, reverse=False, check=True):
         """Step to sort users."""
-        with self.page_users().table_users as table:
+        page_users = self.page_users()
+        with page_users.table_users as table:
 
             table.header.cell('name').click()
             if reverse:
                 table.header.cell('name').click()
-            pom.sleep(1, 'Wait table will be refreshed')
+            assert page_users.activity.wait_for_idle(), \
+                "Users table isn't refreshed"
 
             if check:
 
                 def check_sort():
-                    usernames = [row.link_username.value for row in table.rows]
+                    usernames = [username or '' for username in
+                                 table.snapshot().column('name')]
                     expected_usernames = sorted(usernames)
 
                     if reverse:
@@ -145,9 +149,9 @@ class UsersSteps(BaseSteps):
 
                     return usernames == expected_usernames
 
-            wait(check_sort, timeout_seconds=10, sleep_seconds=0.1)
+            wait(check_sort, 10, name='UsersSteps.sort_users')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def toggle_user(self, username, enable, check=True):
         """Step to disable user."""
         if enable:
@@ -168,7 +172,7 @@ class UsersSteps(BaseSteps):
                 self.close_notification('success')
                 assert row.cell('enabled').value == need_status
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_user(self, username, new_username, check=True):
         """Step to update user."""
         page_users = self.page_users()
@@ -17,13 +17,16 @@ Volumes steps.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pom
-from waiting import wait
+import logging
 
 from horizon_autotests import EVENT_TIMEOUT
+from horizon_autotests.profiling import timeit
+from horizon_autotests.waits import LONG_OPERATION, wait
 
 from .base import BaseSteps
 
+LOGGER = logging.getLogger(__name__)
+
 
 class VolumesSteps(BaseSteps):
     """Volumes steps."""
@@ -38,7 +41,7 @@ class VolumesSteps(BaseSteps):
             page.label_volumes.click()
             return page.tab_volumes
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_volume(self, volume_name, source_type='Image', volume_type='',
                       check=True):
         """Step to create volume."""
@@ -46,17 +49,18 @@ class VolumesSteps(BaseSteps):
         tab_volumes.button_create_volume.click()
 
         with tab_volumes.form_create_volume as form:
-            form.field_name.value = volume_name
-            form.combobox_source_type.value = source_type
+            form.fill([('field_name', volume_name),
+                       ('combobox_source_type', source_type)])
 
             image_sources = form.combobox_image_source.values
-            form.combobox_image_source.value = image_sources[-1]
+            values = [('combobox_image_source', image_sources[-1])]
 
             if volume_type is not None:
                 if not volume_type:
                     volume_type = form.combobox_volume_type.values[-1]
-                form.combobox_volume_type.value = volume_type
+                values.append(('combobox_volume_type', volume_type))
 
+            form.fill(values)
             form.submit()
 
         if check:
@@ -64,7 +68,27 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=volume_name).wait_for_status('Available')
 
-    @pom.timeit('Step')
+    @timeit('Step')
+    def create_volumes(self, volume_names, check=True):
+        """Step to create volumes.
+
+        All volumes are submitted before waiting, then they are waited
+        together, so step lasts as long as the slowest volume creation.
+
+        Returns:
+            - dict, seconds which each volume took to become available.
+        """
+        for volume_name in volume_names:
+            self.create_volume(volume_name, check=False)
+            self.close_notification('info')
+
+        if check:
+            creation_times = self.tab_volumes(
+            ).table_volumes.wait_for_rows_status(volume_names, 'Available')
+            LOGGER.info('Volumes creation times: {}'.format(creation_times))
+            return creation_times
+
+    @timeit('Step')
     def delete_volume(self, volume_name, check=True):
         """Step to delete volume."""
         tab_volumes = self.tab_volumes()
@@ -81,7 +105,7 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=volume_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def edit_volume(self, volume_name, new_volume_name, check=True):
         """Step to edit volume."""
         tab_volumes = self.tab_volumes()
@@ -97,7 +121,7 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=new_volume_name).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_volumes(self, volume_names, check=True):
         """Step to delete volumes."""
         tab_volumes = self.tab_volumes()
@@ -115,7 +139,7 @@ class VolumesSteps(BaseSteps):
                 tab_volumes.table_volumes.row(
                     name=volume_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def view_volume(self, volume_name, check=True):
         """Step to view volume."""
         self.tab_volumes().table_volumes.row(
@@ -125,7 +149,7 @@ class VolumesSteps(BaseSteps):
             assert self.app.page_volume.info_volume.label_name.value \
                 == volume_name
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def change_volume_type(self, volume_name, volume_type=None, check=True):
         """Step to change volume type."""
         tab_volumes = self.tab_volumes()
@@ -146,7 +170,7 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=volume_name, type=volume_type).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def upload_volume_to_image(self, volume_name, image_name, check=True):
         """Step to upload volume to image."""
         tab_volumes = self.tab_volumes()
@@ -165,7 +189,7 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=volume_name).wait_for_status('Available')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def extend_volume(self, volume_name, new_size=2, check=True):
         """Step to extend volume size."""
         tab_volumes = self.tab_volumes()
@@ -194,7 +218,7 @@ class VolumesSteps(BaseSteps):
             page.label_volumes.click()
             return page.tab_volumes
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def change_volume_status(self, volume_name, status=None, check=True):
         """Step to change volume status."""
         tab_volumes = self.tab_admin_volumes()
@@ -215,7 +239,7 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=volume_name, status=status).wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def launch_volume_as_instance(self, volume_name, instance_name,
                                   network_name, count=1, check=True):
         """Step to launch volume as instance."""
@@ -226,6 +250,8 @@ class VolumesSteps(BaseSteps):
             menu.button_toggle.click()
             menu.item_launch_volume_as_instance.click()
 
+        assert tab_volumes.activity.wait_for_idle(), \
+            "Launch instance form isn't loaded"
         with tab_volumes.form_launch_instance as form:
 
             with form.tab_details as tab:
@@ -244,7 +270,7 @@ class VolumesSteps(BaseSteps):
 
             form.submit()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def attach_instance(self, volume_name, instance_name, check=True):
         """Step to attach instance."""
         tab_volumes = self.tab_volumes()
@@ -267,7 +293,7 @@ class VolumesSteps(BaseSteps):
                 row.wait_for_status('In-use')
                 assert instance_name in row.cell('attached_to').value
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def detach_instance(self, volume_name, instance_name, check=True):
         """Step to detach instance."""
         tab_volumes = self.tab_volumes()
@@ -287,7 +313,7 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=volume_name).wait_for_status('Available')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_transfer(self, volume_name, transfer_name, check=True):
         """Step to create transfer."""
         tab_volumes = self.tab_volumes()
@@ -314,7 +340,7 @@ class VolumesSteps(BaseSteps):
 
             return transfer_id, transfer_key
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def accept_transfer(self, transfer_id, transfer_key, volume_name,
                         check=True):
         """Step to accept transfer."""
@@ -332,7 +358,7 @@ class VolumesSteps(BaseSteps):
             tab_volumes.table_volumes.row(
                 name=volume_name, status='Available').wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def migrate_volume(self, volume_name, new_host=None, check=True):
         """Step to migrate host."""
         tab_volumes = self.tab_admin_volumes()
@@ -366,7 +392,8 @@ class VolumesSteps(BaseSteps):
                 return not page_volumes.tab_volumes.table_volumes.row(
                     name=volume_name, host=old_host).is_present
 
-            wait(is_old_host_volume_absent, timeout_seconds=EVENT_TIMEOUT * 2)
+            wait(is_old_host_volume_absent, EVENT_TIMEOUT * 2, LONG_OPERATION,
+                 name='VolumesSteps.migrate_volume')
 
             return old_host, new_host
 
@@ -382,7 +409,7 @@ class VolumesSteps(BaseSteps):
             page.label_backups.click()
             return page.tab_backups
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_snapshot(self, volume_name, snapshot_name, description=None,
                         check=True):
         """Step to create volume snapshot."""
@@ -404,7 +431,7 @@ class VolumesSteps(BaseSteps):
             self.tab_snapshots().table_snapshots.row(
                 name=snapshot_name, status='Available').wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_snapshot(self, snapshot_name, check=True):
         """Step to delete volume snapshot."""
         tab_snapshots = self.tab_snapshots()
@@ -421,7 +448,7 @@ class VolumesSteps(BaseSteps):
             tab_snapshots.table_snapshots.row(
                 name=snapshot_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_snapshots(self, snapshot_names, check=True):
         """Step to delete volume snapshots."""
         tab_snapshots = self.tab_snapshots()
@@ -439,7 +466,7 @@ class VolumesSteps(BaseSteps):
                 tab_snapshots.table_snapshots.row(
                     name=snapshot_name).wait_for_absence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def update_snapshot(self, snapshot_name, new_snapshot_name,
                         description=None, check=True):
         """Step to update volume snapshot."""
@@ -462,7 +489,7 @@ class VolumesSteps(BaseSteps):
                 name=new_snapshot_name,
                 status='Available').wait_for_presence()
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_volume_from_snapshot(self, snapshot_name, check=True):
         """Step to create volume from spanshot."""
         tab_snapshots = self.tab_snapshots()
@@ -479,7 +506,7 @@ class VolumesSteps(BaseSteps):
             self.tab_volumes().table_volumes.row(
                 name=snapshot_name).wait_for_status('Available')
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def create_backup(self, volume_name, backup_name, description=None,
                       container=None, check=True):
         """Step to create volume backup."""
@@ -507,7 +534,7 @@ class VolumesSteps(BaseSteps):
                 name=backup_name,
                 status='Available').wait_for_presence(EVENT_TIMEOUT)
 
-    @pom.timeit('Step')
+    @timeit('Step')
     def delete_backups(self, backup_names, check=True):
         """Step to delete volume backups."""
         tab_backups = self.tab_backups()
@@ -17,29 +17,192 @@ Fixtures aggregator.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import glob
+import json
+import logging
 import os
 import shutil
+import threading
+import uuid
 
 import pytest
 
+from horizon_autotests import profiling, waits
+
 from .fixtures import *  # noqa
-from .fixtures._config import TEST_REPORTS_DIR, XVFB_LOCK
-from .fixtures._utils import slugify
+from .fixtures._config import (BROWSER_POOL_DIR,
+                               DISPLAY_BASE,
+                               DURATIONS_FILE,
+                               HEADLESS,
+                               SCHEDULING,
+                               TEST_DEADLINE,
+                               TEST_REPORTS_DIR,
+                               TIMINGS_DIR,
+                               VIDEO_CAPTURE,
+                               VIRTUAL_DISPLAY)
+from .fixtures._display import get_display_number, VirtualDisplay
+from .fixtures._scheduling import (DurationsHistory,
+                                   estimate_durations,
+                                   LongestFirstScheduling,
+                                   predict_makespan,
+                                   RunDurations)
+from .fixtures._sharing import group_items, READ_ONLY_MARKER
+from .fixtures._utils import (get_worker_id,
+                              get_worker_input,
+                              get_worker_output,
+                              slugify)
+
+LOGGER = logging.getLogger(__name__)
+RUN_DURATIONS = RunDurations()
 
 
 def pytest_configure(config):
     """Pytest configure hook."""
-    if not hasattr(config, 'slaveinput'):
+    config.addinivalue_line(
+        'markers', READ_ONLY_MARKER + '(*fixture_names): test only reads '
+        'resources of fixtures, so they are shared with neighbour tests')
+
+    if get_worker_input(config) is None:
         # on xdist-master node do all the important stuff
-        if os.path.exists(TEST_REPORTS_DIR):
-            shutil.rmtree(TEST_REPORTS_DIR)
-        if os.path.exists(XVFB_LOCK):
-            os.remove(XVFB_LOCK)
+        _remove_in_background(TEST_REPORTS_DIR)
+
+    config.virtual_display = None
+    if _is_test_runner(config) and VIRTUAL_DISPLAY and not HEADLESS:
+        # X server is launched early and its start is overlapped with
+        # collection, fixture only waits its readiness
+        number = get_display_number(get_worker_id(config), DISPLAY_BASE)
+        depth = 16 if VIDEO_CAPTURE == 'off' else 24
+        config.virtual_display = VirtualDisplay(number, depth=depth).start()
+
+
+def pytest_unconfigure(config):
+    """Pytest unconfigure hook."""
+    if getattr(config, 'virtual_display', None):
+        config.virtual_display.stop()
+
+
+def _is_test_runner(config):
+    # xdist-master node doesn't launch tests if workers are requested
+    return (get_worker_input(config) is not None or
+            not getattr(config.option, 'numprocesses', None))
+
+
+def _remove_in_background(path):
+    # directory is renamed instantly and is deleted in background together
+    # with leftovers of previous runs
+    if os.path.exists(path):
+        os.rename(path, '{}.old.{}'.format(path, uuid.uuid4().hex))
+
+    def remove():
+        for old_path in glob.glob(path + '.old.*'):
+            shutil.rmtree(old_path, ignore_errors=True)
+
+    threading.Thread(target=remove).start()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Pytest hook to order tests.
+
+    The longest tests are launched first. Tests sharing read-only
+    resources are put in row and are marked to be sent to the same worker
+    with ``--dist loadgroup``.
+    """
+    if SCHEDULING == 'history':
+        _schedule_longest_first(config, items)
+
+    group_names = group_items(items)
+    for item in items:
+        if item.nodeid in group_names:
+            item.add_marker(
+                pytest.mark.xdist_group(name=group_names[item.nodeid]))
+
+
+def _schedule_longest_first(config, items):
+    # durations of tests are taken from history of previous runs,
+    # collection order is kept for tests with equal durations, so all
+    # xdist workers get the same order
+    history = DurationsHistory(DURATIONS_FILE)
+    estimates = estimate_durations(items, history.durations)
+    items.sort(key=lambda item: estimates[item.nodeid], reverse=True)
+
+    schedule = {'estimates': estimates,
+                'known': sum(nodeid in history.durations
+                             for nodeid in estimates)}
+    worker_output = get_worker_output(config)
+    if worker_output is not None:
+        worker_output['schedule'] = schedule
+    else:
+        config.schedule = schedule
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Pytest xdist hook to hand out the longest tests first.
+
+    Default xdist scheduling sends blocks of consecutive tests to workers,
+    so the longest tests would be piled up at one worker.
+    """
+    if (SCHEDULING != 'history' or
+            config.getoption('dist') not in ('load', 'loadgroup')):
+        return None
+
+    config.longest_first = True
+    return LongestFirstScheduling(config, log)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Pytest xdist hook to get estimated durations of tests from worker."""
+    schedule = (get_worker_output(node) or {}).get('schedule')
+    if schedule:
+        node.config.schedule = schedule
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Pytest hook to limit time of waits of test setup and call."""
+    if TEST_DEADLINE:
+        waits.set_deadline(TEST_DEADLINE)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Pytest hook to let fixtures know next test before teardown.
+
+    Waits of teardown aren't limited by test deadline, so resources are
+    deleted even if test is out of time.
+    """
+    item.next_item = nextitem
+    waits.set_deadline(None)
+
+
+def pytest_runtest_logreport(report):
+    """Pytest hook to collect durations of tests."""
+    RUN_DURATIONS.add(report)
+
+
+def pytest_sessionfinish(session):
+    """Pytest hook to save durations of passed tests to history.
+
+    Only xdist-master saves it, because it gets reports of all workers.
+    """
+    if (get_worker_input(session.config) is not None or
+            not RUN_DURATIONS.passed):
+        return
+
+    history = DurationsHistory(DURATIONS_FILE)
+    history.update(RUN_DURATIONS.passed)
+    history.save()
 
 
 @pytest.mark.hookwrapper
 def pytest_runtest_makereport(item, call):
-    """Pytest hook to delete test report if it is passed."""
+    """Pytest hook to delete test report if it is passed.
+
+    If test is failed, buffered logs are written to report. If video isn't
+    captured, screenshot of failed test is taken.
+    """
     if not hasattr(item, 'is_passed'):
         item.is_passed = True
 
@@ -49,5 +212,199 @@ def pytest_runtest_makereport(item, call):
     if not rep.passed:
         item.is_passed = False
 
-    if rep.when == 'teardown' and item.is_passed:
-        shutil.rmtree(os.path.join(TEST_REPORTS_DIR, slugify(item.name)))
+        horizon = getattr(item, 'funcargs', {}).get('horizon')
+        if HEADLESS and horizon and rep.when in ('setup', 'call'):
+            _save_screenshot(horizon, item.name, rep.when)
+
+    if rep.when == 'teardown':
+        report_dir = os.path.join(TEST_REPORTS_DIR, slugify(item.name))
+        log_capture = getattr(item, 'log_capture', None)
+
+        if item.is_passed:
+            if os.path.isdir(report_dir):
+                shutil.rmtree(report_dir)
+        elif log_capture:
+            log_capture.flush(report_dir)
+
+
+def _save_screenshot(horizon, test_name, when):
+    report_dir = os.path.join(TEST_REPORTS_DIR, slugify(test_name))
+    if not os.path.isdir(report_dir):
+        os.makedirs(report_dir)
+    try:
+        horizon.webdriver.save_screenshot(
+            os.path.join(report_dir, 'screenshot_{}.png'.format(when)))
+    except Exception:
+        LOGGER.exception("Can't take screenshot of failed test")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Pytest hook to report browser pool stats and steps timings."""
+    _report_browser_pool(terminalreporter)
+
+    events = _load_timings()
+    if events is not None:
+        _report_timings(terminalreporter, events)
+        _report_waits(terminalreporter, events)
+
+    _report_schedule(terminalreporter)
+
+
+def _report_browser_pool(terminalreporter):
+    if not os.path.isdir(BROWSER_POOL_DIR):
+        return
+
+    summaries = {}
+    for file_name in sorted(os.listdir(BROWSER_POOL_DIR)):
+        with open(os.path.join(BROWSER_POOL_DIR, file_name)) as f:
+            stats = json.load(f)
+
+        summary = summaries.setdefault(stats.pop('browser', 'firefox'), {})
+        summary['peak_memory'] = max(summary.get('peak_memory', 0),
+                                     stats.pop('peak_memory', 0))
+        for key, value in stats.items():
+            if key != 'size':
+                summary[key] = summary.get(key, 0) + value
+        summary['workers'] = summary.get('workers', 0) + 1
+
+    terminalreporter.write_sep('-', 'browser pool')
+    for browser, summary in sorted(summaries.items()):
+        summary['mean_startup_time'] = \
+            summary['startup_time'] / (summary['created'] or 1)
+        terminalreporter.write_line(
+            '{browser}: workers: {workers}, browsers created: {created}, '
+            'reused: {reused}, discarded: {discarded}, '
+            'startup time: {startup_time:.2f} sec '
+            '(mean {mean_startup_time:.2f} sec), '
+            'saved time: {saved_time:.2f} sec, '
+            'peak worker memory: {peak_memory:.2f} MB'.format(
+                browser=browser, **summary))
+
+
+def _load_timings():
+    """Read timings events of all workers once or None."""
+    if not os.path.isdir(TIMINGS_DIR):
+        return None
+
+    paths = [os.path.join(TIMINGS_DIR, file_name)
+             for file_name in sorted(os.listdir(TIMINGS_DIR))
+             if file_name.endswith('.jsonl')]
+    return list(profiling.load_events(paths))
+
+
+def _report_timings(terminalreporter, events, limit=20):
+    """Merge timings of workers and report the slowest steps.
+
+    Full summary is saved to ``timings/summary.json``.
+    """
+    summary = profiling.summarize(events)
+    commands = profiling.summarize(events, 'commands')
+    wire_times = profiling.summarize(events, 'wire_time')
+    repeats = profiling.summarize(events, 'repeated_commands')
+    hit_rates = profiling.summarize(events, 'cache_hit_rate')
+
+    with open(os.path.join(TIMINGS_DIR, 'summary.json'), 'w') as f:
+        json.dump([dict(stats, kind=kind, name=name,
+                        commands=commands.get((kind, name)),
+                        wire_time=wire_times.get((kind, name)),
+                        repeated_commands=repeats.get((kind, name)),
+                        cache_hit_rate=hit_rates.get((kind, name)))
+                   for (kind, name), stats in sorted(summary.items())],
+                  f, indent=2)
+
+    terminalreporter.write_sep('-', 'steps timings')
+    terminalreporter.write_line(
+        '{:<50} {:>6} {:>8} {:>8} {:>8} {:>8} {:>8}'.format(
+            'step', 'count', 'mean', 'p50', 'p95', 'p99', 'max'))
+
+    steps = sorted(((name, stats) for (kind, name), stats in summary.items()
+                    if kind == 'Step'),
+                   key=lambda item: item[1]['total'], reverse=True)
+    for name, stats in steps[:limit]:
+        terminalreporter.write_line(
+            '{:<50} {count:>6} {mean:>8.2f} {p50:>8.2f} {p95:>8.2f} '
+            '{p99:>8.2f} {max:>8.2f}'.format(name, **stats))
+
+    terminalreporter.write_sep('-', 'webdriver commands per step')
+    terminalreporter.write_line(
+        '{:<50} {:>9} {:>9} {:>10} {:>9} {:>9}'.format(
+            'step', 'mean', 'max', 'wire time', 'repeated', 'hit rate'))
+
+    steps = sorted(((name, stats) for (kind, name), stats in commands.items()
+                    if kind == 'Step'),
+                   key=lambda item: item[1]['total'], reverse=True)
+    for name, stats in steps[:limit]:
+        terminalreporter.write_line(
+            '{:<50} {mean:>9.1f} {max:>9} {wire_time:>10.2f} '
+            '{repeated:>9.1f} {hit_rate:>9}'.format(
+                name, wire_time=wire_times[('Step', name)]['mean'],
+                repeated=repeats[('Step', name)]['mean'],
+                hit_rate=_format_rate(hit_rates.get(('Step', name))),
+                **stats))
+
+
+def _format_rate(stats):
+    if not stats:
+        return '-'
+    return '{:.0%}'.format(stats['mean'])
+
+
+def _report_waits(terminalreporter, events, limit=20):
+    """Report wait sites which issue the most polls."""
+    durations = profiling.summarize(events)
+    polls = profiling.summarize(events, 'polls')
+    wasted = profiling.summarize(events, 'wasted')
+
+    sites = sorted(((name, stats) for (kind, name), stats in polls.items()
+                    if kind == 'Wait'),
+                   key=lambda item: item[1]['total'], reverse=True)
+    if not sites:
+        return
+
+    terminalreporter.write_sep('-', 'waits')
+    terminalreporter.write_line(
+        '{:<50} {:>6} {:>8} {:>8} {:>9} {:>9}'.format(
+            'wait site', 'count', 'mean', 'polls', 'max polls', 'wasted'))
+    for name, stats in sites[:limit]:
+        terminalreporter.write_line(
+            '{:<50} {count:>6} {mean:>8.2f} {polls:>8.1f} {max:>9} '
+            '{wasted:>9.2f}'.format(
+                name, mean=durations[('Wait', name)]['mean'],
+                polls=stats['mean'],
+                wasted=wasted[('Wait', name)]['total'],
+                count=stats['count'], max=stats['max']))
+
+
+def _report_schedule(terminalreporter):
+    schedule = getattr(terminalreporter.config, 'schedule', None)
+    if not schedule or not RUN_DURATIONS.durations:
+        return
+
+    terminalreporter.write_sep('-', 'tests scheduling')
+    if not schedule['known']:
+        terminalreporter.write_line(
+            'no durations history yet, it is saved to {}'.format(
+                DURATIONS_FILE))
+        return
+
+    workers = len(RUN_DURATIONS.workers)
+    if workers > 1 and not getattr(terminalreporter.config, 'longest_first',
+                                   False):
+        terminalreporter.write_line(
+            'makespan is predicted only for --dist load or loadgroup')
+        return
+
+    # tests of one xdist group are handed out together
+    estimates = {}
+    for nodeid in RUN_DURATIONS.durations:
+        if nodeid in schedule['estimates']:
+            unit = RUN_DURATIONS.groups.get(nodeid, nodeid)
+            estimates[unit] = (estimates.get(unit, 0) +
+                               schedule['estimates'][nodeid])
+
+    terminalreporter.write_line(
+        'workers: {}, tests with history: {} of {}, '
+        'predicted makespan: {:.2f} sec, actual makespan: {:.2f} sec'.format(
+            workers, schedule['known'], len(schedule['estimates']),
+            predict_makespan(estimates.values(), workers),
+            RUN_DURATIONS.makespan))
@@ -23,6 +23,21 @@ from ._utils import generate_ids
 
 DASHBOARD_URL = os.environ['DASHBOARD_URL']
 VIRTUAL_DISPLAY = os.environ.get('VIRTUAL_DISPLAY')
+DISPLAY_BASE = int(os.environ.get('DISPLAY_BASE', 100))
+BROWSER_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', 1))
+NAVIGATION = os.environ.get('NAVIGATION', 'url')
+HANDLE_CACHE = os.environ.get('HANDLE_CACHE', 'on') != 'off'
+BROWSER = os.environ.get('BROWSER', 'firefox')
+HEADLESS = BROWSER.endswith('-headless')
+LOG_CAPTURE = os.environ.get('LOG_CAPTURE', 'buffer')
+LOG_BUFFER_SIZE = int(os.environ.get('LOG_BUFFER_SIZE', 10000))
+VIDEO_CAPTURE = os.environ.get('VIDEO_CAPTURE', 'full')
+VIDEO_RING_SECONDS = int(os.environ.get('VIDEO_RING_SECONDS', 30))
+COMMAND_BUDGETS = os.environ.get('COMMAND_BUDGETS')
+TEST_DEADLINE = int(os.environ.get('TEST_DEADLINE', 0))
+PROVISIONING = os.environ.get('PROVISIONING', 'ui')
+SCHEDULING = os.environ.get('SCHEDULING', 'history')
+OS_AUTH_URL = os.environ.get('OS_AUTH_URL')
 
 DEFAULT_ADMIN_NAME, DEFAULT_ADMIN_PASSWD, DEFAULT_ADMIN_PROJECT = ['admin'] * 3
 ADMIN_NAME, ADMIN_PASSWD, ADMIN_PROJECT = list(generate_ids('admin', count=3))
@@ -32,4 +47,9 @@ INTERNAL_NETWORK_NAME = 'admin_internal_net'
 
 TEST_REPORTS_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), '..', 'test_reports'))
-XVFB_LOCK = '/tmp/xvfb.lock'
+BROWSER_POOL_DIR = os.path.join(TEST_REPORTS_DIR, 'browser_pool')
+TIMINGS_DIR = os.path.join(TEST_REPORTS_DIR, 'timings')
+# history is kept between runs, so it's outside of test reports
+DURATIONS_FILE = os.environ.get('DURATIONS_FILE', os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'horizon_autotests', 'test_durations.json'))
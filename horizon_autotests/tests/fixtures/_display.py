@@ -0,0 +1,117 @@
+"""
+Virtual X display of worker.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import socket
+import subprocess
+import time
+
+X11_SOCKET = '/tmp/.X11-unix/X{}'
+
+
+def get_display_number(worker_id, base):
+    """Get display number of xdist worker.
+
+    Arguments:
+        - worker_id: string, like "gw3" or "master".
+        - base: int, display number of master process.
+
+    Returns:
+        - int, display number, unique for each worker of run.
+    """
+    if worker_id == 'master':
+        return base
+    return base + 1 + int(worker_id.lstrip('gw'))
+
+
+class VirtualDisplay(object):
+    """Xvfb server on predefined display number.
+
+    Workers use different display numbers, so they start their servers in
+    parallel without locking.
+    """
+
+    def __init__(self, number, width=1920, height=1080, depth=24):
+        """Constructor.
+
+        Arguments:
+            - number: int, display number.
+            - width: int, screen width.
+            - height: int, screen height.
+            - depth: int, color depth.
+        """
+        self.number = number
+        self.screen = '{}x{}x{}'.format(width, height, depth)
+        self._popen = None
+        self._old_display = None
+
+    @property
+    def is_ready(self):
+        """Define whether X server accepts connections."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(X11_SOCKET.format(self.number))
+            return True
+        except socket.error:
+            return False
+        finally:
+            sock.close()
+
+    def start(self):
+        """Launch X server without waiting its readiness."""
+        if self.is_ready:
+            raise RuntimeError(
+                'Display :{} is busy already'.format(self.number))
+
+        # -noreset works around memory leak in Xvfb taken from:
+        # http://blog.jeffterrace.com/2012/07/xvfb-memory-leak-workaround.html
+        # and -ac disables X access control
+        with open(os.devnull, 'w') as fnull:
+            self._popen = subprocess.Popen(
+                ['Xvfb', ':{}'.format(self.number), '-screen', '0',
+                 self.screen, '-nolisten', 'tcp', '-noreset', '-ac'],
+                stdout=fnull, stderr=fnull)
+
+        self._old_display = os.environ.get('DISPLAY')
+        os.environ['DISPLAY'] = ':{}'.format(self.number)
+        return self
+
+    def wait_ready(self, timeout=30):
+        """Wait until X server accepts connections."""
+        limit = time.time() + timeout
+        while not self.is_ready:
+            if self._popen.poll() is not None:
+                raise RuntimeError('Xvfb on display :{} is exited with code '
+                                   '{}'.format(self.number,
+                                               self._popen.returncode))
+            if time.time() > limit:
+                raise RuntimeError('Xvfb on display :{} is not ready in {} '
+                                   'sec'.format(self.number, timeout))
+            time.sleep(0.05)
+
+    def stop(self):
+        """Stop X server."""
+        if self._old_display is None:
+            os.environ.pop('DISPLAY', None)
+        else:
+            os.environ['DISPLAY'] = self._old_display
+
+        if self._popen and self._popen.poll() is None:
+            self._popen.terminate()
+            self._popen.wait()
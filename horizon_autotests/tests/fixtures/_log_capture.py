@@ -0,0 +1,133 @@
+"""
+Capture of test logs to in-memory buffers.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import logging
+import os
+import threading
+
+from six.moves import queue
+
+_STOP = object()
+
+
+class _QueueHandler(logging.Handler):
+    """Handler which only puts records to queue, so caller isn't blocked."""
+
+    def __init__(self, target, records):
+        super(_QueueHandler, self).__init__()
+        self.target = target
+        self.records = records
+
+    def prepare(self, record):
+        # message and traceback are rendered in caller thread, because args
+        # can be changed after logging call
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        try:
+            self.records.put_nowait((self.target, self.prepare(record)))
+        except Exception:
+            self.handleError(record)
+
+
+class LogCapture(object):
+    """Capture of test logs to bounded in-memory buffers.
+
+    Records are put to queue by test thread and formatted by background
+    thread. Buffers are written to files only on demand, e.g. if test is
+    failed.
+    """
+
+    def __init__(self, capacity=10000):
+        """Constructor.
+
+        Arguments:
+            - capacity: int, max count of records kept per log file, older
+              records are dropped.
+        """
+        self.capacity = capacity
+        self._records = queue.Queue()
+        self._buffers = {}
+        self._formatters = {}
+        self._handlers = []
+        self._thread = threading.Thread(target=self._listen)
+        self._thread.daemon = True
+
+    def capture(self, file_name, logger, formatter, level=logging.DEBUG,
+                filters=()):
+        """Capture records of logger to buffer of log file.
+
+        Arguments:
+            - file_name: string, name of log file.
+            - logger: logger to capture.
+            - formatter: formatter of records.
+            - level: min level of captured records.
+            - filters: filters of captured records.
+        """
+        self._buffers[file_name] = deque(maxlen=self.capacity)
+        self._formatters[file_name] = formatter
+
+        handler = _QueueHandler(file_name, self._records)
+        handler.setLevel(level)
+        for _filter in filters:
+            handler.addFilter(_filter)
+
+        logger.addHandler(handler)
+        self._handlers.append((logger, handler))
+
+    def start(self):
+        """Start formatting of records in background."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop capture and wait until all captured records are buffered."""
+        for logger, handler in self._handlers:
+            logger.removeHandler(handler)
+        self._handlers = []
+
+        self._records.put((None, _STOP))
+        self._thread.join()
+
+    def flush(self, folder):
+        """Write buffered logs to folder."""
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        for file_name, lines in self._buffers.items():
+            with open(os.path.join(folder, file_name), 'w') as f:
+                f.writelines(line + '\n' for line in lines)
+
+    def _listen(self):
+        while True:
+            file_name, record = self._records.get()
+            if record is _STOP:
+                return
+
+            try:
+                self._buffers[file_name].append(
+                    self._formatters[file_name].format(record))
+            except Exception:
+                pass  # broken record shouldn't stop capture
@@ -0,0 +1,232 @@
+"""
+Longest-first scheduling of tests by durations history.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import json
+import os
+
+from xdist.scheduler import LoadScheduling
+
+DEFAULT_DURATION = 1.0
+
+
+class DurationsHistory(object):
+    """Durations of tests in previous runs, saved to JSON file."""
+
+    def __init__(self, path, weight=0.5):
+        """Constructor.
+
+        Arguments:
+            - path: string, path to JSON file with durations.
+            - weight: float, weight of new duration in moving average.
+        """
+        self.path = path
+        self.weight = weight
+        self.durations = {}
+
+        if os.path.isfile(path):
+            with open(path) as f:
+                self.durations = json.load(f)
+
+    def update(self, durations):
+        """Update history with durations of current run."""
+        for nodeid, duration in durations.items():
+            previous = self.durations.get(nodeid)
+            if previous is not None:
+                duration = (previous * (1 - self.weight) +
+                            duration * self.weight)
+            self.durations[nodeid] = round(duration, 3)
+
+    def save(self):
+        """Save history to file."""
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        tmp_path = '{}.{}.tmp'.format(self.path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.rename(tmp_path, self.path)
+
+
+class RunDurations(object):
+    """Durations of tests of current run, collected from reports."""
+
+    def __init__(self):
+        """Constructor."""
+        self.durations = {}
+        self.failed = set()
+        self.workers = {}
+        self.groups = {}
+
+    def add(self, report):
+        """Add duration of test phase from report."""
+        # xdist appends group name to test id for --dist loadgroup
+        nodeid = report.nodeid.split('@')[0]
+        group = get_group(report.nodeid)
+        if group:
+            self.groups[nodeid] = group
+        self.durations[nodeid] = \
+            self.durations.get(nodeid, 0) + report.duration
+
+        if report.failed:
+            self.failed.add(nodeid)
+
+        # xdist-master gets reports of workers with worker node
+        node = getattr(report, 'node', None)
+        worker_id = node.gateway.id if node else 'master'
+        self.workers[worker_id] = \
+            self.workers.get(worker_id, 0) + report.duration
+
+    @property
+    def passed(self):
+        """Durations of passed tests only."""
+        return {nodeid: duration
+                for nodeid, duration in self.durations.items()
+                if nodeid not in self.failed}
+
+    @property
+    def makespan(self):
+        """Busy time of the most loaded worker."""
+        return max(self.workers.values()) if self.workers else 0
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """Xdist scheduling which hands out tests one by one in collection order.
+
+    Collection is sorted longest first, so worker which is free gets the
+    longest pending test. Tests of the same xdist group are handed out
+    together. Worker launches test only when it has the next one, so each
+    worker keeps one test ahead: the first round gives the longest tests to
+    all workers, the second one gives them the next tests.
+    """
+
+    def schedule(self):
+        """Initiate distribution of collected tests."""
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log('**Different tests collected, aborting run**')
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = range(len(self.collection))
+
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_unit(node)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        """Give the next test to worker if it has nothing to launch after
+        the current one.
+        """
+        if node.shutting_down:
+            return
+
+        if not self.pending:
+            node.shutdown()
+        elif len(self.node2pending[node]) < 2:
+            self._send_unit(node)
+
+    def _send_unit(self, node):
+        if not self.pending:
+            return
+
+        group = get_group(self.collection[self.pending[0]])
+        count = 1
+        while (group and count < len(self.pending) and
+               get_group(self.collection[self.pending[count]]) == group):
+            count += 1
+        self._send_tests(node, count)
+
+
+def get_group(nodeid):
+    """Get xdist group of test id or None."""
+    return nodeid.split('@', 1)[1] if '@' in nodeid else None
+
+
+def estimate_durations(items, durations):
+    """Estimate durations of collected tests.
+
+    Test without history is estimated as the longest mean duration of
+    known tests sharing any its fixture, except fixtures used by all tests.
+    If there isn't such fixture, median duration of known tests is used.
+
+    Arguments:
+        - items: list of collected test items.
+        - durations: dict of test durations history.
+
+    Returns:
+        - dict of estimated durations by test ids.
+    """
+    fixtures = {item.nodeid: set(getattr(item, 'fixturenames', ()))
+                for item in items}
+    common = set.intersection(*fixtures.values()) if fixtures else set()
+
+    known = [item.nodeid for item in items if item.nodeid in durations]
+    fixture_durations = {}
+    for nodeid in known:
+        for name in fixtures[nodeid] - common:
+            fixture_durations.setdefault(name, []).append(durations[nodeid])
+
+    means = {name: sum(values) / len(values)
+             for name, values in fixture_durations.items()}
+
+    default = DEFAULT_DURATION
+    if known:
+        default = sorted(durations[nodeid] for nodeid in known)[
+            len(known) // 2]
+
+    estimates = {}
+    for item in items:
+        if item.nodeid in durations:
+            estimates[item.nodeid] = durations[item.nodeid]
+        else:
+            estimates[item.nodeid] = max(
+                [means[name] for name in fixtures[item.nodeid] if
+                 name in means] or [default])
+    return estimates
+
+
+def predict_makespan(durations, workers):
+    """Predict makespan of longest-first scheduling.
+
+    Each next longest test or group of tests is given to the least loaded
+    worker.
+
+    Arguments:
+        - durations: iterable of durations of tests or groups of tests.
+        - workers: int, count of workers.
+
+    Returns:
+        - float, busy time of the most loaded worker.
+    """
+    loads = [0.0] * max(workers, 1)
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
@@ -0,0 +1,151 @@
+"""
+Sharing of resources between tests which only read them.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+READ_ONLY_MARKER = 'read_only'
+# fixtures which define credentials of test
+CREDENTIALS_FIXTURES = {'admin_only': 'admin', 'user_only': 'user'}
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_credentials(item):
+    """Get name of credentials which test is launched with."""
+    params = getattr(getattr(item, 'callspec', None), 'params', {})
+    if 'any_one' in params:
+        return params['any_one']
+
+    for fixture_name, credentials in CREDENTIALS_FIXTURES.items():
+        if fixture_name in getattr(item, 'fixturenames', ()):
+            return credentials
+
+
+def get_shared_keys(item):
+    """Get keys of resources which test only reads.
+
+    Test declares them with marker like ``@pytest.mark.read_only('volume')``.
+    Resource is shared only between tests with the same credentials.
+
+    Returns:
+        - set of (fixture name, credentials name) pairs.
+    """
+    credentials = get_credentials(item)
+    return {(fixture_name, credentials)
+            for marker in item.iter_markers(READ_ONLY_MARKER)
+            for fixture_name in marker.args
+            if fixture_name in getattr(item, 'fixturenames', ())}
+
+
+def group_items(items):
+    """Put tests sharing the same resources in row.
+
+    Group takes place of its first test, so order of groups and other
+    tests is kept.
+
+    Returns:
+        - dict of group names by test ids.
+    """
+    groups = {}
+    group_names = {}
+    for item in items:
+        keys = get_shared_keys(item)
+        if keys:
+            group = '-'.join(sorted('{}-{}'.format(*key) for key in keys))
+            groups.setdefault(group, []).append(item)
+            group_names[item.nodeid] = group
+
+    grouped_items = []
+    for item in items:
+        group = group_names.get(item.nodeid)
+        if group is None:
+            grouped_items.append(item)
+        elif group in groups:
+            grouped_items.extend(groups.pop(group))
+
+    items[:] = grouped_items
+    return group_names
+
+
+class SharedResources(object):
+    """Resources shared by consecutive read-only tests of worker.
+
+    Test which mutates resource gets private one always.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._resources = {}
+
+    def provide(self, request, steps, create, delete):
+        """Provide resource to test, it's generator for yield fixture.
+
+        Shared resource is deleted after test if next test doesn't read
+        it or if test is failed.
+
+        Arguments:
+            - request: pytest request of resource fixture.
+            - steps: steps of test to create and delete resource.
+            - create: callable to create resource.
+            - delete: callable to delete resource with steps, it takes
+              resource and steps.
+        """
+        key = (request.fixturename, get_credentials(request.node))
+
+        if key not in get_shared_keys(request.node):
+            resource = create()
+            yield resource
+            delete(resource, steps)
+            return
+
+        if key not in self._resources:
+            self._resources[key] = (create(), delete, type(steps))
+        else:
+            LOGGER.info('Reuse shared {!r}'.format(key))
+
+        yield self._resources[key][0]
+
+        next_item = getattr(request.node, 'next_item', None)
+        if (not getattr(request.node, 'is_passed', True) or
+                next_item is None or key not in get_shared_keys(next_item)):
+            resource, delete, _ = self._resources.pop(key)
+            delete(resource, steps)
+
+    @property
+    def leftovers(self):
+        """Keys of resources which are not deleted."""
+        return list(self._resources)
+
+    def delete_leftovers(self, get_steps):
+        """Delete resources which are left after tests.
+
+        Resource is left if test reading it is the last one, but next test
+        expected to read it is skipped or failed before resource request.
+        Failed deletion is logged and doesn't prevent deletion of others.
+
+        Arguments:
+            - get_steps: callable, which takes steps class and credentials
+              name and returns steps to delete resource.
+        """
+        for key in self.leftovers:
+            resource, delete, steps_cls = self._resources.pop(key)
+            try:
+                delete(resource, get_steps(steps_cls, key[1]))
+            except Exception:
+                LOGGER.exception("Can't delete shared {!r}".format(key))
@@ -96,6 +96,32 @@ def get_size(value, to):
             return value / v
 
 
+def get_worker_input(config):
+    """Get input of xdist worker or None if it isn't worker.
+
+    xdist>=2 names it ``workerinput``, older versions ``slaveinput``.
+    """
+    return getattr(config, 'workerinput',
+                   getattr(config, 'slaveinput', None))
+
+
+def get_worker_output(config_or_node):
+    """Get output of xdist worker or None if it isn't worker.
+
+    It's taken from worker config on worker and from worker node on master.
+    """
+    return getattr(config_or_node, 'workeroutput',
+                   getattr(config_or_node, 'slaveoutput', None))
+
+
+def get_worker_id(config):
+    """Get id of xdist worker or "master" if tests are launched without it."""
+    worker_input = get_worker_input(config)
+    if worker_input is None:
+        return 'master'
+    return worker_input.get('workerid', worker_input.get('slaveid'))
+
+
 def slugify(string):
     """Slugify test names to put test results in folder with test name."""
     return ''.join(s if s.isalnum() else '_' for s in string).strip('_')
@@ -17,28 +17,65 @@ Fixtures to run horizon, login, create demo user, etc.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import logging
 import os
 
 import pytest
 
-from horizon_autotests.app import Horizon
+from horizon_autotests.app import HorizonPool
 from horizon_autotests.steps import AuthSteps
 
-from ._config import DASHBOARD_URL
+from ._config import (BROWSER,
+                      BROWSER_POOL_DIR,
+                      BROWSER_POOL_SIZE,
+                      DASHBOARD_URL,
+                      ADMIN_NAME,
+                      ADMIN_PASSWD,
+                      ADMIN_PROJECT,
+                      HANDLE_CACHE,
+                      NAVIGATION,
+                      USER_NAME,
+                      USER_PASSWD,
+                      USER_PROJECT)
+from ._sharing import SharedResources
+from ._utils import get_worker_id
 
 __all__ = [
     'auth_steps',
     'horizon',
-    'login'
+    'horizon_pool',
+    'login',
+    'shared_resources'
 ]
 
+LOGGER = logging.getLogger(__name__)
+
+
+@pytest.yield_fixture(scope='session')
+def horizon_pool(request, virtual_display):
+    """Pool of launched browsers which are reused by tests of worker."""
+    pool = HorizonPool(DASHBOARD_URL, size=BROWSER_POOL_SIZE,
+                       navigation=NAVIGATION, browser=BROWSER,
+                       handle_cache=HANDLE_CACHE)
+    yield pool
+    pool.close()
+
+    LOGGER.info('Browser pool stats: {}'.format(pool.stats))
+    if not os.path.isdir(BROWSER_POOL_DIR):
+        os.makedirs(BROWSER_POOL_DIR)
+    stats_path = os.path.join(
+        BROWSER_POOL_DIR, get_worker_id(request.config) + '.json')
+    with open(stats_path, 'w') as f:
+        json.dump(pool.stats, f)
+
 
 @pytest.yield_fixture
-def horizon():
+def horizon(horizon_pool):
     """Initial fixture to start."""
-    app = Horizon(DASHBOARD_URL)
+    app = horizon_pool.acquire()
     yield app
-    app.quit()
+    horizon_pool.release(app)
 
 
 @pytest.fixture
@@ -51,12 +88,42 @@ def auth_steps(horizon):
 def login(auth_steps):
     """Login to horizon.
 
-    Majority of tests requires user login. Logs out after test.
+    Majority of tests requires user login. Session is cached per user and
+    project, so only cookies are flushed after test to keep it alive.
     """
-    auth_steps.login(os.environ['OS_LOGIN'], os.environ['OS_PASSWD'])
-    auth_steps.switch_project(os.environ['OS_PROJECT'])
+    auth_steps.login(os.environ['OS_LOGIN'], os.environ['OS_PASSWD'],
+                     project=os.environ['OS_PROJECT'])
 
     yield
-    # reload page to be sure that modal form doesn't prevent to logout
-    auth_steps.app.current_page.refresh()
-    auth_steps.logout()
+    auth_steps.app.flush_session()
+
+
+@pytest.yield_fixture(scope='session')
+def shared_resources(horizon_pool, test_env):
+    """Resources shared by tests of worker which only read them.
+
+    Resources left after tests are deleted at the end of session via
+    browser from pool.
+    """
+    resources = SharedResources()
+    yield resources
+
+    if not resources.leftovers:
+        return
+
+    LOGGER.warning('Delete left shared resources: {}'.format(
+        resources.leftovers))
+    credentials = {'admin': (ADMIN_NAME, ADMIN_PASSWD, ADMIN_PROJECT),
+                   'user': (USER_NAME, USER_PASSWD, USER_PROJECT)}
+    app = horizon_pool.acquire()
+
+    def _get_steps(steps_cls, credentials_name):
+        username, password, project = credentials[credentials_name]
+        app.flush_session()
+        AuthSteps(app).login(username, password, project=project)
+        return steps_cls(app)
+
+    try:
+        resources.delete_leftovers(_get_steps)
+    finally:
+        horizon_pool.release(app)
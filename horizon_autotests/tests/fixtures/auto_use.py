@@ -18,42 +18,51 @@ Auto use fixtures.
 # limitations under the License.
 
 import contextlib
+import json
 import logging
 import os
 
 import pytest
-import xvfbwrapper
 
-from horizon_autotests.app import Horizon
-from horizon_autotests.steps import (AuthSteps,
-                                     ProjectsSteps,
-                                     NetworksSteps,
-                                     UsersSteps)
-from horizon_autotests.third_party import VideoRecorder, Lock
+from horizon_autotests import profiling
+from horizon_autotests.provisioning import (ApiProvisioner,
+                                            StubServer,
+                                            UiProvisioner,
+                                            User)
+from horizon_autotests.third_party import VideoRecorder
 
 from ._config import (ADMIN_NAME,
                       ADMIN_PASSWD,
                       ADMIN_PROJECT,
-                      DASHBOARD_URL,
+                      COMMAND_BUDGETS,
                       DEFAULT_ADMIN_NAME,
                       DEFAULT_ADMIN_PASSWD,
                       DEFAULT_ADMIN_PROJECT,
                       FLOATING_NETWORK_NAME,
+                      HEADLESS,
                       INTERNAL_NETWORK_NAME,
+                      LOG_BUFFER_SIZE,
+                      LOG_CAPTURE,
+                      OS_AUTH_URL,
+                      PROVISIONING,
                       TEST_REPORTS_DIR,
+                      TIMINGS_DIR,
                       USER_NAME,
                       USER_PASSWD,
                       USER_PROJECT,
-                      VIRTUAL_DISPLAY,
-                      XVFB_LOCK)
-from ._utils import slugify
+                      VIDEO_CAPTURE,
+                      VIDEO_RING_SECONDS)
+from ._log_capture import LogCapture
+from ._utils import get_worker_id, slugify
 
 __all__ = [
     'logger',
     'report_dir',
     'video_capture',
     'virtual_display',
-    'test_env'
+    'test_env',
+    'timings',
+    'timings_sink'
 ]
 
 LOGGER = logging.getLogger(__name__)
@@ -61,163 +70,177 @@ LOGGER = logging.getLogger(__name__)
 
 @pytest.fixture
 def report_dir(request):
-    """Create report directory to put test logs."""
-    _report_dir = os.path.join(TEST_REPORTS_DIR, slugify(request.node.name))
-    if not os.path.isdir(_report_dir):
-        os.makedirs(_report_dir)
-    return _report_dir
+    """Path of report directory to put test logs.
+
+    Directory is created lazily by consumers when they write to it.
+    """
+    return os.path.join(TEST_REPORTS_DIR, slugify(request.node.name))
 
 
 @pytest.fixture(scope="session")
 def virtual_display(request):
-    """Run test in virtual X server if env var is defined."""
-    if not VIRTUAL_DISPLAY:
-        return
+    """Run test in virtual X server if env var is defined.
 
-    _virtual_display = xvfbwrapper.Xvfb(width=1920, height=1080)
-    # workaround for memory leak in Xvfb taken from:
-    # http://blog.jeffterrace.com/2012/07/xvfb-memory-leak-workaround.html
-    # and disables X access control
-    args = ["-noreset", "-ac"]
-
-    if hasattr(_virtual_display, 'extra_xvfb_args'):
-        _virtual_display.extra_xvfb_args.extend(args)  # xvfbwrapper>=0.2.8
-    else:
-        _virtual_display.xvfb_cmd.extend(args)
+    X server of worker is launched at pytest configure, fixture waits until
+    it's ready. Headless browsers don't need it.
+    """
+    _virtual_display = getattr(request.config, 'virtual_display', None)
+    if _virtual_display:
+        LOGGER.info('Wait xvfb on display :{}'.format(_virtual_display.number))
+        _virtual_display.wait_ready()
 
-    with Lock(XVFB_LOCK):
-        LOGGER.info('Start xvfb')
-        _virtual_display.start()
 
-    def fin():
-        LOGGER.info('Stop xvfb')
-        _virtual_display.stop()
+class _RootFilter(logging.Filter):
 
-    request.addfinalizer(fin)
+    def filter(self, record):
+        return record.name not in \
+            ('timeit', 'selenium.webdriver.remote.remote_connection')
 
 
 @pytest.yield_fixture
-def logger(report_dir, test_env):
-    """Fixture to put test log in report."""
-    class RootFilter(logging.Filter):
-
-        def filter(self, record):
-            return record.name not in \
-                ('timeit', 'selenium.webdriver.remote.remote_connection')
-
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-    root_handler = logging.FileHandler(
-        os.path.join(report_dir, 'test.log'))
-    root_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(pathname)s#%(lineno)d - %(message)s')
-    root_handler.setFormatter(root_formatter)
-    root_handler.addFilter(RootFilter())
-    root_logger.addHandler(root_handler)
-
-    timeit_logger = logging.getLogger('timeit')
-    timeit_logger.setLevel(logging.DEBUG)
-    timeit_handler = logging.FileHandler(
-        os.path.join(report_dir, 'timeit.log'))
-    timeit_handler.setLevel(logging.DEBUG)
-
-    remote_logger = logging.getLogger(
-        'selenium.webdriver.remote.remote_connection')
-    remote_logger.setLevel(logging.DEBUG)
-    remote_handler = logging.FileHandler(
-        os.path.join(report_dir, 'remote_connection.log'))
-    remote_handler.setLevel(logging.DEBUG)
+def logger(request, report_dir, test_env):
+    """Fixture to put test log in report.
 
+    In "buffer" mode logs are kept in memory and are written to report only
+    if test is failed.
+    """
     formatter = logging.Formatter('%(asctime)s - %(message)s')
+    logs = [
+        ('test.log', logging.getLogger(), logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(pathname)s#%(lineno)d - '
+            '%(message)s'), [_RootFilter()]),
+        ('timeit.log', logging.getLogger('timeit'), formatter, []),
+        ('remote_connection.log', logging.getLogger(
+            'selenium.webdriver.remote.remote_connection'), formatter, []),
+    ]
+    for _, _logger, _, _ in logs:
+        _logger.setLevel(logging.DEBUG)
+
+    if LOG_CAPTURE == 'buffer':
+        capture = LogCapture(LOG_BUFFER_SIZE)
+        for file_name, _logger, _formatter, filters in logs:
+            capture.capture(file_name, _logger, _formatter, filters=filters)
+
+        capture.start()
+        # it's flushed by makereport hook if test is failed
+        request.node.log_capture = capture
+        yield
+        capture.stop()
+        return
 
-    timeit_handler.setFormatter(formatter)
-    timeit_logger.addHandler(timeit_handler)
+    if not os.path.isdir(report_dir):
+        os.makedirs(report_dir)
 
-    remote_handler.setFormatter(formatter)
-    remote_logger.addHandler(remote_handler)
+    handlers = []
+    for file_name, _logger, _formatter, filters in logs:
+        handler = logging.FileHandler(os.path.join(report_dir, file_name))
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(_formatter)
+        for _filter in filters:
+            handler.addFilter(_filter)
+        _logger.addHandler(handler)
+        handlers.append((_logger, handler))
 
     yield
 
-    timeit_logger.handlers.remove(timeit_handler)
-    remote_logger.handlers.remove(remote_handler)
-    root_logger.handlers.remove(root_handler)
+    for _logger, handler in handlers:
+        _logger.removeHandler(handler)
+        handler.close()
 
 
 @pytest.yield_fixture(autouse=True)
-def video_capture(report_dir, logger):
-    """Capture video of test."""
-    recorder = VideoRecorder(report_dir)
+def video_capture(request, report_dir, logger):
+    """Capture video of test.
+
+    In "ring" mode only the last seconds of video are kept and they are
+    saved only if test is failed. Headless browsers have no display to
+    capture, so screenshot is taken on test failure instead.
+    """
+    if HEADLESS or VIDEO_CAPTURE == 'off':
+        yield None
+        return
+
+    if VIDEO_CAPTURE == 'ring':
+        recorder = VideoRecorder(report_dir,
+                                 ring_seconds=VIDEO_RING_SECONDS)
+    else:
+        if not os.path.isdir(report_dir):
+            os.makedirs(report_dir)
+        recorder = VideoRecorder(report_dir)
+
     recorder.start()
     yield recorder
     recorder.stop()
 
+    if VIDEO_CAPTURE == 'ring':
+        if getattr(request.node, 'is_passed', True):
+            recorder.clear()
+        else:
+            recorder.save()
 
-@pytest.yield_fixture(scope='session')
-def test_env(virtual_display):
-    """Fixture to prepare test environment."""
-    _build_test_env()
-    yield
-    _destroy_test_env()
 
+@pytest.yield_fixture(scope='session', autouse=True)
+def timings_sink(request):
+    """Write timings of steps and UI actions of worker to JSONL file.
 
-def _build_test_env():
-    app = Horizon(DASHBOARD_URL)
-    try:
-        auth_steps = AuthSteps(app)
-        auth_steps.login(DEFAULT_ADMIN_NAME, DEFAULT_ADMIN_PASSWD)
-        auth_steps.switch_project(DEFAULT_ADMIN_PROJECT)
+    Unlike test logs, it's kept for passed tests too. If file with
+    webdriver commands budgets of steps is specified, steps exceeding them
+    fail.
+    """
+    if COMMAND_BUDGETS:
+        with open(COMMAND_BUDGETS) as f:
+            profiling.set_budgets(json.load(f))
 
-        projects_steps = ProjectsSteps(app)
-        projects_steps.create_project(ADMIN_PROJECT)
-        projects_steps.create_project(USER_PROJECT)
+    sink = profiling.JsonlSink(os.path.join(
+        TIMINGS_DIR, get_worker_id(request.config) + '.jsonl'))
+    profiling.add_sink(sink)
+    yield sink
+    profiling.remove_sink(sink)
+    sink.close()
 
-        users_steps = UsersSteps(app)
-        users_steps.create_user(ADMIN_NAME, ADMIN_PASSWD, ADMIN_PROJECT,
-                                role='admin')
-        users_steps.create_user(USER_NAME, USER_PASSWD, USER_PROJECT)
 
-        networks_steps = NetworksSteps(app)
-        networks_steps.admin_update_network(INTERNAL_NETWORK_NAME,
-                                            shared=True, check=False)
-        networks_steps.admin_update_network(FLOATING_NETWORK_NAME,
-                                            shared=True, check=False)
+@pytest.yield_fixture(autouse=True)
+def timings(request, timings_sink):
+    """Attribute timings to test."""
+    profiling.set_test(request.node.nodeid)
+    yield
+    profiling.set_test(None)
 
-        auth_steps.logout()
-    finally:
-        app.quit()
 
+@pytest.yield_fixture(scope='session')
+def test_env(horizon_pool):
+    """Fixture to prepare test environment."""
+    projects = [ADMIN_PROJECT, USER_PROJECT]
+    users = [User(ADMIN_NAME, ADMIN_PASSWD, ADMIN_PROJECT, 'admin'),
+             User(USER_NAME, USER_PASSWD, USER_PROJECT, None)]
 
-@contextlib.contextmanager
-def _try_delete(resource_name):
-    try:
+    with _provisioner(horizon_pool) as provisioner:
+        provisioner.build(projects, users,
+                          [INTERNAL_NETWORK_NAME, FLOATING_NETWORK_NAME])
         yield
-    except Exception:
-        LOGGER.error("Can't delete resource {!r}".format(resource_name))
-
-
-def _destroy_test_env():
-    app = Horizon(DASHBOARD_URL)
-    try:
-        auth_steps = AuthSteps(app)
-        auth_steps.login(DEFAULT_ADMIN_NAME, DEFAULT_ADMIN_PASSWD)
-        auth_steps.switch_project(DEFAULT_ADMIN_PROJECT)
-
-        users_steps = UsersSteps(app)
-        with _try_delete(USER_NAME):
-            users_steps.filter_users(USER_NAME)
-            users_steps.delete_user(USER_NAME)
-        with _try_delete(ADMIN_NAME):
-            users_steps.filter_users(ADMIN_NAME)
-            users_steps.delete_user(ADMIN_NAME)
-
-        projects_steps = ProjectsSteps(app)
-        with _try_delete(USER_PROJECT):
-            projects_steps.filter_projects(USER_PROJECT)
-            projects_steps.delete_project(USER_PROJECT)
-        with _try_delete(ADMIN_PROJECT):
-            projects_steps.filter_projects(ADMIN_PROJECT)
-            projects_steps.delete_project(ADMIN_PROJECT)
-
-        auth_steps.logout()
-    finally:
-        app.quit()
+        provisioner.destroy(projects[::-1], users[::-1])
+
+
+@contextlib.contextmanager
+def _provisioner(horizon_pool):
+    credentials = (DEFAULT_ADMIN_NAME, DEFAULT_ADMIN_PASSWD,
+                   DEFAULT_ADMIN_PROJECT)
+
+    if PROVISIONING == 'ui':
+        yield UiProvisioner(horizon_pool, *credentials)
+
+    elif PROVISIONING == 'api':
+        yield ApiProvisioner(OS_AUTH_URL, *credentials)
+
+    elif PROVISIONING == 'stub':
+        stub = StubServer(networks=[INTERNAL_NETWORK_NAME,
+                                    FLOATING_NETWORK_NAME])
+        stub.start()
+        try:
+            yield ApiProvisioner(stub.url, *credentials)
+        finally:
+            stub.stop()
+
+    else:
+        raise ValueError(
+            "Unknown provisioning backend {!r}".format(PROVISIONING))
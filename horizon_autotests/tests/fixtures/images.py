@@ -38,7 +38,7 @@ def images_steps(login, horizon):
 
 
 @pytest.yield_fixture
-def create_images(images_steps, horizon):
+def create_images(images_steps):
     """Fixture to create images with options.
 
     Can be called several times during test.
@@ -46,20 +46,10 @@ def create_images(images_steps, horizon):
     images = []
 
     def _create_images(*image_names):
-        _images = []
-
-        for image_name in image_names:
-            images_steps.create_image(image_name, check=False)
-            images_steps.close_notification('success')
-
-            image = AttrDict(name=image_name)
-            images.append(image)
-            _images.append(image)
-
-        for image_name in image_names:
-            horizon.page_images.table_images.row(
-                name=image_name).wait_for_status('Active')
+        _images = [AttrDict(name=image_name) for image_name in image_names]
+        images.extend(_images)
 
+        images_steps.create_images(image_names)
         return _images
 
     yield _create_images
@@ -91,8 +81,20 @@ def create_image(images_steps):
         images_steps.delete_image(image.name)
 
 
-@pytest.fixture
-def image(create_image):
-    """Fixture to create image with default options before test."""
-    image_name = next(generate_ids('image', length=20))
-    return create_image(image_name)
+@pytest.yield_fixture
+def image(request, shared_resources, images_steps):
+    """Fixture to create image with default options before test.
+
+    Image is shared between neighbour tests marked as read-only for it.
+    """
+    def _create_image():
+        image_name = next(generate_ids('image', length=20))
+        images_steps.create_image(image_name)
+        return AttrDict(name=image_name)
+
+    def _delete_image(image, steps):
+        steps.delete_image(image.name)
+
+    for image in shared_resources.provide(request, images_steps,
+                                          _create_image, _delete_image):
+        yield image
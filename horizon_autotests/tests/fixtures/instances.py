@@ -62,14 +62,21 @@ def instances_steps(login, horizon):
 
 
 @pytest.yield_fixture
-def instance(instances_steps):
-    """Create instance."""
-    instance_name = next(generate_ids('instance'))
-
-    instances_steps.create_instance(
-        instance_name, network_name=INTERNAL_NETWORK_NAME)
-    instance = AttrDict(name=instance_name)
-
-    yield instance
-
-    instances_steps.delete_instance(instance.name)
+def instance(request, shared_resources, instances_steps):
+    """Create instance.
+
+    Instance is shared between neighbour tests marked as read-only for it.
+    """
+    def _create_instance():
+        instance_name = next(generate_ids('instance'))
+        instances_steps.create_instance(
+            instance_name, network_name=INTERNAL_NETWORK_NAME)
+        return AttrDict(name=instance_name)
+
+    def _delete_instance(instance, steps):
+        steps.delete_instance(instance.name)
+
+    for instance in shared_resources.provide(request, instances_steps,
+                                             _create_instance,
+                                             _delete_instance):
+        yield instance
@@ -52,21 +52,10 @@ def create_volumes(volumes_steps):
     volumes = []
 
     def _create_volumes(volume_names):
-        _volumes = []
-
-        for volume_name in volume_names:
-            volumes_steps.create_volume(volume_name, check=False)
-            volumes_steps.close_notification('info')
-            volume = AttrDict(name=volume_name)
-
-            volumes.append(volume)
-            _volumes.append(volume)
-
-        tab_volumes = volumes_steps.tab_volumes()
-        for volume_name in volume_names:
-            tab_volumes.table_volumes.row(
-                name=volume_name).wait_for_status('Available')
+        _volumes = [AttrDict(name=volume_name) for volume_name in volume_names]
+        volumes.extend(_volumes)
 
+        volumes_steps.create_volumes(volume_names)
         return _volumes
 
     yield _create_volumes
@@ -95,11 +84,23 @@ def create_volume(volumes_steps):
         volumes_steps.delete_volume(volume.name)
 
 
-@pytest.fixture
-def volume(create_volume):
-    """Fixture to create volume with default options before test."""
-    volume_name = next(generate_ids('volume'))
-    return create_volume(volume_name)
+@pytest.yield_fixture
+def volume(request, shared_resources, volumes_steps):
+    """Fixture to create volume with default options before test.
+
+    Volume is shared between neighbour tests marked as read-only for it.
+    """
+    def _create_volume():
+        volume_name = next(generate_ids('volume'))
+        volumes_steps.create_volume(volume_name)
+        return AttrDict(name=volume_name)
+
+    def _delete_volume(volume, steps):
+        steps.delete_volume(volume.name)
+
+    for volume in shared_resources.provide(request, volumes_steps,
+                                           _create_volume, _delete_volume):
+        yield volume
 
 
 @pytest.fixture
@@ -17,9 +17,14 @@ Auth tests.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import pytest
 
 
 @pytest.mark.usefixtures('any_one')
-def test_login(login):
+def test_login(auth_steps):
     """Verify that one can login and logout."""
+    auth_steps.login(os.environ['OS_LOGIN'], os.environ['OS_PASSWD'])
+    auth_steps.switch_project(os.environ['OS_PROJECT'])
+    auth_steps.logout()
@@ -18,7 +18,8 @@ Flavor tests.
 # limitations under the License.
 
 import pytest
-from waiting import wait
+
+from horizon_autotests.waits import wait
 
 from .fixtures._config import (ADMIN_NAME,
                                ADMIN_PASSWD,
@@ -62,8 +63,7 @@ class TestAdminOnly(object):
         with horizon.page_instances.form_launch_instance as form:
             form.item_flavor.click()
 
-            wait(lambda: form.tab_flavor.table_available_flavors.rows,
-                 timeout_seconds=30, sleep_seconds=0.1)
+            wait(lambda: form.tab_flavor.table_available_flavors.rows, 30)
 
             for row in form.tab_flavor.table_available_flavors.rows:
                 assert row.cell('name').value != flavor.name
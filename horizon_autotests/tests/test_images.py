@@ -18,7 +18,8 @@ Image tests.
 # limitations under the License.
 
 import pytest
-from waiting import wait
+
+from horizon_autotests.waits import wait
 
 from .fixtures._config import INTERNAL_NETWORK_NAME
 from .fixtures._utils import generate_ids, generate_files, get_size
@@ -41,6 +42,7 @@ class TestAnyOne(object):
         image_file = next(generate_files(postfix='.qcow2'))
         create_image(image_name, image_file)
 
+    @pytest.mark.read_only('image')
     def test_view_image(self, image, images_steps):
         """Verify that user can view image info."""
         images_steps.view_image(image.name)
@@ -107,6 +109,7 @@ class TestAnyOne(object):
         with image.put(name=new_image_name):
             images_steps.update_image(image.name, new_image_name)
 
+    @pytest.mark.read_only('image')
     def test_create_volume_from_image(self, image, images_steps,
                                       volumes_steps):
         """Verify that user can create volume from image."""
@@ -132,7 +135,7 @@ class TestAnyOne(object):
             with page.form_launch_instance as form:
                 form.item_flavor.click()
                 wait(lambda: form.tab_flavor.table_available_flavors.rows,
-                     timeout_seconds=30, sleep_seconds=0.1)
+                     30)
 
                 for row in form.tab_flavor.table_available_flavors.rows:
 
@@ -156,6 +159,7 @@ class TestAnyOne(object):
             page.button_public_images.click()
             page.table_images.row(name='TestVM').wait_for_presence()
 
+    @pytest.mark.read_only('image')
     def test_launch_instance_from_image(self, image, images_steps,
                                         instances_steps):
         """Verify that user can launch instance from image."""
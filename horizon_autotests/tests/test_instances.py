@@ -32,11 +32,13 @@ class TestAnyOne(object):
         instance_name = generate_ids('instance').next()
         create_instance(instance_name, count=instances_count)
 
+    @pytest.mark.read_only('instance')
     def test_lock_instance(self, instance, instances_steps):
         """Verify that user can lock instance."""
         instances_steps.lock_instance(instance.name)
         instances_steps.unlock_instance(instance.name)
 
+    @pytest.mark.read_only('instance')
     def test_view_instance(self, instance, instances_steps):
         """Verify that user can view instance details."""
         instances_steps.view_instance(instance.name)
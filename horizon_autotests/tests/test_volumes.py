@@ -83,6 +83,7 @@ class TestAnyOne(object):
         assert tab_volumes.table_volumes.link_next.is_present
         assert not tab_volumes.table_volumes.link_prev.is_present
 
+    @pytest.mark.read_only('volume')
     def test_view_volume(self, volume, volumes_steps):
         """Verify that user can view volume info."""
         volumes_steps.view_volume(volume.name)
@@ -93,6 +94,7 @@ class TestAnyOne(object):
         create_volume(volume_name, volume_type=None)
         volumes_steps.change_volume_type(volume_name)
 
+    @pytest.mark.read_only('volume')
     def test_upload_volume_to_image(self, volume, images_steps, volumes_steps):
         """Verify that user can upload volume to image."""
         image_name = next(generate_ids('image', length=20))
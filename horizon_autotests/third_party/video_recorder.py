@@ -1,7 +1,11 @@
+import glob
 import logging
+import math
 import os
+import shutil
 import signal
 import subprocess
+import tempfile
 from threading import Thread
 import time
 
@@ -10,20 +14,41 @@ LOGGER = logging.getLogger(__name__)
 
 class VideoRecorder(object):
 
-    def __init__(self, folder, frame_rate=30):
+    def __init__(self, folder, frame_rate=30, ring_seconds=None,
+                 segment_seconds=5):
         self.is_launched = False
         self.file_path = os.path.join(folder, 'video.mp4')
+        self.segments_dir = None
         # avconv -f x11grab -r 15 -s 1920x1080 -i :0.0 -codec libx264 out.mp4
         self._cmd = ['avconv', '-f', 'x11grab', '-r', str(frame_rate),
                      '-s', '{}x{}'.format(1920, 1080),
                      '-i', os.environ['DISPLAY'],
-                     '-codec', 'libx264', self.file_path]
+                     '-codec', 'libx264']
+
+        # in ring mode video is recorded to rolling segments in temporary
+        # folder and only the last ring_seconds are kept, save() stitches
+        # them to video file, so report folder isn't created for passed test
+        if ring_seconds:
+            self.segments_dir = tempfile.mkdtemp(prefix='video_segments_')
+            segments_count = int(math.ceil(
+                float(ring_seconds) / segment_seconds)) + 1
+            self._cmd += ['-preset', 'ultrafast',
+                          '-f', 'segment',
+                          '-segment_time', str(segment_seconds),
+                          '-segment_wrap', str(segments_count),
+                          '-reset_timestamps', '1',
+                          os.path.join(self.segments_dir, 'segment_%03d.mp4')]
+        else:
+            self._cmd.append(self.file_path)
 
     def start(self):
         if self.is_launched:
             LOGGER.warn('Video recording is running already')
             return
 
+        if self.segments_dir and not os.path.isdir(self.segments_dir):
+            os.makedirs(self.segments_dir)
+
         fnull = open(os.devnull, 'w')
         LOGGER.info('Record video via {!r}'.format(' '.join(self._cmd)))
         self._popen = subprocess.Popen(self._cmd, stdout=fnull, stderr=fnull)
@@ -54,11 +79,48 @@ class VideoRecorder(object):
         t.join()
         self.is_launched = False
 
+    def save(self):
+        if not self.segments_dir:
+            return
+
+        if self.is_launched:
+            LOGGER.error("Video recording is running still")
+            return
+
+        segments = sorted(
+            glob.glob(os.path.join(self.segments_dir, 'segment_*.mp4')),
+            key=os.path.getmtime)
+        if not segments:
+            LOGGER.warn("There are no video segments to save")
+            shutil.rmtree(self.segments_dir)
+            return
+
+        folder = os.path.dirname(self.file_path)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        list_path = os.path.join(self.segments_dir, 'segments.txt')
+        with open(list_path, 'w') as f:
+            for segment in segments:
+                f.write("file '{}'\n".format(os.path.abspath(segment)))
+
+        cmd = ['avconv', '-y', '-f', 'concat', '-safe', '0', '-i', list_path,
+               '-codec', 'copy', self.file_path]
+        LOGGER.info('Stitch video via {!r}'.format(' '.join(cmd)))
+        with open(os.devnull, 'w') as fnull:
+            subprocess.call(cmd, stdout=fnull, stderr=fnull)
+
+        shutil.rmtree(self.segments_dir)
+
     def clear(self):
         if self.is_launched:
             LOGGER.error("Video recording is running still")
             return
 
+        if self.segments_dir and os.path.isdir(self.segments_dir):
+            shutil.rmtree(self.segments_dir)
+            return
+
         if not os.path.isfile(self.file_path):
             LOGGER.warn("{!r} is absent already".format(self.file_path))
             return
@@ -0,0 +1,160 @@
+"""
+Tests scheduling tests.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pytest
+from xdist.scheduler import load
+
+from horizon_autotests.tests.fixtures._scheduling import (
+    DurationsHistory,
+    estimate_durations,
+    LongestFirstScheduling,
+    predict_makespan)
+
+
+class Item(object):
+    """Collected test item."""
+
+    def __init__(self, nodeid, *fixturenames):
+        """Constructor."""
+        self.nodeid = nodeid
+        self.fixturenames = ('horizon',) + fixturenames
+
+
+class Config(object):
+    """Pytest config without options."""
+
+    def getoption(self, name):
+        """Get option value."""
+        return None
+
+
+class Node(object):
+    """Xdist worker which records sent tests."""
+
+    def __init__(self, name):
+        """Constructor."""
+        self.gateway = type('Gateway', (), {'id': name})
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        """Record sent tests."""
+        self.sent.append(list(indices))
+
+    def shutdown(self):
+        """Shutdown worker."""
+        self.shutting_down = True
+
+
+def test_history_moving_average(tmpdir):
+    """Verify that history keeps moving average of durations."""
+    history = DurationsHistory(str(tmpdir.join('durations.json')))
+    history.update({'a': 2})
+    history.update({'a': 4, 'b': 1.23456})
+
+    assert history.durations == {'a': 3, 'b': 1.235}
+
+
+def test_history_is_saved_atomically(tmpdir):
+    """Verify that history is saved to new folder without temporary file."""
+    path = str(tmpdir.join('cache', 'durations.json'))
+    history = DurationsHistory(path)
+    history.update({'a': 2})
+    history.save()
+
+    assert os.listdir(os.path.dirname(path)) == ['durations.json']
+    with open(path) as f:
+        assert json.load(f) == {'a': 2}
+    assert DurationsHistory(path).durations == {'a': 2}
+
+
+def test_known_tests_are_estimated_by_history():
+    """Verify that test with history is estimated by its duration."""
+    items = [Item('a', 'volume'), Item('b', 'image')]
+
+    assert estimate_durations(items, {'a': 5, 'b': 7}) == {'a': 5, 'b': 7}
+
+
+def test_unknown_test_is_estimated_by_fixtures():
+    """Verify that unknown test gets the longest mean of its fixtures.
+
+    Fixtures used by all tests aren't considered.
+    """
+    items = [Item('a', 'volume'), Item('b', 'volume', 'instance'),
+             Item('c', 'instance'), Item('new', 'volume', 'instance')]
+    estimates = estimate_durations(items, {'a': 2, 'b': 4, 'c': 10})
+
+    # volume: (2 + 4) / 2, instance: (4 + 10) / 2
+    assert estimates['new'] == pytest.approx(7)
+
+
+def test_unknown_test_without_shared_fixtures_gets_median():
+    """Verify that unknown test without known fixtures gets median."""
+    items = [Item('a', 'volume'), Item('b', 'volume'), Item('c', 'volume'),
+             Item('new', 'router')]
+    estimates = estimate_durations(items, {'a': 1, 'b': 3, 'c': 9})
+
+    assert estimates['new'] == 3
+
+
+def test_default_duration_without_history():
+    """Verify that tests get default duration without history."""
+    estimates = estimate_durations([Item('a'), Item('b', 'volume')], {})
+
+    assert set(estimates.values()) == {1.0}
+
+
+@pytest.mark.parametrize('durations, workers, makespan', [
+    ([5, 4, 3, 3, 3], 2, 10),
+    ([5, 4, 3, 3, 3], 1, 18),
+    ([5, 4, 3, 3, 3], 0, 18),
+    ([2, 7, 1], 3, 7),
+    ([], 2, 0),
+])
+def test_predict_makespan(durations, workers, makespan):
+    """Verify that makespan of longest-first scheduling is predicted."""
+    assert predict_makespan(durations, workers) == makespan
+
+
+def test_scheduler_hands_out_tests_one_by_one(monkeypatch):
+    """Verify that free worker gets the next test in collection order.
+
+    Tests of xdist group are handed out together.
+    """
+    monkeypatch.setattr(load, 'parse_tx_spec_config', lambda config: [1, 2])
+    scheduler = LongestFirstScheduling(Config())
+    gw0, gw1 = Node('gw0'), Node('gw1')
+    collection = ['t0', 't1', 't2@g', 't3@g', 't4@g', 't5', 't6']
+    for node in (gw0, gw1):
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+
+    scheduler.schedule()
+    assert gw0.sent == [[0], [2, 3, 4]]
+    assert gw1.sent == [[1], [5]]
+
+    scheduler.mark_test_complete(gw1, 1)
+    assert gw1.sent == [[1], [5], [6]]
+    assert not gw1.shutting_down
+
+    scheduler.mark_test_complete(gw0, 0)
+    assert gw0.shutting_down
@@ -0,0 +1,164 @@
+"""
+Wait engine tests.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from horizon_autotests import profiling, waits
+from horizon_autotests.waits import (DeadlineExpired, get_remaining,
+                                     set_deadline, Strategy, TimeoutExpired,
+                                     wait)
+
+
+class FakeClock(object):
+    """Clock which is moved by sleeps only."""
+
+    def __init__(self):
+        """Constructor."""
+        self.now = 1000.0
+
+    def time(self):
+        """Current time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Move clock."""
+        self.now += seconds
+
+
+class Recorder(object):
+    """Profiling sink keeping events."""
+
+    def __init__(self):
+        """Constructor."""
+        self.events = []
+
+    def write(self, event):
+        """Keep event."""
+        self.events.append(event)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock of wait engine."""
+    clock = FakeClock()
+    monkeypatch.setattr(waits, 'time', clock)
+    yield clock
+    set_deadline(None)
+
+
+@pytest.fixture
+def recorder():
+    """Wait events emitted to profiling."""
+    recorder = Recorder()
+    profiling.add_sink(recorder)
+    yield recorder
+    profiling.remove_sink(recorder)
+
+
+def polls(results):
+    """Predicate returning results one by one."""
+    results = iter(results)
+    return lambda: next(results)
+
+
+def test_wait_returns_predicate_result(clock):
+    """Verify that wait returns the first true result of predicate."""
+    assert wait(polls([None, 0, 'ok']), 10) == 'ok'
+
+
+def test_wait_raises_timeout(clock):
+    """Verify that wait raises timeout if predicate isn't true."""
+    with pytest.raises(TimeoutExpired) as e:
+        wait(lambda: False, 5)
+
+    assert not isinstance(e.value, DeadlineExpired)
+    assert clock.now == pytest.approx(1005)
+
+
+def test_deadline_clamps_timeout(clock):
+    """Verify that timeout is reduced to time before deadline."""
+    set_deadline(2)
+
+    assert get_remaining(10) == pytest.approx(2)
+    assert get_remaining(1) == pytest.approx(1)
+
+    with pytest.raises(DeadlineExpired):
+        wait(lambda: False, 10)
+    assert clock.now == pytest.approx(1002)
+    assert get_remaining(10) == 0
+
+
+def test_removed_deadline_doesnt_limit_wait(clock):
+    """Verify that wait isn't limited after deadline is removed."""
+    set_deadline(1)
+    set_deadline(None)
+
+    assert get_remaining(10) == 10
+    with pytest.raises(TimeoutExpired) as e:
+        wait(lambda: False, 3)
+    assert not isinstance(e.value, DeadlineExpired)
+
+
+def test_backoff_is_capped():
+    """Verify that interval grows by factor up to max interval."""
+    intervals = Strategy(0.1, max_interval=0.5, factor=2).intervals()
+
+    assert [next(intervals) for _ in range(6)] == pytest.approx(
+        [0.1, 0.2, 0.4, 0.5, 0.5, 0.5])
+
+
+def test_jitter_keeps_interval_in_bounds():
+    """Verify that jitter deviates interval by its relative value."""
+    intervals = Strategy(1, jitter=0.2).intervals()
+
+    for _ in range(100):
+        assert 0.8 <= next(intervals) <= 1.2
+
+
+def test_wasted_time_is_last_interval(clock, recorder):
+    """Verify that wasted time of passed wait is the last interval."""
+    strategy = Strategy(1, max_interval=5, factor=2)
+    wait(polls([False, False, True]), 10, strategy=strategy, name='site')
+
+    event, = recorder.events
+    assert event['kind'] == 'Wait'
+    assert event['name'] == 'site'
+    assert event['polls'] == 3
+    assert event['passed']
+    assert event['duration'] == pytest.approx(3)
+    assert event['wasted'] == pytest.approx(2)
+
+
+def test_failed_wait_wastes_nothing(clock, recorder):
+    """Verify that failed wait has no wasted time."""
+    with pytest.raises(TimeoutExpired):
+        wait(lambda: False, 3, strategy=Strategy(1))
+
+    event, = recorder.events
+    assert not event['passed']
+    assert event['polls'] == 4
+    assert event['wasted'] == 0
+
+
+def test_wait_name_is_caller(clock, recorder):
+    """Verify that wait is named by calling function by default."""
+    wait(lambda: True, 1)
+
+    assert recorder.events[0]['name'] == \
+        'test_waits:test_wait_name_is_caller'
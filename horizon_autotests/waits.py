@@ -0,0 +1,151 @@
+"""
+Wait engine shared by steps and UI components.
+
+@author: schipiga@mirantis.com
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+import sys
+import time
+
+from waiting.exceptions import TimeoutExpired
+
+from horizon_autotests.profiling import record_wait
+
+_deadline = {'time': None}
+
+
+class DeadlineExpired(TimeoutExpired):
+    """Wait is interrupted, because time of test is over."""
+
+
+class Strategy(object):
+    """Intervals between polls of condition.
+
+    Interval grows from initial one by factor up to max interval. Jitter
+    spreads polls of parallel tests, so they don't hit server at once.
+    """
+
+    def __init__(self, interval, max_interval=None, factor=1, jitter=0):
+        """Constructor.
+
+        Arguments:
+            - interval: float, seconds before the second poll.
+            - max_interval: float, max seconds between polls.
+            - factor: float, multiplier of interval after each poll.
+            - jitter: float, max relative deviation of interval.
+        """
+        self.interval = interval
+        self.max_interval = max_interval or interval
+        self.factor = factor
+        self.jitter = jitter
+
+    def intervals(self):
+        """Generate intervals between polls."""
+        interval = self.interval
+        while True:
+            yield interval * (1 + random.uniform(-self.jitter, self.jitter))
+            interval = min(interval * self.factor, self.max_interval)
+
+
+# UI reacts in a second usually, so it's polled tightly, but polling is
+# slowed down if UI hangs.
+UI_TRANSITION = Strategy(0.1, max_interval=0.5, factor=1.2)
+# Cloud operations, like instance boot or volume migration, last from
+# seconds to minutes, so polling backs off quickly.
+LONG_OPERATION = Strategy(0.5, max_interval=10, factor=1.5, jitter=0.2)
+
+
+def set_deadline(seconds):
+    """Set time which all waits of test must fit in.
+
+    Arguments:
+        - seconds: float, seconds since now or None to remove deadline.
+    """
+    _deadline['time'] = None if seconds is None else time.time() + seconds
+
+
+def get_remaining(timeout):
+    """Get timeout reduced to time remaining before test deadline."""
+    if _deadline['time'] is None:
+        return timeout
+    return max(min(timeout, _deadline['time'] - time.time()), 0)
+
+
+def wait(predicate, timeout, strategy=UI_TRANSITION, name=None):
+    """Wait until predicate returns true value.
+
+    Wait is emitted to profiling sinks as event of kind "Wait" with count of
+    polls, seconds spent in polls and wasted seconds, which are the last
+    interval between polls: condition could become true at its start.
+
+    Arguments:
+        - predicate: callable without arguments.
+        - timeout: float, seconds to wait.
+        - strategy: Strategy of polls intervals.
+        - name: string, name of wait site in metrics, name of calling
+          function by default.
+
+    Returns:
+        - true value returned by predicate.
+
+    Raises:
+        - TimeoutExpired: if predicate isn't true during timeout.
+        - DeadlineExpired: if predicate isn't true before test deadline.
+    """
+    name = name or _get_caller_name()
+    start = time.time()
+    limit = start + timeout
+    deadline = _deadline['time']
+    by_deadline = deadline is not None and deadline < limit
+    if by_deadline:
+        limit = deadline
+
+    intervals = strategy.intervals()
+    polls = 0
+    poll_time = 0
+    interval = 0
+    passed = False
+    try:
+        while True:
+            poll_start = time.time()
+            result = predicate()
+            polls += 1
+            poll_time += time.time() - poll_start
+
+            if result:
+                passed = True
+                return result
+
+            remaining = limit - time.time()
+            if remaining <= 0:
+                if by_deadline:
+                    raise DeadlineExpired(timeout, name + ' before deadline')
+                raise TimeoutExpired(timeout, name)
+
+            interval = min(next(intervals), remaining)
+            time.sleep(interval)
+    finally:
+        record_wait(name, start, time.time() - start, polls, poll_time,
+                    interval if passed else 0, passed)
+
+
+def _get_caller_name():
+    frame = sys._getframe(2)
+    return '{}:{}'.format(
+        os.path.splitext(os.path.basename(frame.f_code.co_filename))[0],
+        frame.f_code.co_name)